@@ -130,6 +130,10 @@ rst_epilog = r"""
 
 .. _python-Levenshtein: https://pypi.org/project/python-Levenshtein
 
+.. |rapidfuzz| replace:: ``rapidfuzz``
+
+.. _rapidfuzz: https://pypi.org/project/rapidfuzz
+
 .. |br| raw:: html
 
     <br />
@@ -172,16 +176,22 @@ rst_epilog = r"""
 
 .. |cli:INFILE| replace:: :attr:`~sphobjinv.cli.parser.PrsConst.INFILE`
 
+.. |cli:LIMIT| replace:: :attr:`~sphobjinv.cli.parser.PrsConst.LIMIT`
+
 .. |cli:MODE| replace:: :attr:`~sphobjinv.cli.parser.PrsConst.MODE`
 
 .. |cli:OUTFILE| replace:: :attr:`~sphobjinv.cli.parser.PrsConst.OUTFILE`
 
 .. |cli:OVERWRITE| replace:: :attr:`~sphobjinv.cli.parser.PrsConst.OVERWRITE`
 
+.. |cli:QUERIES| replace:: :attr:`~sphobjinv.cli.parser.PrsConst.QUERIES`
+
 .. |cli:QUIET| replace:: :attr:`~sphobjinv.cli.parser.PrsConst.QUIET`
 
 .. |cli:SCORE| replace:: :attr:`~sphobjinv.cli.parser.PrsConst.SCORE`
 
+.. |cli:SCORER| replace:: :attr:`~sphobjinv.cli.parser.PrsConst.SCORER`
+
 .. |cli:SUBPARSER_NAME| replace:: :attr:`~sphobjinv.cli.parser.PrsConst.SUBPARSER_NAME`
 
 .. |cli:SUGGEST_CONFIRM_LENGTH| replace:: :attr:`~sphobjinv.cli.parser.PrsConst.SUGGEST_CONFIRM_LENGTH`
@@ -26,12 +26,31 @@ Sphinx |objects.inv| files.
 """
 
 
+from sphobjinv.binary import decode as decode_binary, encode as encode_binary
+from sphobjinv.cache import InventoryCache
 from sphobjinv.data import DataFields, DataObjBytes, DataObjStr
 from sphobjinv.enum import HeaderFields, SourceTypes
 from sphobjinv.error import SphobjinvError, VersionError
-from sphobjinv.fileops import readbytes, readjson, urlwalk, writebytes, writejson
+from sphobjinv.fileops import (
+    mapbytes,
+    readbytes,
+    readjson,
+    sniffbytes,
+    urlwalk,
+    writebytes,
+    writejson,
+)
 from sphobjinv.inventory import Inventory
+from sphobjinv.lookup import InventoryIndex, ObjectsIndex, PrefixIndex, UriIndex
+from sphobjinv.objects import LazyObjects, ObjectList
+from sphobjinv.parse import (
+    data_line_offsets,
+    iter_data_lines,
+    parse_data_line,
+    parse_data_line_at,
+)
 from sphobjinv.re import p_data, pb_comments, pb_data, pb_project, pb_version
 from sphobjinv.schema import json_schema
+from sphobjinv.table import InventoryTable
 from sphobjinv.version import __version__
-from sphobjinv.zlib import compress, decompress
+from sphobjinv.zlib import compress, decompress, decompress_blocks, decompress_lines
@@ -0,0 +1,330 @@
+r"""*Compact binary serialization of* |Inventory| *contents*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (bskinn@alum.mit.edu)
+
+**File Created**
+    17 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2022
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/latest
+
+**License**
+    The MIT License; see |license_txt|_ for full license terms
+
+The binary format is laid out as follows. All counts and lengths are
+unsigned LEB128 varints, and all index arrays are little-endian.
+
+#. :data:`MAGIC`, followed by the format version
+   (currently :data:`FORMAT_VERSION`)
+
+#. Header: the length and UTF-8 bytes of the project name,
+   then of the project version
+
+#. String table: the number of distinct strings, then the length and
+   UTF-8 bytes of those strings joined by newlines (which cannot appear
+   in inventory data). Every name, priority, URI, and display name, and
+   each domain and role, is stored once here, and referred to elsewhere
+   by its index.
+
+#. Index widths: one byte each giving the width (1, 2 or 4 bytes)
+   of references into the string table, and into the domain/role
+   dictionary
+
+#. Domain/role dictionary: the number of distinct domain/role pairs,
+   then a string table reference to the domain and role of each
+
+#. Objects: the number of objects, then one array of references
+   for each of the name (string table), domain/role pair (dictionary),
+   priority, URI, and display name (string table) of every object
+
+Each index array uses the narrowest fixed width that can hold its largest
+reference, rather than a varint per element, so that arrays can be
+decoded in a single step by :mod:`array`.
+
+**Members**
+
+"""
+
+import sys
+from array import array
+
+from sphobjinv.data import DataObjStr
+from sphobjinv.error import VersionError
+
+
+#: Leading bytes identifying a binary inventory. As for PNG, the
+#: non-ASCII first byte and the embedded CR/LF pair and EOF character
+#: detect mangling by text-mode transfers.
+MAGIC = b"\x89SOI\r\n\x1a\n"
+
+#: Version of the binary format written by :func:`encode`.
+FORMAT_VERSION = 1
+
+# array typecodes for each supported index width
+_TYPECODES = {1: "B", 2: "H", 4: "I"}
+
+
+def _width(n_values):
+    """Return the narrowest index width able to refer to `n_values` items."""
+    return next(w for w in (1, 2, 4) if n_values <= 1 << (8 * w))
+
+
+def _varint(n):
+    """Encode a non-negative |int| as an LEB128 varint."""
+    out = bytearray()
+    while True:
+        byte = n & 0x7F
+        n >>= 7
+        if n:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _index_bytes(refs, width):
+    """Pack a sequence of references into little-endian bytes."""
+    arr = array(_TYPECODES[width], refs)
+    if sys.byteorder == "big":  # pragma: no cover
+        arr.byteswap()
+
+    return arr.tobytes()
+
+
+class _Reader:
+    """Cursor over the bytes of a binary inventory."""
+
+    def __init__(self, b):
+        """Initialize at the start of `b`."""
+        self.b = b
+        self.pos = 0
+
+    def take(self, n):
+        """Return the next `n` bytes."""
+        start = self.pos
+        end = self.pos = start + n
+        if end > len(self.b):
+            raise ValueError("Truncated binary inventory")
+
+        return self.b[start:end]
+
+    def varint(self):
+        """Decode the next LEB128 varint."""
+        n = shift = 0
+        while True:
+            byte = self.take(1)[0]
+            n |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return n
+            shift += 7
+
+    def text(self):
+        """Decode the next length-prefixed UTF-8 |str|."""
+        return self.take(self.varint()).decode("utf-8")
+
+    def indices(self, count, width):
+        """Decode the next array of `count` references of `width` bytes."""
+        if width not in _TYPECODES:
+            raise ValueError("Invalid index width in binary inventory")
+
+        arr = array(_TYPECODES[width])
+        arr.frombytes(self.take(count * width))
+        if sys.byteorder == "big":  # pragma: no cover
+            arr.byteswap()
+
+        return arr
+
+
+def encode(inv, *, expand=False, contract=False):
+    r"""Serialize an |Inventory| to the binary format.
+
+    Calling with both `expand` and `contract` as |True| is invalid.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    inv
+
+        |Inventory| -- Inventory to be serialized
+
+    expand
+
+        |bool| *(optional)* -- Store any
+        :data:`~sphobjinv.data.SuperDataObj.uri` or
+        :data:`~sphobjinv.data.SuperDataObj.dispname`
+        abbreviations expanded
+
+    contract
+
+        |bool| *(optional)* -- Store abbreviated
+        :data:`~sphobjinv.data.SuperDataObj.uri` and
+        :data:`~sphobjinv.data.SuperDataObj.dispname` values
+
+    Returns
+    -------
+    b
+
+        |bytes| -- Binary inventory
+
+    Raises
+    ------
+    ValueError
+
+        If both `expand` and `contract` are |True|, or if any
+        data field contains a newline
+
+    """
+    strings = {}
+    pairs = {}
+
+    def ref(s):
+        return strings.setdefault(s, len(strings))
+
+    if expand or contract:
+        # Rely on SuperDataObj to proof expand/contract args
+        objs = [
+            DataObjStr(**obj.json_dict(expand=expand, contract=contract))
+            for obj in inv.objects
+        ]
+    else:
+        objs = [obj.as_str for obj in inv.objects]
+
+    names = [ref(o.name) for o in objs]
+    dom_roles = [
+        pairs.setdefault((ref(o.domain), ref(o.role)), len(pairs)) for o in objs
+    ]
+    priorities = [ref(o.priority) for o in objs]
+    uris = [ref(o.uri) for o in objs]
+    dispnames = [ref(o.dispname) for o in objs]
+
+    table = "\n".join(strings)
+    if table.count("\n") != max(len(strings) - 1, 0):
+        raise ValueError("Inventory data fields cannot contain newlines")
+    b_table = table.encode("utf-8")
+
+    w_str = _width(len(strings))
+    w_pair = _width(len(pairs))
+
+    def text(s):
+        b_s = s.encode("utf-8")
+        return _varint(len(b_s)) + b_s
+
+    return b"".join(
+        (
+            MAGIC,
+            _varint(FORMAT_VERSION),
+            text(inv.project),
+            text(inv.version),
+            _varint(len(strings)),
+            _varint(len(b_table)),
+            b_table,
+            bytes((w_str, w_pair)),
+            _varint(len(pairs)),
+            _index_bytes((r for pair in pairs for r in pair), w_str),
+            _varint(len(objs)),
+            _index_bytes(names, w_str),
+            _index_bytes(dom_roles, w_pair),
+            _index_bytes(priorities, w_str),
+            _index_bytes(uris, w_str),
+            _index_bytes(dispnames, w_str),
+        )
+    )
+
+
+def decode(b):
+    r"""Deserialize the contents of a binary inventory.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    b
+
+        |bytes| -- Binary inventory, as generated by :func:`encode`
+
+    Returns
+    -------
+    project
+
+        |str| -- Project name
+
+    version
+
+        |str| -- Project version
+
+    objects
+
+        |list| of |DataObjStr| -- Inventory objects
+
+    Raises
+    ------
+    ValueError
+
+        If `b` is not a valid binary inventory
+
+    ~sphobjinv.error.VersionError
+
+        If `b` is a binary inventory of an unsupported format version
+
+    """
+    rdr = _Reader(b)
+
+    if rdr.take(len(MAGIC)) != MAGIC:
+        raise ValueError("Not a binary inventory")
+
+    fmt_version = rdr.varint()
+    if fmt_version != FORMAT_VERSION:
+        raise VersionError(
+            "Unsupported binary inventory format version {}".format(fmt_version)
+        )
+
+    project = rdr.text()
+    version = rdr.text()
+
+    n_strings = rdr.varint()
+    b_table = rdr.take(rdr.varint())
+    table = b_table.decode("utf-8").split("\n") if n_strings else []
+    if len(table) != n_strings:
+        raise ValueError("Corrupt string table in binary inventory")
+
+    w_str, w_pair = rdr.take(2)
+    n_pairs = rdr.varint()
+    pair_refs = rdr.indices(2 * n_pairs, w_str)
+
+    n_objs = rdr.varint()
+    names = rdr.indices(n_objs, w_str)
+    dom_roles = rdr.indices(n_objs, w_pair)
+    priorities = rdr.indices(n_objs, w_str)
+    uris = rdr.indices(n_objs, w_str)
+    dispnames = rdr.indices(n_objs, w_str)
+
+    try:
+        domains = [table[r] for r in pair_refs[0::2]]
+        roles = [table[r] for r in pair_refs[1::2]]
+
+        objects = list(
+            map(
+                DataObjStr._from_str,
+                map(table.__getitem__, names),
+                map(domains.__getitem__, dom_roles),
+                map(roles.__getitem__, dom_roles),
+                map(table.__getitem__, priorities),
+                map(table.__getitem__, uris),
+                map(table.__getitem__, dispnames),
+            )
+        )
+    except IndexError as e:
+        raise ValueError("Invalid reference in binary inventory") from e
+
+    return project, version, objects
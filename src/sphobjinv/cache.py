@@ -0,0 +1,311 @@
+r"""*Persistent on-disk cache of parsed inventories*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (bskinn@alum.mit.edu)
+
+**File Created**
+    17 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2022
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/latest
+
+**License**
+    The MIT License; see |license_txt|_ for full license terms
+
+**Members**
+
+"""
+
+import hashlib
+import marshal
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import attr
+
+from sphobjinv.data import DataFields, DataObjStr
+from sphobjinv.enum import SourceTypes
+from sphobjinv.fileops import mapbytes
+from sphobjinv.inventory import Inventory
+
+#: Version of the snapshot layout; bumped on any incompatible change.
+#: Snapshots of any other version are ignored.
+SNAPSHOT_VERSION = 1
+
+_SNAP_SUFFIX = ".snap"
+_REF_SUFFIX = ".ref"
+
+# Snapshots record the format of the source contents; the
+# source type reported then depends on how they were provided
+_FNAME_TYPES = {
+    SourceTypes.BytesPlaintext: SourceTypes.FnamePlaintext,
+    SourceTypes.BytesZlib: SourceTypes.FnameZlib,
+    SourceTypes.BytesBinary: SourceTypes.FnameBinary,
+}
+_BYTES_TYPES = {v: k for k, v in _FNAME_TYPES.items()}
+
+
+def _touch(path):
+    """Set the modification time of `path` to now, at full resolution.
+
+    The filesystem may otherwise record times no finer than the
+    kernel clock tick, which would leave the LRU order ambiguous.
+
+    """
+    now = int(time.time() * 1e9)
+    os.utime(str(path), ns=(now, now))
+
+
+def _key(*parts):
+    """Hash the snapshot version and `parts` into a cache key."""
+    h = hashlib.sha256(b"sphobjinv-cache-%d-%d\0" % (SNAPSHOT_VERSION, marshal.version))
+    for part in parts:
+        h.update(part)
+
+    return h.hexdigest()
+
+
+@attr.s(slots=True)
+class InventoryCache:
+    r"""Directory of pre-parsed inventory snapshots.
+
+    :meth:`load` returns an |Inventory| for a file path or |bytes| source,
+    as would be created by passing it to |Inventory| directly. The first
+    time a given source is loaded it is parsed normally, and a compact
+    snapshot of the result is written to the cache directory. Later loads
+    of identical contents, from any process, are built from the snapshot
+    instead, skipping decompression and parsing.
+
+    Snapshots are keyed by the SHA-256 hash of the source contents,
+    so a file that is moved, copied, or checked out afresh still hits the
+    cache. For file sources, the resolved path, modification time, and
+    size are also recorded, so that an unchanged file can be looked up
+    without being read and hashed.
+
+    The total size of the cache directory is held to at most `max_size`
+    bytes by evicting the least recently used snapshots. All files are
+    written atomically, so one cache directory can safely be shared among
+    concurrent processes; a snapshot that cannot be read for any reason is
+    treated as a cache miss.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    path
+
+        |str| or |Path| -- Cache directory; created if it does not exist
+
+    max_size
+
+        |int| *(optional)* -- Maximum total size of the cache directory,
+        in bytes. Defaults to 256 MiB.
+
+    **Members**
+
+    """
+
+    #: |Path| to the cache directory
+    path = attr.ib(converter=Path)
+
+    #: |int| maximum total size of the cache directory, in bytes
+    max_size = attr.ib(
+        default=256 * 2**20, validator=attr.validators.instance_of(int)
+    )
+
+    #: |int| count of :meth:`load` calls served from a snapshot
+    hits = attr.ib(init=False, default=0)
+
+    #: |int| count of :meth:`load` calls that required a full parse
+    misses = attr.ib(init=False, default=0)
+
+    def __attrs_post_init__(self):
+        """Create the cache directory, if needed."""
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def load(self, source):
+        """Create an |Inventory| from a source, via the cache.
+
+        Parameters
+        ----------
+        source
+
+            |bytes| contents of a plaintext, zlib-compressed, or binary
+            inventory, or |str| or |Path| path to such a file
+
+        Returns
+        -------
+        inv
+
+            |Inventory| -- Inventory with the contents of `source`, and
+            the :attr:`~sphobjinv.inventory.Inventory.source_type` it
+            would have had if created directly
+
+        Raises
+        ------
+        TypeError
+
+            If `source` is not a valid inventory source, including a path
+            that does not exist or cannot be read, as for |Inventory|
+
+        """
+        ref = ref_key = None
+
+        if isinstance(source, (bytes, bytearray)):
+            key = _key(source)
+        else:
+            try:
+                path = Path(source).resolve()
+                st = path.stat()
+            except OSError as e:
+                raise TypeError("Invalid Inventory source type") from e
+
+            ref = self.path / (
+                _key(os.fsencode(path), b"\0%d\0%d" % (st.st_mtime_ns, st.st_size))
+                + _REF_SUFFIX
+            )
+
+            key = ref_key = self._read_ref(ref)
+            if key is None:
+                try:
+                    with mapbytes(path) as m:
+                        key = _key(m)
+                except OSError as e:
+                    raise TypeError("Invalid Inventory source type") from e
+
+        inv = self._read_snapshot(key)
+        if inv is not None:
+            self.hits += 1
+            if ref is not None:
+                inv.source_type = _FNAME_TYPES[inv.source_type]
+        else:
+            self.misses += 1
+            inv = Inventory(source)
+            self._write(key + _SNAP_SUFFIX, self._snapshot(inv))
+
+        if ref is not None and ref_key is None:
+            self._write(ref.name, key.encode("ascii"))
+
+        return inv
+
+    def clear(self):
+        """Remove all snapshots from the cache directory."""
+        for p in self._entries():
+            p.unlink()
+
+    @staticmethod
+    def _snapshot(inv):
+        """Serialize an |Inventory| into snapshot |bytes|."""
+        columns = tuple(
+            [getattr(obj, f.value) for obj in inv.objects] for f in DataFields
+        )
+
+        st = _BYTES_TYPES.get(inv.source_type, inv.source_type)
+
+        return marshal.dumps(
+            (SNAPSHOT_VERSION, st.value, inv.project, inv.version, columns)
+        )
+
+    def _read_ref(self, ref):
+        """Return the content key recorded in a file reference, if valid."""
+        try:
+            key = ref.read_bytes().decode("ascii")
+        except (OSError, UnicodeDecodeError):
+            return None
+
+        return key if (self.path / (key + _SNAP_SUFFIX)).is_file() else None
+
+    def _read_snapshot(self, key):
+        """Build an |Inventory| from a snapshot, or return |None| on a miss."""
+        snap = self.path / (key + _SNAP_SUFFIX)
+
+        try:
+            # Snapshots are only ever written by _snapshot() into
+            # the cache directory, which is trusted like any other
+            # local file that is imported.
+            snap_version, st, project, version, columns = marshal.loads(  # noqa: S302
+                snap.read_bytes()
+            )
+            if snap_version != SNAPSHOT_VERSION:
+                return None
+
+            inv = Inventory()
+            inv.project = project
+            inv.version = version
+            inv.objects.extend(DataObjStr(*row) for row in zip(*columns))
+            inv.source_type = SourceTypes(st)
+
+            # Mark as recently used
+            _touch(snap)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+        return inv
+
+    def _write(self, name, data):
+        """Atomically write a cache file, then evict to the size limit."""
+        fd, tmp = tempfile.mkstemp(dir=str(self.path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            _touch(tmp)
+            os.replace(tmp, str(self.path / name))
+        except OSError:  # pragma: no cover
+            Path(tmp).unlink()
+            raise
+
+        self._evict()
+
+    def _entries(self):
+        """Return the paths of all snapshot and reference files."""
+        return [
+            p
+            for p in self.path.iterdir()
+            if p.suffix in (_SNAP_SUFFIX, _REF_SUFFIX) and p.is_file()
+        ]
+
+    def _evict(self):
+        """Remove least recently used snapshots until within `max_size`."""
+        stats = []
+        for p in self._entries():
+            try:
+                stats.append((p.stat(), p))
+            except OSError:  # pragma: no cover
+                # Removed by another process
+                continue
+
+        total = sum(st.st_size for st, _ in stats)
+        if total <= self.max_size:
+            return
+
+        snaps = sorted(
+            ((st, p) for st, p in stats if p.suffix == _SNAP_SUFFIX),
+            key=lambda sp: sp[0].st_mtime_ns,
+        )
+        for st, p in snaps:
+            if total <= self.max_size:
+                break
+            try:
+                p.unlink()
+            except OSError:  # pragma: no cover
+                continue
+            total -= st.st_size
+
+        # Drop any references to the evicted snapshots
+        for _, p in stats:
+            if p.suffix == _REF_SUFFIX and self._read_ref(p) is None:
+                try:
+                    p.unlink()
+                except OSError:  # pragma: no cover
+                    pass
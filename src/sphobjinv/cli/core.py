@@ -29,7 +29,7 @@ import sys
 
 from sphobjinv.cli.load import inv_local, inv_stdin, inv_url
 from sphobjinv.cli.parser import getparser, PrsConst
-from sphobjinv.cli.ui import log_print, yesno_prompt
+from sphobjinv.cli.ui import err_format, log_print, yesno_prompt
 from sphobjinv.cli.write import write_file, write_stdout
 
 
@@ -83,7 +83,14 @@ def do_suggest(inv, params):
     If either or both are specified,
     the results are output in a lightweight tabular format.
 
-    If the number of results exceeds
+    If |cli:QUERIES| is specified, each line of that file is searched
+    for in turn, via :meth:`Inventory.suggest_many()
+    <sphobjinv.inventory.Inventory.suggest_many>`, and the results for
+    each are printed below a line naming the query.
+
+    Objects are matched with the |cli:SCORER| scorer.
+    At most |cli:LIMIT| results are returned for each search, if specified.
+    If the number of results for any search exceeds
     |cli:SUGGEST_CONFIRM_LENGTH|,
     the user will be queried whether to display
     all of the returned results
@@ -104,32 +111,110 @@ def do_suggest(inv, params):
         |dict| -- Parameters/values mapping from the active subparser
 
     """
-    with_index = params[PrsConst.INDEX]
-    with_score = params[PrsConst.SCORE]
-    results = inv.suggest(
-        params[PrsConst.SEARCH],
-        thresh=params[PrsConst.THRESH],
-        with_index=with_index,
-        with_score=with_score,
+    kwargs = {
+        "thresh": params[PrsConst.THRESH],
+        "with_index": params[PrsConst.INDEX],
+        "with_score": params[PrsConst.SCORE],
+        "limit": params[PrsConst.LIMIT],
+        "scorer": params[PrsConst.SCORER],
+    }
+
+    if params[PrsConst.QUERIES] is None:
+        results = inv.suggest(params[PrsConst.SEARCH], **kwargs)
+
+        if len(results) == 0:
+            log_print("No results found.", params)
+            return
+
+        confirm_results(
+            len(results) > PrsConst.SUGGEST_CONFIRM_LENGTH,
+            f"Display all {len(results)} results (Y/N)?",
+            params,
+        )
+        print_results(results, params)
+        return
+
+    try:
+        with open(params[PrsConst.QUERIES], encoding="utf-8") as f:
+            names = [line.strip() for line in f]
+    except (OSError, UnicodeDecodeError) as e:
+        log_print("\nError while reading queries file:", params)
+        log_print(err_format(e), params)
+        sys.exit(1)
+
+    all_results = inv.suggest_many((name for name in names if name), **kwargs)
+
+    confirm_results(
+        any(len(r) > PrsConst.SUGGEST_CONFIRM_LENGTH for r in all_results.values()),
+        (
+            f"Display all {sum(map(len, all_results.values()))} results "
+            f"for {len(all_results)} queries (Y/N)?"
+        ),
+        params,
     )
 
-    if len(results) == 0:
-        log_print("No results found.", params)
-        return
+    for i, (name, results) in enumerate(all_results.items()):
+        if i:
+            print()
+        print(f"{name}:")
 
-    # Query if the results are long enough, but not if '--all' has been
-    # passed or if the data is coming via stdin (reading from stdin breaks
-    # the terminal interactions)
-    if (
-        len(results) > PrsConst.SUGGEST_CONFIRM_LENGTH
-        and not params[PrsConst.ALL]
-        and params[PrsConst.INFILE] != "-"
-    ):
-        resp = yesno_prompt(f"Display all {len(results)} results (Y/N)?")
+        if len(results) == 0:
+            print("  No results found.")
+        else:
+            print_results(results, params)
+
+
+def confirm_results(too_long, prompt, params):
+    r"""Query whether to display a long list of suggest results.
+
+    The query is skipped if |cli:ALL| has been passed, or if the inventory
+    is read from |stdin| (reading from |stdin| breaks the terminal
+    interactions). Calls :func:`sys.exit` if the user declines.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    too_long
+
+        |bool| -- Whether the results are long enough to query
+
+    prompt
+
+        |str| -- Prompt for :func:`~sphobjinv.cli.ui.yesno_prompt`
+
+    params
+
+        |dict| -- Parameters/values mapping from the active subparser
+
+    """
+    if too_long and not params[PrsConst.ALL] and params[PrsConst.INFILE] != "-":
+        resp = yesno_prompt(prompt)
         if resp.lower() == "n":
             log_print("\nExiting...", params)
             sys.exit(0)
 
+
+def print_results(results, params):
+    r"""Print the results of one suggest search.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    results
+
+        |list| -- Non-empty results, as returned by
+        :meth:`Inventory.suggest() <sphobjinv.inventory.Inventory.suggest>`
+
+    params
+
+        |dict| -- Parameters/values mapping from the active subparser
+
+    """
+    with_index = params[PrsConst.INDEX]
+    with_score = params[PrsConst.SCORE]
+
     # Field widths in output
     score_width = 7
     index_width = 7
@@ -197,6 +282,14 @@ def main():
     # Generate the input Inventory based on --url or stdio or file.
     # These inventory-load functions should call
     # sys.exit(n) internally in error-exit situations
+    if params[PrsConst.SUBPARSER_NAME][:2] == PrsConst.SUGGEST[:2] and (
+        params[PrsConst.SEARCH] is None
+    ) == (params[PrsConst.QUERIES] is None):
+        prs.error(
+            f"exactly one of 'search' or -{PrsConst.QUERIES[0]}/--{PrsConst.QUERIES} "
+            "is required"
+        )
+
     if params[PrsConst.URL]:
         if params[PrsConst.INFILE] == "-":
             prs.error("argument -u/--url not allowed with '-' as infile")
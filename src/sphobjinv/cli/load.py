@@ -32,7 +32,14 @@ from urllib.error import HTTPError, URLError
 
 from jsonschema.exceptions import ValidationError
 
-from sphobjinv import Inventory, readjson, urlwalk, VersionError
+from sphobjinv import (
+    Inventory,
+    readbytes,
+    sniffbytes,
+    SourceTypes,
+    urlwalk,
+    VersionError,
+)
 from sphobjinv.cli.parser import PrsConst
 from sphobjinv.cli.paths import resolve_inpath
 from sphobjinv.cli.ui import err_format, log_print
@@ -44,6 +51,10 @@ def import_infile(in_path):
     Convenience function wrapping attempts to load an
     |Inventory| from a local path.
 
+    The file is read only once; its format is identified with
+    :func:`~sphobjinv.fileops.sniffbytes` and the contents are
+    handed directly to the matching |Inventory| importer.
+
     Parameters
     ----------
     in_path
@@ -59,21 +70,29 @@ def import_infile(in_path):
         otherwise, |None|
 
     """
-    # Try general import, for zlib or plaintext files
-    try:
-        inv = Inventory(in_path)
-    except AttributeError:
-        pass  # Punt to JSON attempt
-    else:
-        return inv
+    b = readbytes(in_path)
+    st = sniffbytes(b)
+
+    if st is SourceTypes.DictJSON:
+        try:
+            return Inventory(dict_json=json.loads(b))
+        except JSONDecodeError:
+            return None
+
+    if st is SourceTypes.BytesBinary:
+        try:
+            return Inventory(binary=b)
+        except (ValueError, VersionError):
+            return None
 
-    # Maybe it's JSON
     try:
-        inv = Inventory(readjson(in_path))
-    except JSONDecodeError:
+        if st is SourceTypes.BytesZlib:
+            return Inventory(zlib=b)
+        else:
+            return Inventory(plaintext=b)
+    except AttributeError:
+        # Not a plaintext inventory after all
         return None
-    else:
-        return inv
 
 
 def inv_local(params):
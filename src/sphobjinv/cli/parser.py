@@ -27,6 +27,7 @@ Sphinx |objects.inv| files.
 
 import argparse as ap
 
+from sphobjinv.suggest import SCORERS
 from sphobjinv.version import __version__
 
 
@@ -71,7 +72,7 @@ class PrsConst:
     # ### Conversion subparser: 'mode' param and choices
     #: Positional argument name for use with :data:`CONVERT` subparser,
     #: indicating output file format
-    #: (:data:`ZLIB`, :data:`PLAIN` or :data:`JSON`)
+    #: (:data:`ZLIB`, :data:`PLAIN`, :data:`JSON` or :data:`BINARY`)
     MODE = "mode"
 
     #: Argument value for :data:`CONVERT` :data:`MODE`,
@@ -86,6 +87,11 @@ class PrsConst:
     #: to output an inventory as JSON
     JSON = "json"
 
+    #: Argument value for :data:`CONVERT` :data:`MODE`,
+    #: to output a compact binary inventory
+    #: (see :mod:`sphobjinv.binary`)
+    BINARY = "binary"
+
     # ### Source/destination params
     #: Required positional argument name for use with both :data:`CONVERT` and
     #: :data:`SUGGEST` subparsers, holding the path
@@ -147,24 +153,40 @@ class PrsConst:
     #: number returned, without asking for confirmation
     ALL = "all"
 
+    #: Optional argument name for use with the :data:`SUGGEST` subparser,
+    #: taking the maximum number of best-scoring objects to return
+    #: as one required argument
+    LIMIT = "limit"
+
+    #: Optional argument name for use with the :data:`SUGGEST` subparser,
+    #: taking the path to a file of search terms, one per line,
+    #: to search for in place of :data:`SEARCH`
+    QUERIES = "queries"
+
+    #: Optional argument name for use with the :data:`SUGGEST` subparser,
+    #: taking the name of the scorer with which to match objects
+    #: (see :data:`sphobjinv.suggest.SCORERS`) as one required argument
+    SCORER = "scorer"
+
     # ### Helper strings
     #: Help text for the :data:`CONVERT` subparser
     HELP_CO_PARSER = (
-        "Convert intersphinx inventory to zlib-compressed, plaintext, or JSON formats."
+        "Convert intersphinx inventory to zlib-compressed, plaintext, JSON, "
+        "or binary formats."
     )
 
     #: Help text for the :data:`SUGGEST` subparser
     HELP_SU_PARSER = "Fuzzy-search intersphinx inventory for desired object(s)."
 
     #: Help text for default extensions for the various conversion types
-    HELP_CONV_EXTS = "'.inv/.txt/.json'"
+    HELP_CONV_EXTS = "'.inv/.txt/.json/.soib'"
 
     # ### Defaults for an unspecified OUTFILE
     #: Default base name for an unspecified :data:`OUTFILE`
     DEF_BASENAME = "objects"
 
     #: Default extensions for an unspecified :data:`OUTFILE`
-    DEF_OUT_EXT = {ZLIB: ".inv", PLAIN: ".txt", JSON: ".json"}
+    DEF_OUT_EXT = {ZLIB: ".inv", PLAIN: ".txt", JSON: ".json", BINARY: ".soib"}
 
     # ### Useful constants
     #: Number of returned objects from a :data:`SUGGEST` subparser invocation
@@ -179,6 +201,19 @@ class PrsConst:
     FOUND_URL = "found_url"
 
 
+def _positive_int(value):
+    """Convert a command-line argument to an |int| of at least 1."""
+    try:
+        n = int(value)
+    except ValueError:
+        n = 0
+
+    if n < 1:
+        raise ap.ArgumentTypeError("must be a positive integer, not {!r}".format(value))
+
+    return n
+
+
 def getparser():
     """Generate argument parser.
 
@@ -238,7 +273,7 @@ def getparser():
     spr_convert.add_argument(
         PrsConst.MODE,
         help="Conversion output format",
-        choices=(PrsConst.ZLIB, PrsConst.PLAIN, PrsConst.JSON),
+        choices=(PrsConst.ZLIB, PrsConst.PLAIN, PrsConst.JSON, PrsConst.BINARY),
     )
 
     spr_convert.add_argument(
@@ -322,7 +357,15 @@ def getparser():
             "Passing '-' indicates to read from stdin (plaintext/JSON only)."
         ),
     )
-    spr_suggest.add_argument(PrsConst.SEARCH, help="Search term for object suggestions")
+    spr_suggest.add_argument(
+        PrsConst.SEARCH,
+        help=(
+            "Search term for object suggestions. "
+            f"Required unless --{PrsConst.QUERIES} is given."
+        ),
+        nargs="?",
+        default=None,
+    )
     spr_suggest.add_argument(
         "-" + PrsConst.ALL[0],
         "--" + PrsConst.ALL,
@@ -356,6 +399,34 @@ def getparser():
         choices=range(101),
         metavar="{0-100}",
     )
+    spr_suggest.add_argument(
+        "-" + PrsConst.LIMIT[0],
+        "--" + PrsConst.LIMIT,
+        help="Show at most this many of the best matches. "
+        "By default, all matches scoring at least the "
+        "threshold are shown.",
+        default=None,
+        type=_positive_int,
+        metavar="N",
+    )
+    spr_suggest.add_argument(
+        "-" + PrsConst.QUERIES[0],
+        "--" + PrsConst.QUERIES,
+        help="Path to a file of search terms, one per line, "
+        "to search for in turn in place of 'search'. "
+        "Results are shown separately for each.",
+        default=None,
+        metavar="FILE",
+    )
+    spr_suggest.add_argument(
+        "--" + PrsConst.SCORER,
+        help="Scorer with which to match objects, trading match quality "
+        "for speed. 'wratio' (the default) is the most thorough; "
+        "'qratio', 'token_set', 'substring' and 'prefix' are "
+        "successively cheaper.",
+        default="wratio",
+        choices=list(SCORERS),
+    )
     spr_suggest.add_argument(
         "-" + PrsConst.URL[0],
         "--" + PrsConst.URL,
@@ -29,6 +29,7 @@ import json
 import os
 import sys
 
+from sphobjinv.binary import encode
 from sphobjinv.cli.parser import PrsConst
 from sphobjinv.cli.paths import resolve_outpath
 from sphobjinv.cli.ui import err_format, log_print, yesno_prompt
@@ -118,6 +119,46 @@ def write_zlib(inv, path, *, expand=False, contract=False):
     writebytes(path, bz_str)
 
 
+def write_binary(inv, path, *, expand=False, contract=False):
+    """Write an |Inventory| to the compact binary format.
+
+    Calling with both `expand` and `contract` as |True| is invalid.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    inv
+
+        |Inventory| -- Objects inventory to be written in binary format
+
+    path
+
+        |str| -- Path to output file
+
+    expand
+
+        |bool| *(optional)* -- Generate output with any
+        :data:`~sphobjinv.data.SuperDataObj.uri` or
+        :data:`~sphobjinv.data.SuperDataObj.dispname`
+        abbreviations expanded
+
+    contract
+
+        |bool| *(optional)* -- Generate output with abbreviated
+        :data:`~sphobjinv.data.SuperDataObj.uri` and
+        :data:`~sphobjinv.data.SuperDataObj.dispname` values
+
+    Raises
+    ------
+    ValueError
+
+        If both `expand` and `contract` are |True|
+
+    """
+    writebytes(path, encode(inv, expand=expand, contract=contract))
+
+
 def write_json(inv, path, params):
     """Write an |Inventory| to JSON.
 
@@ -266,6 +307,13 @@ def write_file(inv, in_path, params):
             )
         if mode == PrsConst.JSON:
             write_json(inv, out_path, params)
+        if mode == PrsConst.BINARY:
+            write_binary(
+                inv,
+                out_path,
+                expand=params[PrsConst.EXPAND],
+                contract=params[PrsConst.CONTRACT],
+            )
     except Exception as e:
         log_print("\nError during write of output file:", params)
         log_print(err_format(e), params)
@@ -85,6 +85,16 @@ def _utf8_encode(s):
         raise TypeError("Argument must be 'bytes' or 'str'")
 
 
+def _discard(value):
+    """Drop an argument accepted only for backward compatibility.
+
+    Helper for the ``as_str`` argument to DataObjStr and the ``as_bytes``
+    argument to DataObjBytes, which always refer to the instance itself.
+
+    """
+    return None
+
+
 class SuperDataObj(metaclass=ABCMeta):
     """Abstract base superclass defining common methods &c. for data objects.
 
@@ -421,25 +431,59 @@ class DataObjStr(SuperDataObj):
     uri = attr.ib(converter=_utf8_decode)
     dispname = attr.ib(converter=_utf8_decode)
 
-    as_bytes = attr.ib(repr=False, eq=False)
-
-    @as_bytes.default
-    def _as_bytes_default(self):
-        """Create DataObjBytes equivalent."""
-        return DataObjBytes(
-            name=self.name,
-            domain=self.domain,
-            role=self.role,
-            priority=self.priority,
-            uri=self.uri,
-            dispname=self.dispname,
-            as_str=self,
-        )
-
-    as_str = attr.ib(repr=False, eq=False)
-
-    @as_str.default
-    def _as_str_default(self):
+    # Bytes twin; created and cached on first access to .as_bytes
+    _as_bytes = attr.ib(repr=False, eq=False, default=None)
+
+    # Accepts the former `as_str` argument, which is ignored
+    _as_str = attr.ib(repr=False, eq=False, default=None, converter=_discard)
+
+    @property
+    def as_bytes(self):
+        """:class:`DataObjBytes` version of instance.
+
+        Created on first access and cached thereafter.
+
+        .. versionchanged:: 2.3
+
+            Previously, this was created for every instance at
+            construction time.
+
+        """
+        if self._as_bytes is None:
+            self._as_bytes = DataObjBytes(
+                name=self.name,
+                domain=self.domain,
+                role=self.role,
+                priority=self.priority,
+                uri=self.uri,
+                dispname=self.dispname,
+                as_str=self,
+            )
+
+        return self._as_bytes
+
+    @classmethod
+    def _from_str(cls, name, domain, role, priority, uri, dispname):
+        """Create an instance directly from trusted |str| field values.
+
+        Skips the converters run by ``__init__``, for bulk loading of
+        data already known to be decoded.
+
+        """
+        obj = object.__new__(cls)
+        obj.name = name
+        obj.domain = domain
+        obj.role = role
+        obj.priority = priority
+        obj.uri = uri
+        obj.dispname = dispname
+        obj._as_bytes = None
+        obj._as_str = None
+
+        return obj
+
+    @property
+    def as_str(self):
         """Return this instance."""
         return self
 
@@ -492,25 +536,39 @@ class DataObjBytes(SuperDataObj):
     uri = attr.ib(converter=_utf8_encode)
     dispname = attr.ib(converter=_utf8_encode)
 
-    as_str = attr.ib(repr=False, eq=False)
-
-    @as_str.default
-    def _as_str_default(self):
-        """Create DataObjStr equivalent."""
-        return DataObjStr(
-            name=self.name,
-            domain=self.domain,
-            role=self.role,
-            priority=self.priority,
-            uri=self.uri,
-            dispname=self.dispname,
-            as_bytes=self,
-        )
-
-    as_bytes = attr.ib(repr=False, eq=False)
-
-    @as_bytes.default
-    def _as_bytes_default(self):
+    # Str twin; created and cached on first access to .as_str
+    _as_str = attr.ib(repr=False, eq=False, default=None)
+
+    # Accepts the former `as_bytes` argument, which is ignored
+    _as_bytes = attr.ib(repr=False, eq=False, default=None, converter=_discard)
+
+    @property
+    def as_str(self):
+        """:class:`DataObjStr` version of instance.
+
+        Created on first access and cached thereafter.
+
+        .. versionchanged:: 2.3
+
+            Previously, this was created for every instance at
+            construction time.
+
+        """
+        if self._as_str is None:
+            self._as_str = DataObjStr(
+                name=self.name,
+                domain=self.domain,
+                role=self.role,
+                priority=self.priority,
+                uri=self.uri,
+                dispname=self.dispname,
+                as_bytes=self,
+            )
+
+        return self._as_str
+
+    @property
+    def as_bytes(self):
         """Return this instance."""
         return self
 
@@ -31,15 +31,17 @@ from enum import Enum
 class SourceTypes(Enum):
     """|Enum| for the import mode used in instantiating an |Inventory|.
 
-    Since |Enum| keys iterate in definition order, the
-    definition order here defines the order in which |Inventory|
-    objects attempt to parse a source object passed to
-    :class:`Inventory.__init__() <sphobjinv.inventory.Inventory>`
-    either as a positional argument
-    or via the generic `source` keyword argument.
+    |Enum| keys iterate in definition order.
 
-    This order **DIFFERS** from the documentation order, which is
-    alphabetical.
+    .. versionchanged:: 2.3
+
+        Previously, the definition order here defined the order in
+        which |Inventory| objects attempted to parse a source object
+        passed to
+        :class:`Inventory.__init__() <sphobjinv.inventory.Inventory>`
+        either as a positional argument
+        or via the generic `source` keyword argument.
+        The type of such a source is now identified from its contents.
 
     """
 
@@ -71,6 +73,17 @@ class SourceTypes(Enum):
     #: downloaded from a URL.
     URL = "url"
 
+    #: Instantiation from a binary inventory |bytes|, as
+    #: generated by :func:`~sphobjinv.binary.encode`.
+    #:
+    #: .. versionadded:: 2.3
+    BytesBinary = "bytes_binary"
+
+    #: Instantiation from a binary inventory file on disk.
+    #:
+    #: .. versionadded:: 2.3
+    FnameBinary = "fname_binary"
+
 
 class HeaderFields(Enum):
     """|Enum| for various inventory-level data items.
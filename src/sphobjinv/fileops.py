@@ -26,8 +26,18 @@ Sphinx |objects.inv| files.
 """
 
 import json
+import mmap
+from contextlib import contextmanager
 from pathlib import Path
 
+from sphobjinv.binary import MAGIC
+from sphobjinv.enum import SourceTypes
+
+
+#: Number of leading lines in a version 2 |objects.inv| that
+#: are stored uncompressed
+_HEADER_LINES = 4
+
 
 def readbytes(path):
     """Read file contents and return as |bytes|.
@@ -52,6 +62,47 @@ def readbytes(path):
     return Path(path).read_bytes()
 
 
+@contextmanager
+def mapbytes(path):
+    """Memory-map file contents for reading, as a context manager.
+
+    The contents are paged in from disk only as they are accessed,
+    so a large file never needs to be held in memory all at once.
+    The mapping is closed on exit from the context.
+
+    Files that cannot be mapped (empty files, pipes, etc.)
+    are instead read in full, and their contents provided as |bytes|.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    path
+
+        |str| or |Path| -- Path to file to be opened.
+
+    Yields
+    ------
+    m
+
+        :class:`mmap.mmap` or |bytes| -- Read-only view of the contents
+        of the indicated file. Supports slicing, :meth:`~bytes.find`,
+        regex searches, and the ``read``/``readline`` stream methods.
+
+    """
+    with Path(path).open("rb") as f:
+        try:
+            m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            yield f.read()
+            return
+
+    try:
+        yield m
+    finally:
+        m.close()
+
+
 def writebytes(path, contents):
     """Write indicated file contents.
 
@@ -124,6 +175,79 @@ def writejson(path, d):
     Path(path).write_text(json.dumps(d))
 
 
+def sniffbytes(b):
+    r"""Identify the inventory format of raw file contents.
+
+    Only the first few bytes of `b` are examined, so the cost
+    does not depend on the size of the inventory:
+
+    * Data starting with :data:`~sphobjinv.binary.MAGIC` is reported
+      as a binary inventory.
+
+    * Data whose first non-whitespace character is
+      '|cour|\ {\ |/cour|' is reported as JSON.
+
+    * Data starting with the version 2 preamble line, whose four header
+      lines are followed by a valid :mod:`zlib` stream header,
+      is reported as zlib-compressed.
+
+    * Anything else is reported as plaintext; it is left to the plaintext
+      importer to reject data that is not actually an inventory.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    b
+
+        |bytes| or :class:`mmap.mmap` -- Contents of a candidate inventory file
+
+    Returns
+    -------
+    st
+
+        :class:`~sphobjinv.enum.SourceTypes` -- One of
+        :attr:`~sphobjinv.enum.SourceTypes.BytesBinary`,
+        :attr:`~sphobjinv.enum.SourceTypes.DictJSON`,
+        :attr:`~sphobjinv.enum.SourceTypes.BytesZlib`,
+        or :attr:`~sphobjinv.enum.SourceTypes.BytesPlaintext`
+
+    """
+    from sphobjinv.inventory import Inventory
+
+    if b[: len(MAGIC)] == MAGIC:
+        return SourceTypes.BytesBinary
+
+    if b[:64].lstrip().startswith(b"{"):
+        return SourceTypes.DictJSON
+
+    preamble = Inventory.header_preamble.encode("utf-8")
+    n = len(preamble)
+    if b[:n] != preamble:
+        return SourceTypes.BytesPlaintext
+
+    # Skip over the header lines to the first byte of the data block
+    pos = 0
+    for _ in range(_HEADER_LINES):
+        pos = b.find(b"\n", pos) + 1
+        if pos == 0:
+            return SourceTypes.BytesPlaintext
+
+    # RFC 1950 header: deflate method, no preset dictionary,
+    # and a check value making the first two bytes a multiple of 31
+    end = pos + 2
+    cmf_flg = b[pos:end]
+    if (
+        len(cmf_flg) == 2
+        and cmf_flg[0] & 0x0F == 8
+        and not cmf_flg[1] & 0x20
+        and int.from_bytes(cmf_flg, "big") % 31 == 0
+    ):
+        return SourceTypes.BytesZlib
+
+    return SourceTypes.BytesPlaintext
+
+
 def urlwalk(url):
     r"""Generate a series of candidate |objects.inv| URLs.
 
@@ -25,9 +25,11 @@ Sphinx |objects.inv| files.
 
 """
 
-import re
 import ssl
 import urllib.request as urlrq
+from array import array
+from contextlib import ExitStack
+from itertools import chain, islice
 from zlib import error as zlib_error
 
 import attr
@@ -35,13 +37,30 @@ import certifi
 import jsonschema
 from jsonschema.exceptions import ValidationError
 
-from sphobjinv.data import _utf8_encode, DataObjStr
+from sphobjinv.binary import decode as decode_binary
+from sphobjinv.data import _utf8_encode, DataFields, DataObjStr
 from sphobjinv.enum import HeaderFields, SourceTypes
-from sphobjinv.fileops import readbytes
-from sphobjinv.re import pb_data, pb_project, pb_version
+from sphobjinv.fileops import mapbytes, sniffbytes
+from sphobjinv.lookup import InventoryIndex, PrefixIndex, UriIndex
+from sphobjinv.objects import LazyObjects, ObjectList
+from sphobjinv.parse import data_line_offsets, iter_data_lines, parse_data_line
+from sphobjinv.re import pb_project, pb_version
 from sphobjinv.schema import json_schema
+from sphobjinv.suggest import SuggestCorpus
 from sphobjinv.version import __version__ as soi_version
-from sphobjinv.zlib import decompress
+from sphobjinv.zlib import decompress_blocks, decompress_lines
+
+
+# Type checks for the header keys of a JSON dict
+_JSON_HEADER_TYPES = {
+    HeaderFields.Project.value: lambda v: type(v) is str,
+    HeaderFields.Version.value: lambda v: type(v) is str,
+    HeaderFields.Count.value: lambda v: type(v) is int,
+    HeaderFields.Metadata.value: lambda v: True,
+}
+_JSON_REQUIRED = (HeaderFields.Project, HeaderFields.Version, HeaderFields.Count)
+_JSON_OBJ_KEYS = {f.value for f in DataFields}
+_JSON_DIGITS = set("0123456789")
 
 
 @attr.s(slots=True, eq=True, order=False)
@@ -51,11 +70,29 @@ class Inventory:
     All information is stored internally as |str|,
     even if imported from a |bytes| source.
 
-    All arguments except `count_error` are used to specify the source
-    from which the |Inventory| contents are to be populated.
+    All arguments except `count_error`, `lazy`, and `validate` are used to
+    specify the source from which the |Inventory| contents are to be populated.
     **At most ONE** of these source arguments may be other than |None|.
 
-    The `count_error` argument is only relevant to the `dict_json` source type.
+    The `count_error` and `validate` arguments are only relevant to the
+    `dict_json` source type.
+
+    If `validate` is |False|, a `dict_json` source is not checked against
+    :data:`~sphobjinv.schema.json_schema`, and is trusted to conform to it.
+    Import of a non-conforming |dict| may then fail with an arbitrary error,
+    or silently produce an invalid inventory.
+
+    If `lazy` is |True|, the data objects of an inventory imported from
+    a plaintext or zlib-compressed source are not constructed up front.
+    Instead, :attr:`~sphobjinv.inventory.Inventory.objects` is a
+    :class:`~sphobjinv.objects.LazyObjects`, which builds each |DataObjStr|
+    the first time it is accessed. This makes loading large inventories
+    substantially faster when only a few objects, or only the
+    :attr:`~sphobjinv.inventory.Inventory.count`, are needed.
+
+    .. versionadded:: 2.3
+
+        The `lazy` and `validate` arguments.
 
     Equality comparisons between |Inventory| instances
     will return |True| if
@@ -82,9 +119,17 @@ class Inventory:
 
     `source`
 
-        The |Inventory| will attempt to parse the indicated
-        source object as each of the below types in sequence,
-        **except** for `url`.
+        The |Inventory| will identify the type of the indicated
+        source object and parse it accordingly, for any of the
+        below types **except** for `url`.
+        |bytes| and file sources are read once and their format
+        identified from their contents by
+        :func:`~sphobjinv.fileops.sniffbytes`.
+
+        .. versionchanged:: 2.3
+
+            Previously, the source was parsed as each of the
+            below types in sequence until one succeeded.
 
         This argument is included mainly as a convenience
         feature for use in interactive sessions, as
@@ -154,6 +199,20 @@ class Inventory:
 
         No authentication is supported at this time.
 
+    `binary`
+
+        Object is the |bytes| contents of a binary inventory,
+        as generated by :func:`~sphobjinv.binary.encode`.
+
+        .. versionadded:: 2.3
+
+    `fname_binary`
+
+        Object is the |str| or |Path| path to a file containing
+        a binary inventory.
+
+        .. versionadded:: 2.3
+
     **Members**
 
     """
@@ -181,6 +240,20 @@ class Inventory:
         repr=False, default=True, validator=attr.validators.instance_of(bool), eq=False
     )
 
+    # Flag for whether to defer construction of the data objects
+    _lazy = attr.ib(
+        repr=False, default=False, validator=attr.validators.instance_of(bool), eq=False
+    )
+
+    # Binary types; last, so as not to shift the positional arguments above
+    _binary = attr.ib(repr=False, default=None, eq=False)
+    _fname_binary = attr.ib(repr=False, default=None, eq=False)
+
+    # Flag for whether to validate dict imports against the JSON schema
+    _validate = attr.ib(
+        repr=False, default=True, validator=attr.validators.instance_of(bool), eq=False
+    )
+
     # Actual regular attributes
     #: |str| project display name for the inventory
     #: (see :ref:`here <syntax-mouseover-example>`).
@@ -190,17 +263,21 @@ class Inventory:
     #: (see :ref:`here <syntax-mouseover-example>`).
     version = attr.ib(init=False, default=None)
 
-    #: |list| of |DataObjStr| representing the
-    #: data objects of the inventory.
-    #: Can be edited directly to change the inventory contents.
-    #: Undefined/random behavior/errors will result if the type
-    #: of the elements is anything other than |DataObjStr|.
-    objects = attr.ib(init=False, default=attr.Factory(list), repr=False)
+    # Data objects of the inventory; see the objects property
+    _objects = attr.ib(init=False, default=attr.Factory(ObjectList), repr=False)
 
     #: :class:`~sphobjinv.enum.SourceTypes` |Enum| value indicating the type of
     #: source from which the instance was generated.
     source_type = attr.ib(init=False, default=None, eq=False)
 
+    # Lookup indexes of objects, built on first use of the matching property
+    _index = attr.ib(init=False, default=None, repr=False, eq=False)
+    _prefix_index = attr.ib(init=False, default=None, repr=False, eq=False)
+    _uri_index = attr.ib(init=False, default=None, repr=False, eq=False)
+
+    # Search corpus for objects_rst and suggest(), built on first use
+    _suggest_corpus = attr.ib(init=False, default=None, repr=False, eq=False)
+
     # Helper strings for inventory datafile output
     #: Preamble line for v2 |objects.inv| header
     header_preamble = "# Sphinx inventory version 2"
@@ -217,6 +294,40 @@ class Inventory:
     # Private class member for SSL context, since context creation is slow(?)
     _sslcontext = ssl.create_default_context(cafile=certifi.where())
 
+    # Private class member for the JSON schema validator, likewise
+    _json_validator = jsonschema.Draft4Validator(json_schema)
+
+    @property
+    def objects(self):
+        r"""|list| of |DataObjStr| representing the data objects of the inventory.
+
+        Can be edited directly to change the inventory contents.
+        Undefined/random behavior/errors will result if the type
+        of the elements is anything other than |DataObjStr|.
+
+        Always an :class:`~sphobjinv.objects.ObjectList`, so that changes
+        to it are seen by :attr:`index` and the other lookup indexes; any
+        other sequence assigned is converted to one. If the instance was
+        created with `lazy` as |True| from a plaintext or zlib-compressed
+        source, this is instead a |list|-like
+        :class:`~sphobjinv.objects.LazyObjects`, which tracks changes
+        in the same way.
+
+        .. versionchanged:: 2.3
+            Now an :class:`~sphobjinv.objects.ObjectList`
+            instead of a plain |list|.
+
+        """
+        return self._objects
+
+    @objects.setter
+    def objects(self, value):
+        """Set the data objects, converting to a change-tracking sequence."""
+        if not isinstance(value, (ObjectList, LazyObjects)):
+            value = ObjectList(value)
+
+        self._objects = value
+
     @property
     def count(self):
         """Count of objects currently in inventory."""
@@ -269,6 +380,71 @@ class Inventory:
 
         return d
 
+    @property
+    def index(self):
+        """:class:`~sphobjinv.lookup.InventoryIndex` of the current objects.
+
+        Built on first access, and then updated in place as :attr:`objects`
+        is modified, or rebuilt if :attr:`objects` is replaced.
+
+        Changes to the fields of the objects in the inventory are not
+        detected; to modify an object in place, replace it with a new one,
+        e.g. via :meth:`~sphobjinv.data.SuperDataObj.evolve`.
+
+        .. versionadded:: 2.3
+
+        """
+        self._index = self._current_index(self._index, InventoryIndex)
+        return self._index
+
+    @property
+    def prefix_index(self):
+        """:class:`~sphobjinv.lookup.PrefixIndex` of the current objects.
+
+        For completion of partial object names. Built and kept up to date
+        in the same way as :attr:`index`.
+
+        .. versionadded:: 2.3
+
+        """
+        self._prefix_index = self._current_index(self._prefix_index, PrefixIndex)
+        return self._prefix_index
+
+    @property
+    def uri_index(self):
+        """:class:`~sphobjinv.lookup.UriIndex` of the current objects.
+
+        For finding the objects that point to a given URL. Built and kept
+        up to date in the same way as :attr:`index`.
+
+        .. versionadded:: 2.3
+
+        """
+        self._uri_index = self._current_index(self._uri_index, UriIndex)
+        return self._uri_index
+
+    def _current_index(self, index, index_type):
+        """Return `index` if it is current, or else a new index of the objects."""
+        if index is None or index.objects is not self.objects or index.stale:
+            index = index_type(self.objects)
+
+        return index
+
+    @property
+    def suggest_corpus(self):
+        """:class:`~sphobjinv.suggest.SuggestCorpus` of the current objects.
+
+        Holds the search strings for :meth:`suggest`, and counts the objects
+        each search scored and skipped. Built and kept up to date in the
+        same way as :attr:`index`, except that changes to the fields of the
+        objects in the inventory are also detected.
+
+        .. versionadded:: 2.3
+
+        """
+        self._suggest_corpus = self._current_index(self._suggest_corpus, SuggestCorpus)
+        return self._suggest_corpus
+
     @property
     def objects_rst(self):
         r"""|list| of objects formatted in a |str| reST-like representation.
@@ -277,8 +453,15 @@ class Inventory:
         :class:`data.SuperDataObj.rst_fmt
         <sphobjinv.data.SuperDataObj.rst_fmt>`.
 
+        Each object is formatted only once, and the results are reused
+        until objects are added to or removed from :attr:`objects`, or
+        the fields of an object are changed in place.
+
         Calling with both `expand` and `contract` as |True| is invalid.
 
+        .. versionchanged:: 2.3
+            Formatted strings are cached between accesses.
+
         Parameters
         ----------
         expand
@@ -308,7 +491,7 @@ class Inventory:
             If both `expand` and `contract` are |True|
 
         """
-        return [_.as_rst for _ in self.objects]
+        return list(self.suggest_corpus.rst)
 
     def __str__(self):  # pragma: no cover
         """Return concise, readable description of contents."""
@@ -332,6 +515,8 @@ class Inventory:
             self._fname_zlib,
             self._dict_json,
             self._url,
+            self._binary,
+            self._fname_binary,
         )
         src_count = sum(1 for _ in src_list if _ is not None)
 
@@ -369,6 +554,8 @@ class Inventory:
                 self._fname_zlib,
                 self._dict_json,
                 self._url,
+                self._binary,
+                self._fname_binary,
             ),
             (
                 self._import_zlib_bytes,
@@ -376,6 +563,8 @@ class Inventory:
                 self._import_zlib_fname,
                 self._import_json_dict,
                 self._import_url,
+                self._import_binary_bytes,
+                self._import_binary_fname,
             ),
             (
                 SourceTypes.BytesZlib,
@@ -383,6 +572,8 @@ class Inventory:
                 SourceTypes.FnameZlib,
                 SourceTypes.DictJSON,
                 SourceTypes.URL,
+                SourceTypes.BytesBinary,
+                SourceTypes.FnameBinary,
             ),
         ):
             if src is not None:
@@ -447,7 +638,18 @@ class Inventory:
             )
         ).encode("utf-8")
 
-    def suggest(self, name, *, thresh=50, with_index=False, with_score=False):
+    def suggest(
+        self,
+        name,
+        *,
+        thresh=50,
+        with_index=False,
+        with_score=False,
+        approximate=False,
+        limit=None,
+        workers=None,
+        scorer="wratio",
+    ):
         r"""Suggest objects in the inventory to match a name.
 
         :meth:`~Inventory.suggest` makes use of
@@ -455,7 +657,9 @@ class Inventory:
         to identify potential matches to the given `name`
         within the inventory.
         The search is performed over the |list| of |str|
-        generated by :meth:`~objects_rst`.
+        generated by :meth:`~objects_rst`. These search strings are
+        prepared once and cached, as for :attr:`objects_rst`, so repeated
+        searches of one inventory only pay for the scoring.
 
         `thresh` defines the minimum |fuzzywuzzy|_ match quality
         (an integer ranging from 0 to 100)
@@ -473,6 +677,40 @@ class Inventory:
         :doc:`'suggest' subparser </cli/suggest>`
         of the command-line interface.
 
+        By default every object is scored, and the results are exact.
+        With `approximate` as |True|, only objects whose search strings
+        share at least one three-character sequence with the processed
+        `name` are scored, via an n-gram index built on first use
+        (see :meth:`SuggestCorpus.candidates
+        <sphobjinv.suggest.SuggestCorpus.candidates>`). This is usually
+        orders of magnitude faster, and returns the same scores, but does
+        not take `thresh` into account, and so can omit matches that
+        score at least `thresh`: those scoring well only on partial
+        matches of short tokens, mostly below a `thresh` of about 70.
+
+        Objects that cannot score at least `thresh`, judged from their
+        lengths and the characters and tokens they share with `name`, are
+        skipped without being scored (see
+        :class:`~sphobjinv.suggest.ScoreBound`). This never changes the
+        results, and saves more the higher `thresh` is. The counts of
+        objects scored and skipped are kept by :attr:`suggest_corpus`.
+
+        `scorer` selects how matches are scored. ``"qratio"``,
+        ``"token_set"``, ``"substring"`` and ``"prefix"`` each compute only
+        a part of the default ``"wratio"`` score, or less, and are
+        correspondingly cheaper. With ``"levenshtein"``, each ratio that
+        |fuzzywuzzy|_ would compute with :class:`difflib.SequenceMatcher` is
+        instead computed from the insertion/deletion edit distance, with the
+        bit-parallel :class:`~sphobjinv.levenshtein.Pattern`, as
+        |python-Levenshtein|_ once did. This is several times faster,
+        particularly for long names, but gives somewhat different scores.
+
+        .. versionchanged:: 2.3
+            Search strings are cached between calls.
+            Added `approximate`, `limit`, `workers`, and `scorer`.
+            The index of each object is no longer included in the
+            text scored, so that it cannot affect the match scores.
+
         Parameters
         ----------
         name
@@ -493,6 +731,35 @@ class Inventory:
             |bool| -- Include with each matched name
             its |fuzzywuzzy|_ match quality score
 
+        approximate
+
+            |bool| *(optional)* -- Score only objects sharing an
+            n-gram with `name`, for speed at the cost of possibly
+            missing some matches
+
+        limit
+
+            |int| *(optional)* -- Return at most this many of the
+            best-scoring matches; at least 1. Only that many are retained during the
+            search, instead of every match being collected and sorted.
+
+        workers
+
+            |int| *(optional)* -- Score the objects in this many worker
+            processes, at least 1, kept running between calls. Results are identical
+            to those with the default of scoring in this process. See
+            :meth:`SuggestCorpus.search
+            <sphobjinv.suggest.SuggestCorpus.search>`.
+
+        scorer
+
+            |str| *(optional)* -- Name of the scorer to use, from
+            :data:`sphobjinv.suggest.SCORERS`. ``"wratio"``, the default,
+            is the full |fuzzywuzzy|_ ``WRatio``; cheaper scorers trade
+            match quality for speed (see :meth:`SuggestCorpus.search
+            <sphobjinv.suggest.SuggestCorpus.search>`), and others can be
+            added with :func:`~sphobjinv.suggest.register_scorer`.
+
         Returns
         -------
         res_l
@@ -515,32 +782,85 @@ class Inventory:
             `with_index == with_score == True`:
             |cour|\ (as_rst, score, index)\ |/cour|
 
+        Raises
+        ------
+        ValueError
+
+            If `limit` is less than 1, `workers` is not |None| or an |int|
+            of at least 1, or `scorer` is not a registered scorer
+
         """
-        from sphobjinv._vendored.fuzzywuzzy import process as fwp
-
-        # Must propagate list index to include in output
-        # Search vals are rst prepended with list index
-        srch_list = [f"{i} {o}" for i, o in enumerate(self.objects_rst)]
-
-        # Composite each string result extracted by fuzzywuzzy
-        # and its match score into a single string. The match
-        # and score are returned together in a tuple.
-        results = [
-            f"{match} {score}"
-            for match, score in fwp.extract(name, srch_list, limit=None)
-            if score >= thresh
-        ]
+        # Each result is (rst, score, index)
+        results = self.suggest_corpus.search(
+            name,
+            thresh,
+            approximate=approximate,
+            limit=limit,
+            workers=workers,
+            scorer=scorer,
+        )
 
-        # Define regex for splitting the three components, and
-        # use it to convert composite result string to tuple:
-        # result --> (rst, score, index)
-        p_idx = re.compile(r"^(\d+)\s+(.+?)\s+(\d+)$")
-        results = [
-            (m.group(2), int(m.group(3)), int(m.group(1)))
-            for m in map(p_idx.match, results)
-        ]
+        return self._suggest_output(results, with_index, with_score)
+
+    def suggest_many(
+        self,
+        names,
+        *,
+        thresh=50,
+        with_index=False,
+        with_score=False,
+        approximate=False,
+        limit=None,
+        workers=None,
+        scorer="wratio",
+    ):
+        r"""Suggest objects in the inventory to match each of several names.
+
+        Equivalent to calling :meth:`~Inventory.suggest` for each name,
+        but the cached search strings, and the n-gram index used with
+        `approximate`, are shared among all of the names. With `workers`,
+        the scoring for all of the names is queued to the worker processes
+        at once.
+
+        .. versionadded:: 2.3
+
+        Parameters
+        ----------
+        names
+
+            iterable of |str| -- Object names for |fuzzywuzzy|_
+            pattern matching
+
+        thresh, with_index, with_score, approximate, limit, workers, scorer
+
+            As for :meth:`~Inventory.suggest`
+
+        Returns
+        -------
+        res_d
+
+            |dict| -- For each distinct name in `names`, in order of first
+            appearance, the |list| that :meth:`~Inventory.suggest` would
+            return for it
 
-        # Return based on flags
+        """
+        results = self.suggest_corpus.search_many(
+            names,
+            thresh,
+            approximate=approximate,
+            limit=limit,
+            workers=workers,
+            scorer=scorer,
+        )
+
+        return {
+            name: self._suggest_output(res, with_index, with_score)
+            for name, res in results.items()
+        }
+
+    @staticmethod
+    def _suggest_output(results, with_index, with_score):
+        """Select the requested fields of (rst, score, index) suggest results."""
         if with_score:
             if with_index:
                 return results
@@ -553,14 +873,23 @@ class Inventory:
                 return [tup[0] for tup in results]
 
     def _general_import(self):
-        """Attempt sequence of all imports."""
+        """Import from a source whose type is detected from its contents.
+
+        |bytes| and file sources are read only once; the format is
+        identified by :func:`~sphobjinv.fileops.sniffbytes` and the data
+        passed directly to the matching importer. Files are memory-mapped
+        with :func:`~sphobjinv.fileops.mapbytes`.
+
+        """
         # Lookups for method names and expected import-failure errors
         importers = {
             SourceTypes.BytesPlaintext: self._import_plaintext_bytes,
             SourceTypes.BytesZlib: self._import_zlib_bytes,
-            SourceTypes.FnamePlaintext: self._import_plaintext_fname,
-            SourceTypes.FnameZlib: self._import_zlib_fname,
+            SourceTypes.FnamePlaintext: self._import_plaintext_bytes,
+            SourceTypes.FnameZlib: self._import_zlib_bytes,
             SourceTypes.DictJSON: self._import_json_dict,
+            SourceTypes.BytesBinary: self._import_binary_bytes,
+            SourceTypes.FnameBinary: self._import_binary_bytes,
         }
         import_errors = {
             SourceTypes.BytesPlaintext: TypeError,
@@ -568,16 +897,37 @@ class Inventory:
             SourceTypes.FnamePlaintext: (OSError, TypeError, UnicodeDecodeError),
             SourceTypes.FnameZlib: (OSError, TypeError, zlib_error),
             SourceTypes.DictJSON: (ValidationError),
+            SourceTypes.BytesBinary: ValueError,
+            SourceTypes.FnameBinary: (OSError, ValueError),
         }
 
-        # Attempt series of import approaches
-        # Enum keys are ordered, so iteration is too.
-        for st in SourceTypes:
-            if st not in importers:
-                # No action for source types w/o a handler function defined.
-                continue
+        src = self._source
 
-            if self._try_import(importers[st], self._source, import_errors[st]):
+        with ExitStack() as stack:
+            if isinstance(src, dict):
+                st = SourceTypes.DictJSON
+            elif isinstance(src, (bytes, bytearray)):
+                st = sniffbytes(src)
+            else:
+                # Anything else must be a path to a file
+                try:
+                    src = stack.enter_context(mapbytes(src))
+                except (OSError, TypeError) as e:
+                    raise TypeError("Invalid Inventory source type") from e
+
+                st = {
+                    SourceTypes.BytesPlaintext: SourceTypes.FnamePlaintext,
+                    SourceTypes.BytesZlib: SourceTypes.FnameZlib,
+                    SourceTypes.BytesBinary: SourceTypes.FnameBinary,
+                }.get(sniffbytes(src))
+
+            # JSON is only importable here as an already-deserialized dict
+            if st is SourceTypes.DictJSON and not isinstance(src, dict):
+                st = None
+
+            if st is not None and self._try_import(
+                importers[st], src, import_errors[st]
+            ):
                 self.source_type = st
                 return
 
@@ -601,21 +951,52 @@ class Inventory:
 
         return True
 
-    def _import_plaintext_bytes(self, b_str):
-        """Import an inventory from plaintext UTF-8 bytes."""
+    @staticmethod
+    def _parse_header(b_str):
+        """Extract the project and version from the plaintext header."""
         b_res = pb_project.search(b_str).group(HeaderFields.Project.value)
         project = b_res.decode("utf-8")
 
         b_res = pb_version.search(b_str).group(HeaderFields.Version.value)
         version = b_res.decode("utf-8")
 
-        def gen_dataobjs():
-            """Generate a data object for each line in the inventory."""
-            for mch in pb_data.finditer(b_str):
-                yield DataObjStr(**mch.groupdict())
+        return project, version
 
-        objects = []
-        objects.extend(gen_dataobjs())
+    def _import_plaintext_bytes(self, b_str):
+        """Import an inventory from plaintext UTF-8 bytes, or a memory map."""
+        project, version = self._parse_header(b_str)
+
+        if self._lazy:
+            # Only record where each data line starts; the objects
+            # are built from the buffer when first accessed, so it
+            # must be kept as bytes, rather than as a mapping that
+            # will be closed
+            b_str = bytes(b_str)
+            objects = LazyObjects(b_str, array("Q", data_line_offsets(b_str)))
+        else:
+            objects = [DataObjStr(*fields) for fields in iter_data_lines(b_str)]
+
+        if len(objects) == 0:
+            raise TypeError("No objects found in plaintext")
+
+        return project, version, objects
+
+    def _import_plaintext_lines(self, lines):
+        """Import an inventory from an iterable of plaintext UTF-8 lines.
+
+        Each object is built as its line arrives, so the full
+        plaintext is never held in memory.
+
+        """
+        lines = iter(lines)
+        header = list(islice(lines, 4))
+        project, version = self._parse_header(b"\n".join(header))
+
+        objects = [
+            DataObjStr(*fields)
+            for fields in map(parse_data_line, chain(header, lines))
+            if fields is not None
+        ]
 
         if len(objects) == 0:
             raise TypeError("No objects found in plaintext")
@@ -623,23 +1004,40 @@ class Inventory:
         return project, version, objects
 
     def _import_zlib_bytes(self, b_str):
-        """Import a zlib-compressed inventory."""
-        b_plain = decompress(b_str)
-        p, v, o = self._import_plaintext_bytes(b_plain)
+        """Import a zlib-compressed inventory.
+
+        `b_str` may also be a memory map or a binary stream.
 
-        return p, v, o
+        """
+        if self._lazy:
+            # Lazy objects need the whole plaintext as one buffer
+            return self._import_plaintext_bytes(b"".join(decompress_blocks(b_str)))
+
+        return self._import_plaintext_lines(decompress_lines(b_str))
 
     def _import_plaintext_fname(self, fn):
         """Import a plaintext inventory file."""
-        b_plain = readbytes(fn)
-
-        return self._import_plaintext_bytes(b_plain)
+        with mapbytes(fn) as m:
+            return self._import_plaintext_bytes(m)
 
     def _import_zlib_fname(self, fn):
         """Import a zlib-compressed inventory file."""
-        b_zlib = readbytes(fn)
+        with mapbytes(fn) as m:
+            return self._import_zlib_bytes(m)
+
+    def _import_binary_bytes(self, b):
+        """Import a binary inventory, or a memory map of one."""
+        project, version, objects = decode_binary(b)
+
+        if len(objects) == 0:
+            raise ValueError("No objects found in binary inventory")
+
+        return project, version, objects
 
-        return self._import_zlib_bytes(b_zlib)
+    def _import_binary_fname(self, fn):
+        """Import a binary inventory file."""
+        with mapbytes(fn) as m:
+            return self._import_binary_bytes(m)
 
     def _import_url(self, url):
         """Import a file from a remote URL."""
@@ -647,17 +1045,48 @@ class Inventory:
         # someplace safe/sane!
         req = urlrq.Request(url, headers={"User-Agent": "sphobjinv URL/" + soi_version})
         resp = urlrq.urlopen(req, context=self._sslcontext)  # noqa: S310
-        b_str = resp.read()
 
-        # Plaintext URL D/L is unreliable; zlib only
-        return self._import_zlib_bytes(b_str)
+        # Plaintext URL D/L is unreliable; zlib only.
+        # Decompress straight from the response stream, rather than
+        # first reading the whole compressed payload into memory.
+        return self._import_zlib_bytes(resp)
+
+    @staticmethod
+    def _is_json_dict(d):
+        """Check whether `d` is a valid dict for import, without jsonschema.
+
+        Specialized to the flat layout of
+        :data:`~sphobjinv.schema.json_schema`. Stricter than the schema in
+        a few corner cases (e.g., |str| subclasses), so |False| only means
+        that full validation is needed.
+
+        """
+        if not isinstance(d, dict):
+            return False
+
+        for key, value in d.items():
+            if key in _JSON_HEADER_TYPES:
+                if not _JSON_HEADER_TYPES[key](value):
+                    return False
+            elif not (
+                type(key) is str
+                and key[:1] in _JSON_DIGITS
+                and type(value) is dict
+                and value.keys() == _JSON_OBJ_KEYS
+                and all(type(v) is str for v in value.values())
+            ):
+                return False
+
+        return all(hf.value in d for hf in _JSON_REQUIRED)
 
     def _import_json_dict(self, d):
         """Import flat-dict composited data."""
-        # Validate the dict against the schema. Schema
-        # WILL allow an inventory with no objects here
-        val = jsonschema.Draft4Validator(json_schema)
-        val.validate(d)
+        # Validate the dict against the schema, resorting to the full
+        # validator only if the quick check fails, so that any error
+        # raised is the one it reports. Schema WILL allow an inventory
+        # with no objects here
+        if self._validate and not self._is_json_dict(d):
+            self._json_validator.validate(d)
 
         # Pull header items first
         project = d[HeaderFields.Project.value]
@@ -668,14 +1097,12 @@ class Inventory:
         if count < 1:
             raise ValueError("Import of zero-length inventory")
 
-        # Going to destructively process d, so shallow-copy it first
-        d = d.copy()
-
-        # Expecting the dict to be indexed by string integers
+        # Expecting the dict to be indexed by string integers.
+        # The schema guarantees the values are all str
         objects = []
         for i in range(count):
             try:
-                objects.append(DataObjStr(**d.pop(str(i))))
+                objects.append(DataObjStr._from_str(**d[str(i)]))
             except KeyError as e:
                 if self._count_error:
                     err_str = (
@@ -683,10 +1110,14 @@ class Inventory:
                     )
                     raise ValueError(err_str) from e
 
-        # Complain if remaining objects are anything other than the
-        # valid inventory-level header keys
+        # Complain if any keys are anything other than the objects
+        # just imported and the valid inventory-level header keys
         hf_values = {e.value for e in HeaderFields}
-        check_value = self._count_error and set(d.keys()).difference(hf_values)
+        check_value = (
+            self._count_error
+            and len(d) > count + len(hf_values.intersection(d))
+            and set(d.keys()).difference(hf_values, map(str, range(count)))
+        )
         if check_value:
             # A truthy value here will be the contents
             # of the above set difference
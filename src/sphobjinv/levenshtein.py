@@ -0,0 +1,345 @@
+r"""*Bit-parallel edit-distance scoring for* :meth:`Inventory.suggest`.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (bskinn@alum.mit.edu)
+
+**File Created**
+    17 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2022
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/latest
+
+**License**
+    The MIT License; see |license_txt|_ for full license terms
+
+The ratios here are computed from the insertion/deletion edit distance
+between two strings, as were those of |python-Levenshtein|_, rather than
+from the matching blocks found by :class:`difflib.SequenceMatcher`. For
+strings of lengths :math:`m` and :math:`n`, that distance is
+:math:`m + n - 2L`, where :math:`L` is the length of their longest common
+subsequence, and the ratio is :math:`2L / (m + n)`.
+
+:math:`L` is computed with the bit-parallel algorithm of Hyyrö
+(after Allison and Dix, and Myers), which holds one bit per character of
+a :class:`Pattern` in a Python |int| and processes each character of the
+other string with a handful of integer operations, however long the
+pattern is. The per-character bitmasks of a pattern are computed once and
+reused for every string compared against it.
+
+**Members**
+
+"""
+
+from sphobjinv._vendored.fuzzywuzzy import fuzz
+
+
+class Pattern:
+    r"""String prepared for repeated bit-parallel comparison.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    text
+
+        |str| -- String to compare other strings against
+
+    **Members**
+
+    """
+
+    __slots__ = ("text", "_masks", "_full")
+
+    def __init__(self, text):
+        """Compute the bitmask of the positions of each character in `text`."""
+        #: |str| pattern text
+        self.text = text
+
+        masks = {}
+        bit = 1
+        for ch in text:
+            masks[ch] = masks.get(ch, 0) | bit
+            bit <<= 1
+
+        self._masks = masks
+        self._full = bit - 1
+
+    def __len__(self):
+        """Return the length of the pattern text."""
+        return len(self.text)
+
+    def lcs(self, s):
+        """Return the length of the longest common subsequence with `s`.
+
+        Parameters
+        ----------
+        s
+
+            |str| -- String to compare
+
+        Returns
+        -------
+        n
+
+            |int| -- Length of the longest common subsequence of the pattern
+            text and `s`
+
+        """
+        masks = self._masks
+        full = self._full
+
+        # Zero bits of v mark the pattern positions of one longest
+        # common subsequence of the pattern and the text seen so far
+        v = full
+        for ch in s:
+            m = masks.get(ch)
+            if m:
+                u = v & m
+                v = ((v + u) | (v - u)) & full
+
+        return len(self.text) - bin(v).count("1")
+
+    def ratio(self, s):
+        r"""Return the similarity of `s` to the pattern text, from 0 to 100.
+
+        Parameters
+        ----------
+        s
+
+            |str| -- String to compare
+
+        Returns
+        -------
+        r
+
+            |int| -- :math:`100 \cdot 2L / (m + n)`, rounded down, for
+            :meth:`lcs` length :math:`L` and string lengths :math:`m`
+            and :math:`n`
+
+        """
+        lensum = len(self.text) + len(s)
+        if not lensum:
+            return 100
+
+        return int(100 * (2.0 * self.lcs(s) / lensum))
+
+    def partial_ratio(self, s):
+        """Return the best ratio of the shorter string to any part of the longer.
+
+        Each substring of the longer string that is as long as the
+        shorter string is compared, and the best :meth:`ratio` returned.
+        Unlike |fuzzywuzzy|_, which compares only the substrings aligned
+        with blocks of matching characters, every substring is considered.
+
+        If `s` is the shorter string, the substrings of the pattern text are
+        compared using the bitmasks of the pattern, so that no new
+        :class:`Pattern` is prepared.
+
+        Parameters
+        ----------
+        s
+
+            |str| -- String to compare
+
+        Returns
+        -------
+        r
+
+            |int| -- Best ratio, from 0 to 100
+
+        """
+        m = len(self.text)
+        if len(s) < m:
+            return self._partial_ratio_shorter(s)
+        if not m:
+            return 100
+
+        masks = self._masks
+        last = len(s) - m
+
+        best = 0
+        for start in range(last + 1):
+            # A window starting with a character not in the pattern
+            # matches no better than the window one further along
+            if start < last and s[start] not in masks:
+                continue
+
+            end = start + m
+            n = self.lcs(s[start:end])
+            if n > best:
+                best = n
+                if best / m > 0.995:
+                    return 100
+
+        return int(100 * (best / m))
+
+    def _partial_ratio_shorter(self, s):
+        """Return the :meth:`partial_ratio` of a string shorter than the pattern.
+
+        Each substring of the pattern text is compared with the pattern
+        bitmasks of the characters of `s`, shifted to the start of the
+        substring.
+
+        """
+        m = len(s)
+        if not m:
+            return 100
+
+        masks = self._masks
+        s_masks = [masks[ch] for ch in s if ch in masks]
+        s_chars = frozenset(s)
+        full = (1 << m) - 1
+        text = self.text
+        last = len(text) - m
+
+        best = 0
+        for start in range(last + 1):
+            # As in partial_ratio, with the roles of the strings swapped
+            if start < last and text[start] not in s_chars:
+                continue
+
+            v = full
+            for b in s_masks:
+                u = v & (b >> start)
+                v = ((v + u) | (v - u)) & full
+
+            n = m - bin(v).count("1")
+            if n > best:
+                best = n
+                if best / m > 0.995:
+                    return 100
+
+        return int(100 * (best / m))
+
+
+def ratio(s1, s2):
+    """Return the :meth:`Pattern.ratio` of two strings.
+
+    .. versionadded:: 2.3
+
+    """
+    return Pattern(s1).ratio(s2)
+
+
+def partial_ratio(s1, s2):
+    """Return the :meth:`Pattern.partial_ratio` of two strings.
+
+    .. versionadded:: 2.3
+
+    """
+    return Pattern(s1).partial_ratio(s2)
+
+
+def _tokens(p):
+    """Return the sorted, space-joined tokens and the token set of `p`.
+
+    Shared with the scorers of :mod:`sphobjinv.suggest`, which import this
+    module, and so cannot be imported from there.
+
+    """
+    tokens = fuzz.REG_TOKEN.findall(p)
+    return " ".join(sorted(tokens)).strip(), frozenset(tokens)
+
+
+class Scorer:
+    r"""Weighted edit-distance scorer for one processed query.
+
+    Combines ratios exactly as the |fuzzywuzzy|_ ``WRatio`` scorer does
+    (see :func:`sphobjinv.suggest.score`), but computes each one with
+    :class:`Pattern` instead of :class:`difflib.SequenceMatcher`. The
+    patterns for the query, and for its sorted tokens, are prepared once,
+    when the scorer is created.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    query
+
+        |str| -- Processed query (see :func:`sphobjinv.suggest.process`)
+
+    **Members**
+
+    """
+
+    __slots__ = ("query", "_pattern", "_sorted", "_tokens")
+
+    def __init__(self, query):
+        """Prepare the patterns for `query`."""
+        #: |str| processed query
+        self.query = query
+
+        q_sorted, self._tokens = _tokens(query)
+        self._pattern = Pattern(query)
+        self._sorted = Pattern(q_sorted)
+
+    def __call__(self, p, tokens=None):
+        """Score the match of a processed string to the query, from 0 to 100.
+
+        Parameters
+        ----------
+        p
+
+            |str| -- Processed string
+
+        tokens
+
+            |tuple| *(optional)* -- The tokens of `p` sorted and joined
+            with spaces, and the |frozenset| of its tokens, if already known
+            (see :func:`sphobjinv.suggest.features`)
+
+        Returns
+        -------
+        s
+
+            |int| -- Match quality, from 0 to 100
+
+        """
+        query = self.query
+        if not query or not p:
+            return 0
+
+        if tokens is None:
+            tokens = _tokens(p)
+        p_sorted, p_tokens = tokens
+
+        len_ratio = max(len(query), len(p)) / min(len(query), len(p))
+        base = self._pattern.ratio(p)
+
+        if len_ratio < 1.5:
+            return int(
+                max(
+                    base,
+                    self._sorted.ratio(p_sorted) * 0.95,
+                    self._token_set(p_tokens) * 0.95,
+                )
+            )
+
+        partial_scale = 0.6 if len_ratio > 8 else 0.9
+
+        return int(
+            max(
+                base,
+                self._pattern.partial_ratio(p) * partial_scale,
+                self._sorted.partial_ratio(p_sorted) * 0.95 * partial_scale,
+                self._token_set(p_tokens) * 0.95 * partial_scale,
+            )
+        )
+
+    def _token_set(self, tokens):
+        """Compare the shared and remaining tokens of a string and the query."""
+        sect = " ".join(sorted(self._tokens & tokens))
+        q_rest = (sect + " " + " ".join(sorted(self._tokens - tokens))).strip()
+        p_rest = (sect + " " + " ".join(sorted(tokens - self._tokens))).strip()
+
+        pattern = Pattern(sect.strip())
+        return max(pattern.ratio(q_rest), pattern.ratio(p_rest), ratio(q_rest, p_rest))
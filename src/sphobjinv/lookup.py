@@ -0,0 +1,626 @@
+r"""*Exact-match lookup index for inventory objects*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (bskinn@alum.mit.edu)
+
+**File Created**
+    17 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2022
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/latest
+
+**License**
+    The MIT License; see |license_txt|_ for full license terms
+
+**Members**
+
+"""
+
+from bisect import bisect_left, bisect_right
+
+import attr
+
+
+@attr.s(slots=True, eq=False)
+class ObjectsIndex:
+    r"""Base class for indexes over a sequence of inventory objects.
+
+    If `objects` is an :class:`~sphobjinv.objects.ObjectList` or a
+    :class:`~sphobjinv.objects.LazyObjects`, as
+    :attr:`Inventory.objects <sphobjinv.inventory.Inventory.objects>`
+    always is, the index registers as an observer of it, and is updated in
+    place as objects are added to and removed from it, at a cost that
+    depends only on the number of objects changed.
+
+    For any other sequence, the index reflects `objects` as they were
+    when it was built. Changes to the fields of an indexed object are
+    never detected.
+
+    Subclasses implement ``_add(objs)`` and ``_remove(objs)``, and may
+    override ``_build()`` to index the initial objects more efficiently
+    than by adding them one at a time.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    objects
+
+        sequence of |DataObjStr| -- Objects to index
+
+    **Members**
+
+    """
+
+    #: Sequence of |DataObjStr| that was indexed
+    objects = attr.ib(repr=False)
+
+    #: :attr:`~sphobjinv.objects.ObjectList.version` of :attr:`objects`
+    #: as last indexed, or |None| if it does not track its changes
+    version = attr.ib(init=False, default=None)
+
+    def __attrs_post_init__(self):
+        """Index the objects."""
+        self.version = getattr(self.objects, "version", None)
+        self._build()
+
+        if self.version is not None:
+            self.objects.add_observer(self)
+
+    def _build(self):
+        """Index the initial contents of :attr:`objects`."""
+        self._add(self.objects)
+
+    def _add(self, objs):  # pragma: no cover
+        """Index objects."""
+        raise NotImplementedError
+
+    def _remove(self, objs):  # pragma: no cover
+        """Drop objects from the index."""
+        raise NotImplementedError
+
+    def objects_changed(self, removed, added):
+        """Update the index for changes to :attr:`objects`.
+
+        Called by :attr:`objects`, if it tracks its changes.
+
+        Parameters
+        ----------
+        removed
+
+            sequence of |DataObjStr| -- Objects removed from :attr:`objects`
+
+        added
+
+            sequence of |DataObjStr| -- Objects added to :attr:`objects`
+
+        """
+        self._remove(removed)
+        self._add(added)
+        self.version = self.objects.version
+
+    @property
+    def stale(self):
+        """|bool| indicating whether :attr:`objects` has changed since indexing.
+
+        Always |False| if :attr:`objects` does not track its changes,
+        or once the index has been updated for the latest change.
+
+        """
+        return self.version is not None and self.objects.version != self.version
+
+
+@attr.s(slots=True, eq=False)
+class _HashIndex(ObjectsIndex):
+    """Index of objects by one key in each of several hash tables.
+
+    Subclasses set ``_n_tables`` and implement ``_keys(obj)``, returning
+    the key of `obj` in each table.
+
+    """
+
+    _n_tables = 0
+
+    # Each table maps a key to an insertion-ordered dict of the objects
+    # under that key, by id(), so that any object can be removed in
+    # constant time. The same object appearing more than once in the
+    # list is indexed once, with its extra occurrences counted in _repeats.
+    _tables = attr.ib(init=False, default=(), repr=False)
+    _repeats = attr.ib(init=False, factory=dict, repr=False)
+
+    def _keys(self, obj):  # pragma: no cover
+        """Return the key of `obj` in each table."""
+        raise NotImplementedError
+
+    def _build(self):
+        """Create the tables, and index the initial objects."""
+        self._tables = tuple({} for _ in range(self._n_tables))
+        self._add(self.objects)
+
+    def _add(self, objs):
+        """Index objects."""
+        tables = self._tables
+        first = tables[0]
+        keys_of = self._keys
+        repeats = self._repeats
+
+        for obj in objs:
+            oid = id(obj)
+            keys = keys_of(obj)
+
+            if oid in first.get(keys[0], ()):
+                repeats[oid] = repeats.get(oid, 0) + 1
+                continue
+
+            for table, key in zip(tables, keys):
+                table.setdefault(key, {})[oid] = obj
+
+    def _remove(self, objs):
+        """Drop objects from the index."""
+        repeats = self._repeats
+
+        for obj in objs:
+            oid = id(obj)
+
+            if oid in repeats:
+                repeats[oid] -= 1
+                if not repeats[oid]:
+                    del repeats[oid]
+                continue
+
+            for table, key in zip(self._tables, self._keys(obj)):
+                bucket = table.get(key, {})
+                bucket.pop(oid, None)
+                if not bucket:
+                    table.pop(key, None)
+
+    def _found(self, table, key):
+        """Return a |list| of the objects in table number `table` under `key`."""
+        bucket = self._tables[table].get(key, {})
+        if not self._repeats:
+            return list(bucket.values())
+
+        return [
+            obj
+            for obj in bucket.values()
+            for _ in range(1 + self._repeats.get(id(obj), 0))
+        ]
+
+
+@attr.s(slots=True, eq=False)
+class InventoryIndex(_HashIndex):
+    r"""Hash index of inventory objects by name, domain, and role.
+
+    Built in one pass over `objects`; all lookups are then constant-time.
+    Where an inventory holds more than one object with the same
+    name, domain, and role, all of them are indexed, in inventory order.
+
+    Kept up to date as described for :class:`ObjectsIndex`. Objects added
+    after the index was built are listed after those already indexed,
+    wherever they are in the list. Reordering the list does not change
+    the index.
+
+    Usually obtained from
+    :attr:`Inventory.index <sphobjinv.inventory.Inventory.index>`,
+    which rebuilds the index as needed.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    objects
+
+        sequence of |DataObjStr| -- Objects to index
+
+    **Members**
+
+    """
+
+    _n_tables = 3
+
+    def _keys(self, obj):
+        """Index by (name, domain, role), by name, and by (domain, role)."""
+        name, domain, role = obj.name, obj.domain, obj.role
+        return (name, domain, role), name, (domain, role)
+
+    def get(self, name, domain, role, default=None):
+        """Return the object with the given name, domain, and role.
+
+        Parameters
+        ----------
+        name
+
+            |str| -- Object name
+
+        domain
+
+            |str| -- Object domain
+
+        role
+
+            |str| -- Object role
+
+        default
+
+            *(optional)* -- Value to return if there is no such object
+
+        Returns
+        -------
+        obj
+
+            |DataObjStr| -- The first matching object in the inventory,
+            or `default` if there is none
+
+        """
+        bucket = self._tables[0].get((name, domain, role))
+        if bucket:
+            return next(iter(bucket.values()))
+
+        return default
+
+    def get_all(self, name, domain, role):
+        """Return all objects with the given name, domain, and role.
+
+        Returns
+        -------
+        objs
+
+            |list| of |DataObjStr| -- Matching objects, in inventory order
+
+        """
+        return self._found(0, (name, domain, role))
+
+    def by_name(self, name):
+        """Return all objects with the given name, in any domain and role.
+
+        Returns
+        -------
+        objs
+
+            |list| of |DataObjStr| -- Matching objects, in inventory order
+
+        """
+        return self._found(1, name)
+
+    def by_domain_role(self, domain_role):
+        """Return all objects with the given domain and role.
+
+        Parameters
+        ----------
+        domain_role
+
+            |str| -- Domain and role, as ``domain:role`` (e.g., ``py:class``)
+
+        Returns
+        -------
+        objs
+
+            |list| of |DataObjStr| -- Matching objects, in inventory order
+
+        """
+        domain, _, role = domain_role.partition(":")
+
+        return self._found(2, (domain, role))
+
+
+def _relative(url, base_url):
+    """Strip `base_url` from the start of `url`, or return |None| if absent."""
+    if not base_url:
+        return url
+
+    if not base_url.endswith("/"):
+        base_url += "/"
+
+    if not url.startswith(base_url):
+        return None
+
+    start = len(base_url)
+    return url[start:]
+
+
+@attr.s(slots=True, eq=False)
+class UriIndex(_HashIndex):
+    r"""Reverse index of inventory objects by the URI they point to.
+
+    Objects are indexed by their full expanded URI (see
+    :attr:`~sphobjinv.data.SuperDataObj.uri_expanded`), by the page
+    that URI refers to (without any ``#`` fragment), and by the
+    anchor (the fragment itself). All lookups are constant-time.
+
+    The URIs in an inventory are relative to the root of the documentation
+    set. URLs passed to :meth:`lookup` and :meth:`on_page` may instead be
+    absolute, in which case the `base_url` of the documentation must also
+    be given; URLs that are not beneath `base_url` match no objects.
+
+    Kept up to date as described for :class:`ObjectsIndex`, with
+    results in the same order as for :class:`InventoryIndex`.
+
+    Usually obtained from
+    :attr:`Inventory.uri_index <sphobjinv.inventory.Inventory.uri_index>`,
+    which rebuilds the index as needed.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    objects
+
+        sequence of |DataObjStr| -- Objects to index
+
+    **Members**
+
+    """
+
+    _n_tables = 3
+
+    def _keys(self, obj):
+        """Index by expanded URI, by page, and by anchor."""
+        uri = obj.uri_expanded
+        page, _, anchor = uri.partition("#")
+        return uri, page, anchor
+
+    def lookup(self, url, base_url=None):
+        """Return all objects pointing to exactly the given URL.
+
+        Parameters
+        ----------
+        url
+
+            |str| -- URL, including any ``#`` fragment
+
+        base_url
+
+            |str| *(optional)* -- URL of the root of the documentation,
+            if `url` is absolute
+
+        Returns
+        -------
+        objs
+
+            |list| of |DataObjStr| -- Matching objects, in inventory order
+
+        """
+        url = _relative(url, base_url)
+
+        return [] if url is None else self._found(0, url)
+
+    def on_page(self, url, base_url=None):
+        """Return all objects pointing anywhere on the page at the given URL.
+
+        Any ``#`` fragment of `url` is ignored.
+
+        Parameters
+        ----------
+        url
+
+            |str| -- URL of the page
+
+        base_url
+
+            |str| *(optional)* -- URL of the root of the documentation,
+            if `url` is absolute
+
+        Returns
+        -------
+        objs
+
+            |list| of |DataObjStr| -- Matching objects, in inventory order
+
+        """
+        url = _relative(url, base_url)
+
+        return [] if url is None else self._found(1, url.partition("#")[0])
+
+    def by_anchor(self, anchor):
+        """Return all objects pointing to the given anchor, on any page.
+
+        Parameters
+        ----------
+        anchor
+
+            |str| -- Anchor, with or without a leading ``#``
+
+        Returns
+        -------
+        objs
+
+            |list| of |DataObjStr| -- Matching objects, in inventory order
+
+        """
+        if anchor.startswith("#"):
+            anchor = anchor[1:]
+
+        return self._found(2, anchor)
+
+
+@attr.s(slots=True, eq=False)
+class PrefixIndex(ObjectsIndex):
+    r"""Sorted index of inventory objects by name, for prefix queries.
+
+    Holds the objects sorted by name, so that those whose names start with
+    a given prefix are found by binary search, in time logarithmic in the
+    size of the inventory plus linear in the number of results.
+
+    Kept up to date as described for :class:`ObjectsIndex`; each object
+    added to or removed from the inventory costs one binary search and one
+    insertion or deletion in a |list|.
+
+    Usually obtained from
+    :attr:`Inventory.prefix_index <sphobjinv.inventory.Inventory.prefix_index>`,
+    which rebuilds the index as needed.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    objects
+
+        sequence of |DataObjStr| -- Objects to index
+
+    **Members**
+
+    """
+
+    # Object names in sorted order, and the objects in the same order
+    _names = attr.ib(init=False, factory=list, repr=False)
+    _objs = attr.ib(init=False, factory=list, repr=False)
+
+    def _build(self):
+        """Sort the initial contents of :attr:`objects` by name."""
+        objs = list(self.objects)
+        names = [obj.name for obj in objs]
+        order = sorted(range(len(names)), key=names.__getitem__)
+
+        self._names = [names[i] for i in order]
+        self._objs = [objs[i] for i in order]
+
+    def _add(self, objs):
+        """Insert objects at their sorted positions."""
+        for obj in objs:
+            pos = bisect_right(self._names, obj.name)
+            self._names.insert(pos, obj.name)
+            self._objs.insert(pos, obj)
+
+    def _remove(self, objs):
+        """Drop objects from their sorted positions."""
+        names = self._names
+        for obj in objs:
+            pos = bisect_left(names, obj.name)
+            while pos < len(names) and names[pos] == obj.name:
+                if self._objs[pos] is obj:
+                    del names[pos]
+                    del self._objs[pos]
+                    break
+                pos += 1
+
+    def complete(self, prefix, *, domain=None, role=None, limit=None):
+        """Return the objects whose names start with a prefix.
+
+        Parameters
+        ----------
+        prefix
+
+            |str| -- Leading portion of the object names
+
+        domain
+
+            |str| *(optional)* -- Only return objects in this domain
+
+        role
+
+            |str| *(optional)* -- Only return objects with this role
+
+        limit
+
+            |int| *(optional)* -- Maximum number of objects to return
+
+        Returns
+        -------
+        objs
+
+            |list| of |DataObjStr| -- Matching objects, sorted by name
+
+        """
+        names = self._names
+        objs = self._objs
+        end = len(names)
+        pos = bisect_left(names, prefix)
+        out = []
+
+        while pos < end and names[pos].startswith(prefix):
+            if limit is not None and len(out) >= limit:
+                break
+
+            obj = objs[pos]
+            if (domain is None or obj.domain == domain) and (
+                role is None or obj.role == role
+            ):
+                out.append(obj)
+            pos += 1
+
+        return out
+
+    def children(self, prefix, *, sep=".", domain=None, role=None, limit=None):
+        """Return the distinct completions of a prefix up to the next separator.
+
+        For example, with a `prefix` of ``"numpy.linalg."``, returns
+        ``"numpy.linalg.norm"`` for an object named ``numpy.linalg.norm``,
+        and ``"numpy.linalg.lapack_lite"`` (once) for any number of objects
+        named ``numpy.linalg.lapack_lite.*``. Each distinct completion costs
+        one binary search, however many objects lie beneath it.
+
+        Parameters
+        ----------
+        prefix
+
+            |str| -- Leading portion of the object names
+
+        sep
+
+            |str| *(optional)* -- Separator between name segments
+
+        domain
+
+            |str| *(optional)* -- Only consider objects in this domain
+
+        role
+
+            |str| *(optional)* -- Only consider objects with this role
+
+        limit
+
+            |int| *(optional)* -- Maximum number of completions to return
+
+        Returns
+        -------
+        names
+
+            |list| of |str| -- Completions, sorted by name
+
+        """
+        names = self._names
+        objs = self._objs
+        end = len(names)
+        pos = bisect_left(names, prefix)
+        n = len(prefix)
+        out = []
+        seen = set()
+
+        # Appended to a segment, sorts after every name within it
+        past = sep[:-1] + chr(ord(sep[-1]) + 1)
+
+        while pos < end and names[pos].startswith(prefix):
+            if limit is not None and len(out) >= limit:
+                break
+
+            name = names[pos]
+            obj = objs[pos]
+            if (domain is not None and obj.domain != domain) or (
+                role is not None and obj.role != role
+            ):
+                pos += 1
+                continue
+
+            cut = name.find(sep, n)
+            segment = name if cut < 0 else name[:cut]
+            if segment not in seen:
+                seen.add(segment)
+                out.append(segment)
+
+            if cut < 0:
+                pos += 1
+            else:
+                # Skip every name within the segment, which all
+                # sort together as sharing the same prefix
+                pos = bisect_left(names, segment + past, pos)
+
+        return out
@@ -0,0 +1,366 @@
+r"""*Containers for the data objects of an* |Inventory|.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (bskinn@alum.mit.edu)
+
+**File Created**
+    17 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2022
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/latest
+
+**License**
+    The MIT License; see |license_txt|_ for full license terms
+
+**Members**
+
+"""
+
+from collections.abc import MutableSequence, Sequence
+from weakref import WeakSet
+
+from sphobjinv.data import DataObjStr
+from sphobjinv.parse import parse_data_line_at
+
+
+class LazyObjects(MutableSequence):
+    r"""|list|-like sequence of |DataObjStr| built on demand.
+
+    Holds the plaintext |bytes| of an inventory and the offset of each
+    data line within it. A |DataObjStr| is only constructed when its
+    index is first accessed; it is then cached, so repeated access
+    returns the same instance and in-place edits to it persist.
+
+    Operations that need only the object count
+    (e.g., :attr:`Inventory.count <sphobjinv.inventory.Inventory.count>`)
+    never construct any objects.
+
+    The first mutation of the sequence itself (assignment, deletion,
+    insertion, sorting, etc.) constructs all remaining objects, after which
+    the instance behaves exactly as a |list| and the plaintext buffer
+    is released.
+
+    Instances compare equal to any sequence with equal contents,
+    including a plain |list|.
+
+    Modifications are tracked, and reported to observers,
+    exactly as for :class:`ObjectList`.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    buf
+
+        |bytes| -- Plaintext inventory contents
+
+    offsets
+
+        sequence of |int| -- Start offset within `buf` of each data line,
+        in inventory order
+
+    """
+
+    def __init__(self, buf, offsets):
+        """Initialize the instance."""
+        self._buf = buf
+        self._offsets = offsets
+        self._cache = {}
+
+        #: |list| of all objects, once materialized by a mutation
+        self._items = None
+
+        self._version = 0
+        self._observers = WeakSet()
+
+    def _build(self, idx):
+        """Return the (cached) object at a non-negative index."""
+        try:
+            return self._cache[idx]
+        except KeyError:
+            fields = parse_data_line_at(self._buf, self._offsets[idx])
+            obj = self._cache[idx] = DataObjStr(*fields)
+            return obj
+
+    def _materialize(self):
+        """Construct all objects and switch to plain |list| storage."""
+        if self._items is None:
+            self._items = [self._build(i) for i in range(len(self._offsets))]
+            self._buf = self._offsets = None
+            self._cache = {}
+
+        return self._items
+
+    @property
+    def materialized(self):
+        """|bool| indicating whether all objects have been constructed."""
+        return self._items is not None
+
+    @property
+    def version(self):
+        """|int| count of modifications to the sequence."""
+        return self._version
+
+    def add_observer(self, observer):
+        """Register an object to be notified of changes to the sequence.
+
+        As for :meth:`ObjectList.add_observer`.
+
+        """
+        self._observers.add(observer)
+
+    def remove_observer(self, observer):
+        """Stop notifying an object of changes to the sequence, if registered."""
+        self._observers.discard(observer)
+
+    def _changed(self, removed=(), added=()):
+        """Record a modification and notify all observers."""
+        self._version += 1
+        for observer in list(self._observers):
+            observer.objects_changed(removed, added)
+
+    def __len__(self):
+        """Return the number of objects."""
+        if self._items is not None:
+            return len(self._items)
+
+        return len(self._offsets)
+
+    def __getitem__(self, idx):
+        """Return the object(s) at an index or slice."""
+        if self._items is not None:
+            return self._items[idx]
+
+        if isinstance(idx, slice):
+            return [self._build(i) for i in range(*idx.indices(len(self)))]
+
+        n = len(self._offsets)
+        if idx < 0:
+            idx += n
+        if not 0 <= idx < n:
+            raise IndexError("LazyObjects index out of range")
+
+        return self._build(idx)
+
+    def __iter__(self):
+        """Iterate over the objects, constructing them as needed."""
+        if self._items is not None:
+            return iter(self._items)
+
+        return (self._build(i) for i in range(len(self._offsets)))
+
+    def __setitem__(self, idx, value):
+        """Set the object(s) at an index or slice."""
+        items = self._materialize()
+        if isinstance(idx, slice):
+            removed = items[idx]
+            value = added = list(value)
+        else:
+            removed = [items[idx]]
+            added = [value]
+
+        items[idx] = value
+        self._changed(removed, added)
+
+    def __delitem__(self, idx):
+        """Delete the object(s) at an index or slice."""
+        items = self._materialize()
+        removed = items[idx] if isinstance(idx, slice) else [items[idx]]
+        del items[idx]
+        self._changed(removed)
+
+    def insert(self, idx, value):
+        """Insert an object before an index."""
+        self._materialize().insert(idx, value)
+        self._changed(added=[value])
+
+    def extend(self, values):
+        """Append the objects from an iterable to the end of the sequence."""
+        added = list(values)
+        self._materialize().extend(added)
+        self._changed(added=added)
+
+    def clear(self):
+        """Remove all objects from the sequence."""
+        items = self._materialize()
+        removed = items[:]
+        items.clear()
+        self._changed(removed)
+
+    def reverse(self):
+        """Reverse the sequence in place."""
+        self._materialize().reverse()
+        self._changed()
+
+    def sort(self, *, key=None, reverse=False):
+        """Sort the objects in place, as with :meth:`list.sort`."""
+        self._materialize().sort(key=key, reverse=reverse)
+        self._changed()
+
+    def __eq__(self, other):
+        """Compare contents with another sequence."""
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self):
+        """Return a summary representation, without constructing objects."""
+        return f"<{type(self).__name__}: {len(self)} objects>"
+
+
+class ObjectList(list):
+    r"""|list| of inventory objects that tracks changes to itself.
+
+    Behaves exactly as a |list|, except that every in-place modification
+    (assignment, deletion, insertion, sorting, etc.) increments
+    :attr:`version`. Derived data, such as an
+    :class:`~sphobjinv.lookup.InventoryIndex`, can thus record the version
+    it was built from, and detect that it is stale in constant time.
+
+    Derived data can instead be kept up to date incrementally, by
+    registering as an observer with :meth:`add_observer`. After every
+    modification, each observer's ``objects_changed(removed, added)``
+    method is called with sequences of the objects removed from the list
+    and of those added to it. A reordering of the list
+    (:meth:`sort` or :meth:`reverse`) is reported with both empty.
+    Observers are held by weak reference, and so are dropped once
+    discarded elsewhere.
+
+    Changes to the fields of the objects held in the list are
+    not changes to the list itself, and are not tracked.
+
+    Copies of an instance have no observers.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    iterable
+
+        iterable of |DataObjStr| *(optional)* -- Initial contents
+
+    """
+
+    __slots__ = ("_version", "_observers")
+
+    def __init__(self, iterable=()):
+        """Initialize the instance."""
+        super().__init__(iterable)
+        self._version = 0
+        self._observers = WeakSet()
+
+    def __reduce__(self):
+        """Copy and pickle as a new instance with the same contents."""
+        return type(self), (list(self),)
+
+    @property
+    def version(self):
+        """|int| count of modifications to the list."""
+        return self._version
+
+    def add_observer(self, observer):
+        """Register an object to be notified of changes to the list.
+
+        Parameters
+        ----------
+        observer
+
+            Object with an ``objects_changed(removed, added)`` method
+
+        """
+        self._observers.add(observer)
+
+    def remove_observer(self, observer):
+        """Stop notifying an object of changes to the list, if registered."""
+        self._observers.discard(observer)
+
+    def _changed(self, removed=(), added=()):
+        """Record a modification and notify all observers."""
+        self._version += 1
+        for observer in list(self._observers):
+            observer.objects_changed(removed, added)
+
+    def __setitem__(self, idx, value):
+        """Set the object(s) at an index or slice."""
+        if isinstance(idx, slice):
+            removed = self[idx]
+            value = added = list(value)
+        else:
+            removed = [self[idx]]
+            added = [value]
+
+        super().__setitem__(idx, value)
+        self._changed(removed, added)
+
+    def __delitem__(self, idx):
+        """Delete the object(s) at an index or slice."""
+        removed = self[idx] if isinstance(idx, slice) else [self[idx]]
+        super().__delitem__(idx)
+        self._changed(removed)
+
+    def __iadd__(self, other):
+        """Extend the list in place."""
+        self.extend(other)
+        return self
+
+    def __imul__(self, n):
+        """Repeat the contents of the list in place."""
+        before = self[:]
+        super().__imul__(n)
+        if n > 0:
+            self._changed(added=before * (n - 1))
+        else:
+            self._changed(removed=before)
+        return self
+
+    def append(self, obj):
+        """Append an object to the end of the list."""
+        super().append(obj)
+        self._changed(added=[obj])
+
+    def extend(self, iterable):
+        """Append the objects from an iterable to the end of the list."""
+        added = list(iterable)
+        super().extend(added)
+        self._changed(added=added)
+
+    def insert(self, idx, obj):
+        """Insert an object before an index."""
+        super().insert(idx, obj)
+        self._changed(added=[obj])
+
+    def pop(self, idx=-1):
+        """Remove and return the object at an index (default last)."""
+        obj = super().pop(idx)
+        self._changed(removed=[obj])
+        return obj
+
+    def remove(self, obj):
+        """Remove the first object equal to `obj`."""
+        del self[self.index(obj)]
+
+    def clear(self):
+        """Remove all objects from the list."""
+        removed = self[:]
+        super().clear()
+        self._changed(removed)
+
+    def reverse(self):
+        """Reverse the list in place."""
+        super().reverse()
+        self._changed()
+
+    def sort(self, *, key=None, reverse=False):
+        """Sort the list in place, as with :meth:`list.sort`."""
+        super().sort(key=key, reverse=reverse)
+        self._changed()
@@ -0,0 +1,298 @@
+r"""*Line tokenizer for plaintext* |objects.inv| *data*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (bskinn@alum.mit.edu)
+
+**File Created**
+    17 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2022
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/latest
+
+**License**
+    The MIT License; see |license_txt|_ for full license terms
+
+**Members**
+
+"""
+
+# Byte values matched by \s in a bytes regex
+_WS = frozenset(b" \t\n\r\x0b\x0c")
+_DIGITS = frozenset(b"0123456789")
+_COLON = ord(":")
+_MINUS = ord("-")
+_CR = ord("\r")
+
+
+def _skip_ws(line, pos):
+    """Return the index of the first non-whitespace byte at or after `pos`."""
+    end = len(line)
+    while pos < end and line[pos] in _WS:
+        pos += 1
+
+    return pos
+
+
+def _skip_token(line, pos, stop=_WS):
+    """Return the index of the first byte in `stop` at or after `pos`."""
+    end = len(line)
+    while pos < end and line[pos] not in stop:
+        pos += 1
+
+    return pos
+
+
+def _dispname(line, start, stop):
+    """Parse the display name following the whitespace at ``line[start:stop]``.
+
+    The display name is at least one byte, so if the whitespace runs to the
+    end of the line it gives up its last byte. One trailing CR is dropped.
+
+    """
+    end = len(line)
+
+    if stop < end:
+        dispname = line[stop:]
+    elif stop - start >= 2:
+        dispname = line[-1:]
+    else:
+        return None
+
+    if len(dispname) >= 2 and dispname[-1] == _CR:
+        dispname = dispname[:-1]
+
+    return dispname
+
+
+def _parse_tail(line, pos):
+    """Parse the fields after the name, starting at the domain.
+
+    Returns |None| if the rest of the line is not a valid
+    ``domain:role priority uri dispname`` run.
+
+    """
+    end = len(line)
+    stop_dr = _WS | {_COLON}
+
+    # Domain, up to the colon
+    idx = _skip_token(line, pos, stop_dr)
+    if idx == pos or idx == end or line[idx] != _COLON:
+        return None
+    domain = line[pos:idx]
+
+    # Role, up to whitespace
+    pos = idx + 1
+    idx = _skip_token(line, pos, stop_dr)
+    if idx == pos or idx == end or line[idx] not in _WS:
+        return None
+    role = line[pos:idx]
+
+    # Priority, an optionally negative integer followed by whitespace
+    pos = _skip_ws(line, idx)
+    idx = pos + 1 if pos < end and line[pos] == _MINUS else pos
+    digits = idx
+    while idx < end and line[idx] in _DIGITS:
+        idx += 1
+    if idx == digits or idx == end or line[idx] not in _WS:
+        return None
+    priority = line[pos:idx]
+
+    # URI and display name. Two or more whitespace bytes after the
+    # priority mean the URI is empty.
+    pos = idx
+    idx = _skip_ws(line, pos)
+    if idx - pos >= 2:
+        uri = b""
+        dispname = _dispname(line, pos + 1, idx)
+    else:
+        pos = _skip_token(line, idx)
+        uri = line[idx:pos]
+        dispname = _dispname(line, pos, _skip_ws(line, pos))
+
+    if dispname is None:
+        return None
+
+    return domain, role, priority, uri, dispname
+
+
+def _parse_general(line):
+    """Parse a data line that does not have the simple single-space layout."""
+    end = len(line)
+    idx = 1
+
+    # The name is the shortest prefix that is followed by whitespace and
+    # a valid remainder. All split points within one run of whitespace
+    # leave the same remainder, so only the first of each run is tried.
+    while idx < end:
+        if line[idx] in _WS:
+            pos = _skip_ws(line, idx)
+            tail = _parse_tail(line, pos)
+            if tail is not None:
+                return (line[:idx],) + tail
+            idx = pos
+        else:
+            idx += 1
+
+    return None
+
+
+def _iter_lines(buf):
+    """Generate the lines of a buffer, without their newlines."""
+    if isinstance(buf, bytes):
+        yield from buf.split(b"\n")
+        return
+
+    # Other buffers (e.g., mmap) are walked line by line,
+    # so that their contents are never copied all at once
+    pos = 0
+    while True:
+        end = buf.find(b"\n", pos)
+        if end < 0:
+            yield buf[pos:]
+            return
+        yield buf[pos:end]
+        pos = end + 1
+
+
+def parse_data_line(line):
+    r"""Split one plaintext |objects.inv| data line into its fields.
+
+    The result is identical to that of matching
+    :data:`~sphobjinv.re.pb_data` against the line: the name is the
+    shortest leading portion of the line followed by a valid
+    ``domain:role priority uri dispname`` run, and a trailing CR is
+    not included in the display name.
+
+    Most data lines are single-space delimited with a name containing
+    no whitespace, and are split directly with :meth:`bytes.split`;
+    any other line is scanned one byte at a time.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    line
+
+        |bytes| -- Single line of a plaintext inventory,
+        without its trailing newline
+
+    Returns
+    -------
+    fields
+
+        |tuple| of |bytes| -- The name, domain, role, priority, URI,
+        and display name from the line, in the order of the
+        :class:`~sphobjinv.data.DataFields` members;
+        or |None| if the line is not a valid data line
+
+    """
+    parts = line.split(None, 4)
+
+    # Fast path: exactly one whitespace byte between each field
+    if len(parts) == 5 and sum(map(len, parts)) + 4 == len(line):
+        name, dom_role, priority, uri, dispname = parts
+        domain, _, role = dom_role.partition(b":")
+        digits = priority[1:] if priority[:1] == b"-" else priority
+
+        if domain and role and b":" not in role and digits.isdigit():
+            if len(dispname) >= 2 and dispname[-1] == _CR:
+                dispname = dispname[:-1]
+            return name, domain, role, priority, uri, dispname
+
+    return _parse_general(line)
+
+
+def iter_data_lines(b_str):
+    r"""Generate the fields of each data line in a plaintext inventory.
+
+    Lines that are not valid data lines, including the header
+    comments, are skipped.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    b_str
+
+        |bytes| or :class:`mmap.mmap` -- Plaintext |objects.inv| contents.
+        A memory map is split one line at a time, without first being
+        read into memory in full.
+
+    Yields
+    ------
+    fields
+
+        |tuple| of |bytes| -- Fields of each data line,
+        as returned by :func:`parse_data_line`
+
+    """
+    for line in _iter_lines(b_str):
+        fields = parse_data_line(line)
+        if fields is not None:
+            yield fields
+
+
+def data_line_offsets(b_str):
+    r"""Generate the offset of the start of each data line in a plaintext inventory.
+
+    The data lines identified are the same as those parsed by
+    :func:`iter_data_lines`.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    b_str
+
+        |bytes| -- Plaintext |objects.inv| contents
+
+    Yields
+    ------
+    offset
+
+        |int| -- Index in `b_str` of the first byte of each data line
+
+    """
+    pos = 0
+    for line in _iter_lines(b_str):
+        if parse_data_line(line) is not None:
+            yield pos
+        pos += len(line) + 1
+
+
+def parse_data_line_at(b_str, offset):
+    r"""Parse the data line starting at an offset in a plaintext inventory.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    b_str
+
+        |bytes| -- Plaintext |objects.inv| contents
+
+    offset
+
+        |int| -- Index in `b_str` of the first byte of the line
+
+    Returns
+    -------
+    fields
+
+        |tuple| of |bytes| or |None| -- As returned by :func:`parse_data_line`
+
+    """
+    end = b_str.find(b"\n", offset)
+    if end < 0:
+        end = len(b_str)
+
+    return parse_data_line(b_str[offset:end])
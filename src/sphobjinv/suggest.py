@@ -0,0 +1,1140 @@
+r"""*Search corpus for inventory object suggestions*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (bskinn@alum.mit.edu)
+
+**File Created**
+    17 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2022
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/latest
+
+**License**
+    The MIT License; see |license_txt|_ for full license terms
+
+**Members**
+
+"""
+
+import functools
+import heapq
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from difflib import SequenceMatcher
+
+import attr
+
+from sphobjinv import levenshtein
+from sphobjinv._vendored.fuzzywuzzy import fuzz, utils
+from sphobjinv.levenshtein import _tokens
+from sphobjinv.lookup import ObjectsIndex
+
+#: Length of the character n-grams used by :meth:`SuggestCorpus.candidates`
+GRAM_LENGTH = 3
+
+#: Number of chunks per worker into which a parallel search is split
+CHUNKS_PER_WORKER = 4
+
+# Process pools for parallel searches, by number of workers. Pools are
+# kept running between searches so that each does not pay to start them.
+_pools = {}
+
+
+def _score_chunk(factory, query, thresh, idxs, processed):
+    """Return (index, score) for each processed string scoring at least `thresh`."""
+    scored = zip(idxs, map(factory(query), processed))
+    return [(i, s) for i, s in scored if s >= thresh]
+
+
+def _pairwise(fxn):
+    """Make a scorer factory from a function scoring two processed strings."""
+    # Nested partials, unlike closures, can be pickled to worker processes
+    return functools.partial(functools.partial, fxn)
+
+
+def _get_factory(name):
+    """Return the registered factory for a scorer name."""
+    try:
+        return SCORERS[name]
+    except KeyError:
+        raise ValueError(
+            "Unknown scorer {!r}; expected one of {}".format(
+                name, ", ".join(map(repr, SCORERS))
+            )
+        ) from None
+
+
+def _ratio_bound(matches, total):
+    """Bound a SequenceMatcher or edit-distance ratio from its match count."""
+    return int(100 * (2.0 * matches / total)) if total else 100
+
+
+def _partial_bound(matches, shorter):
+    """Bound a partial ratio from the matches available to the shorter string."""
+    total = shorter + matches
+    if not total:
+        return 100
+
+    r = 2.0 * matches / total
+    return 100 if r > 0.995 else int(100 * r)
+
+
+def _set_length(tokens):
+    """Return the length of a set of tokens, joined with spaces."""
+    return sum(map(len, tokens)) + max(len(tokens) - 1, 0)
+
+
+def features(p):
+    r"""Compute the features of a processed string used to bound its scores.
+
+    The features also include the tokens of the string in the forms the
+    token ratios compare, so that scorers can be given them instead of
+    tokenizing the string again (see :meth:`WRatioScorer.__call__`).
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    p
+
+        |str| -- Processed string
+
+    Returns
+    -------
+    f
+
+        |tuple| -- The length of `p`, a :class:`~collections.Counter`
+        of its characters, its number of alphanumeric tokens, their total
+        length, the |frozenset| of its tokens, the length of those
+        distinct tokens joined with spaces, and all of its tokens sorted
+        and joined with spaces
+
+    """
+    tokens = fuzz.REG_TOKEN.findall(p)
+    token_set = frozenset(tokens)
+
+    return (
+        len(p),
+        Counter(p),
+        len(tokens),
+        sum(map(len, tokens)),
+        token_set,
+        _set_length(token_set),
+        " ".join(sorted(tokens)).strip(),
+    )
+
+
+class ScoreBound:
+    r"""Exact upper bounds on the scores of processed strings against a query.
+
+    Every ratio that |fuzzywuzzy|_ computes is :math:`2M / T`, for
+    :math:`T` the total length of the two strings compared and :math:`M`
+    the number of characters matched between them. :math:`M` can be no
+    more than the number of characters the strings have in common,
+    counted from their :func:`features`, which bounds each ratio without
+    comparing the strings. The token sort and token set ratios are bounded
+    the same way from the token counts and sets of the strings, and the
+    partial ratios from the best ratio possible with a substring of the
+    longer string.
+
+    No string scores more than its bound, so those with a bound below the
+    search threshold can be skipped without changing the results. The
+    bounds hold as well for the edit-distance ratios of
+    :class:`sphobjinv.levenshtein.Scorer`, which can match no more
+    characters than :class:`difflib.SequenceMatcher`.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    query
+
+        |str| -- Processed query
+
+    kind
+
+        |str| -- ``"wratio"`` to bound :func:`score`, ``"ratio"`` to bound
+        :func:`quick_score`, or ``"token_set"`` to bound
+        :func:`token_set_score`
+
+    **Members**
+
+    """
+
+    __slots__ = ("_query", "_words", "_others", "_bound")
+
+    def __init__(self, query, kind):
+        """Compute the features of `query`."""
+        self._query = features(query)
+
+        # Characters of the query in and out of its tokens, since only
+        # those in tokens count toward the token ratios
+        hist = self._query[1]
+        words = "".join(self._query[4])
+        self._words = [(c, hist[c]) for c in hist if c in words]
+        self._others = [(c, hist[c]) for c in hist if c not in words]
+
+        self._bound = getattr(self, "_" + kind)
+
+    def __call__(self, f):
+        """Return the highest score possible for a string with features `f`."""
+        return self._bound(f)
+
+    def _common(self, f):
+        """Count the characters of the query in common, in tokens and in all."""
+        hist = f[1]
+        get = hist.get
+
+        in_words = 0
+        for c, n in self._words:
+            m = get(c)
+            if m:
+                in_words += n if n < m else m
+
+        common = in_words
+        for c, n in self._others:
+            m = get(c)
+            if m:
+                common += n if n < m else m
+
+        return in_words, common
+
+    def _token_set(self, f):
+        """Bound the token set ratio."""
+        if not self._query[0] or not f[0]:
+            return 0
+
+        return self._token_set_common(f, self._common(f)[0])
+
+    def _token_set_common(self, f, in_words):
+        """Bound the token set ratio, given the characters in common in tokens."""
+        q_set, q_set_len = self._query[4:6]
+        p_set, p_set_len = f[4:6]
+
+        sect = _set_length(q_set & p_set)
+        spaces = min(max(len(q_set) - 1, 0), max(len(p_set) - 1, 0))
+
+        return max(
+            _ratio_bound(sect, sect + q_set_len),
+            _ratio_bound(sect, sect + p_set_len),
+            _ratio_bound(
+                min(in_words + spaces, q_set_len, p_set_len), q_set_len + p_set_len
+            ),
+        )
+
+    def _ratio(self, f):
+        """Bound the ratio."""
+        if not self._query[0] or not f[0]:
+            return 0
+
+        return _ratio_bound(self._common(f)[1], self._query[0] + f[0])
+
+    def _wratio(self, f):
+        """Bound the weighted ratio."""
+        q_len, _, q_ntok, q_tok_len = self._query[:4]
+        p_len, _, p_ntok, p_tok_len = f[:4]
+
+        if not q_len or not p_len:
+            return 0
+
+        in_words, common = self._common(f)
+        base = _ratio_bound(common, q_len + p_len)
+
+        # Token-sorted strings have the characters of the tokens,
+        # and a space between each pair of tokens
+        q_sorted = q_tok_len + max(q_ntok - 1, 0)
+        p_sorted = p_tok_len + max(p_ntok - 1, 0)
+        sorted_common = in_words + min(max(q_ntok - 1, 0), max(p_ntok - 1, 0))
+
+        token_set = self._token_set_common(f, in_words)
+        len_ratio = max(q_len, p_len) / min(q_len, p_len)
+
+        if len_ratio < 1.5:
+            return int(
+                max(
+                    base,
+                    _ratio_bound(sorted_common, q_sorted + p_sorted) * 0.95,
+                    token_set * 0.95,
+                )
+            )
+
+        partial_scale = 0.6 if len_ratio > 8 else 0.9
+
+        return int(
+            max(
+                base,
+                _partial_bound(common, min(q_len, p_len)) * partial_scale,
+                _partial_bound(sorted_common, min(q_sorted, p_sorted))
+                * 0.95
+                * partial_scale,
+                token_set * 0.95 * partial_scale,
+            )
+        )
+
+
+def shutdown_workers():
+    """Shut down the worker processes kept for parallel searches.
+
+    Worker processes are otherwise kept until the interpreter exits,
+    and are started again by the next parallel search.
+
+    .. versionadded:: 2.3
+
+    """
+    while _pools:
+        _, pool = _pools.popitem()
+        pool.shutdown()
+
+
+def grams(p):
+    r"""Return the distinct character n-grams of a processed string.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    p
+
+        |str| -- Processed string
+
+    Returns
+    -------
+    g
+
+        |set| of |str| -- Every substring of `p` of length
+        :data:`GRAM_LENGTH`; empty if `p` is shorter
+
+    """
+    return {p[i:j] for i, j in enumerate(range(GRAM_LENGTH, len(p) + 1))}
+
+
+def process(s):
+    r"""Normalize a |str| for matching, as |fuzzywuzzy|_ does before scoring.
+
+    Non-ASCII characters are removed, punctuation is replaced with
+    spaces, letters are lowercased, and leading and trailing whitespace
+    is stripped. The result is unchanged by processing again.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    s
+
+        |str| -- String to process
+
+    Returns
+    -------
+    p
+
+        |str| -- Processed string
+
+    """
+    return utils.full_process(s)
+
+
+def score(p1, p2):
+    r"""Score the match between two processed strings.
+
+    The result is identical to that of the |fuzzywuzzy|_ ``WRatio``
+    scorer applied to the strings before :func:`process`\ ing, without
+    processing them again.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    p1
+
+        |str| -- Processed query
+
+    p2
+
+        |str| -- Processed candidate
+
+    Returns
+    -------
+    s
+
+        |int| -- Match quality, from 0 to 100
+
+    """
+    return WRatioScorer(p1)(p2)
+
+
+class WRatioScorer:
+    r"""Reusable |fuzzywuzzy|_ ``WRatio`` scorer for one processed query.
+
+    Gives the same scores as :func:`score`, but does once per query what
+    :func:`score` does for every pair of strings: the query's tokens,
+    sorted and as a set, are found when the scorer is created, and one
+    :class:`difflib.SequenceMatcher` is reused for every comparison.
+
+    :class:`difflib.SequenceMatcher` indexes only its second sequence, and
+    ``WRatio`` passes the query first, so the index cannot be kept from
+    one candidate to the next without changing the scores. What is reused
+    instead is the matcher's work on each candidate: the comparison for the
+    plain ratio is the same one that ``partial_ratio`` starts from, and is
+    done only once; and each partial window is compared only once, where
+    ``partial_ratio`` compares it again for every block of matches that
+    aligns with it.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    query
+
+        |str| -- Processed query
+
+    **Members**
+
+    """
+
+    __slots__ = ("query", "_sorted", "_tokens", "_matcher")
+
+    def __init__(self, query):
+        """Find the tokens of `query`."""
+        #: |str| processed query
+        self.query = query
+
+        self._sorted, self._tokens = _tokens(query)
+        self._matcher = SequenceMatcher(None)
+
+    def __call__(self, p, tokens=None):
+        """Score the match of a processed string to the query, from 0 to 100.
+
+        Parameters
+        ----------
+        p
+
+            |str| -- Processed string
+
+        tokens
+
+            |tuple| *(optional)* -- The tokens of `p` sorted and joined
+            with spaces, and the |frozenset| of its tokens, as from
+            :func:`features`, if already known
+
+        Returns
+        -------
+        s
+
+            |int| -- Match quality, from 0 to 100
+
+        """
+        query = self.query
+        if not query or not p:
+            return 0
+
+        if tokens is None:
+            tokens = _tokens(p)
+        p_sorted, p_tokens = tokens
+
+        matcher = self._matcher
+        matcher.set_seqs(query, p)
+        blocks = matcher.get_matching_blocks()
+        base = int(100 * matcher.ratio())
+
+        len_ratio = max(len(query), len(p)) / min(len(query), len(p))
+
+        # Strings of similar length are not compared by their partials
+        if len_ratio < 1.5:
+            return int(
+                max(
+                    base,
+                    self._ratio(self._sorted, p_sorted) * 0.95,
+                    self._token_set(p_tokens) * 0.95,
+                )
+            )
+
+        partial_scale = 0.6 if len_ratio > 8 else 0.9
+
+        # partial_ratio matches the shorter string against the longer, which
+        # for a shorter query is the comparison just made for the base ratio
+        if len(query) > len(p):
+            blocks = None
+
+        return int(
+            max(
+                base,
+                self._partial_ratio(query, p, blocks) * partial_scale,
+                self._partial_ratio(self._sorted, p_sorted) * 0.95 * partial_scale,
+                self._token_set(p_tokens) * 0.95 * partial_scale,
+            )
+        )
+
+    def _ratio(self, s1, s2):
+        """Compute ``fuzz.ratio`` with the reused matcher."""
+        self._matcher.set_seqs(s1, s2)
+        return int(100 * self._matcher.ratio())
+
+    def _partial_ratio(self, s1, s2, blocks=None):
+        """Compute ``fuzz.partial_ratio``, given the blocks if already matched."""
+        if len(s1) <= len(s2):
+            shorter, longer = s1, s2
+        else:
+            shorter, longer = s2, s1
+
+        matcher = self._matcher
+        if blocks is None:
+            matcher.set_seqs(shorter, longer)
+            blocks = matcher.get_matching_blocks()
+
+        best = 0
+        starts = set()
+        for i, j, _ in blocks:
+            start = max(j - i, 0)
+            if start in starts:
+                continue
+            starts.add(start)
+
+            end = start + len(shorter)
+            matcher.set_seqs(shorter, longer[start:end])
+            r = matcher.ratio()
+            if r > 0.995:
+                return 100
+            best = max(best, r)
+
+        return int(100 * best)
+
+    def _token_set(self, p_tokens):
+        """Compute ``fuzz.token_set_ratio`` against the query tokens."""
+        q_tokens = self._tokens
+
+        sect = " ".join(sorted(q_tokens & p_tokens))
+        q_rest = (sect + " " + " ".join(sorted(q_tokens - p_tokens))).strip()
+        p_rest = (sect + " " + " ".join(sorted(p_tokens - q_tokens))).strip()
+        sect = sect.strip()
+
+        return max(
+            self._ratio(sect, q_rest),
+            self._ratio(sect, p_rest),
+            self._ratio(q_rest, p_rest),
+        )
+
+
+def quick_score(p1, p2):
+    r"""Score the match between two processed strings by their ratio alone.
+
+    Equivalent to the |fuzzywuzzy|_ ``QRatio`` scorer applied to the
+    strings before :func:`process`\ ing. Cheaper than :func:`score`, which
+    also compares partial matches and tokens.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    p1
+
+        |str| -- Processed query
+
+    p2
+
+        |str| -- Processed candidate
+
+    Returns
+    -------
+    s
+
+        |int| -- Match quality, from 0 to 100
+
+    """
+    if not p1 or not p2:
+        return 0
+
+    return fuzz.ratio(p1, p2)
+
+
+def token_set_score(p1, p2):
+    r"""Score the match between two processed strings by their token sets.
+
+    The |fuzzywuzzy|_ ``token_set_ratio`` of the strings, which compares
+    their shared alphanumeric tokens with the tokens of each, regardless
+    of order.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    p1
+
+        |str| -- Processed query
+
+    p2
+
+        |str| -- Processed candidate
+
+    Returns
+    -------
+    s
+
+        |int| -- Match quality, from 0 to 100
+
+    """
+    if not p1 or not p2:
+        return 0
+
+    return fuzz.token_set_ratio(p1, p2)
+
+
+def substring_score(p1, p2):
+    r"""Score whether a processed query occurs within a processed string.
+
+    Only exact occurrences score. Each scores from 75 to 100, in proportion
+    to how much of the string the query covers, so that tighter matches
+    rank first, and every match meets the default thresholds of
+    :meth:`Inventory.suggest` and the CLI.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    p1
+
+        |str| -- Processed query
+
+    p2
+
+        |str| -- Processed candidate
+
+    Returns
+    -------
+    s
+
+        |int| -- 0 if `p1` does not occur in `p2`, otherwise from 75 to 100
+
+    """
+    if not p1 or p1 not in p2:
+        return 0
+
+    return int(75 + 25 * len(p1) / len(p2))
+
+
+def prefix_score(p1, p2):
+    r"""Score whether a processed query begins a word of a processed string.
+
+    As :func:`substring_score`, but only occurrences of `p1` at the
+    start of `p2` or following a space are matches.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    p1
+
+        |str| -- Processed query
+
+    p2
+
+        |str| -- Processed candidate
+
+    Returns
+    -------
+    s
+
+        |int| -- 0 if no word of `p2` begins with `p1`, otherwise from
+        75 to 100
+
+    """
+    if not p1 or not (p2.startswith(p1) or " " + p1 in p2):
+        return 0
+
+    return int(75 + 25 * len(p1) / len(p2))
+
+
+#: Scorers available to :meth:`SuggestCorpus.search`, by name. Each is a
+#: factory that is called with a processed query, and returns a function
+#: scoring a processed string against it. See :func:`register_scorer`.
+SCORERS = {
+    "wratio": WRatioScorer,
+    "qratio": _pairwise(quick_score),
+    "token_set": _pairwise(token_set_score),
+    "substring": _pairwise(substring_score),
+    "prefix": _pairwise(prefix_score),
+    "levenshtein": levenshtein.Scorer,
+}
+
+# Kind of ScoreBound for each built-in scorer factory that can be bounded
+_BOUNDS = {
+    SCORERS["wratio"]: "wratio",
+    SCORERS["qratio"]: "ratio",
+    SCORERS["token_set"]: "token_set",
+    SCORERS["levenshtein"]: "wratio",
+}
+
+# Built-in scorer factories whose scorers accept the tokens of each string
+_TOKENIZED = {SCORERS["wratio"], SCORERS["levenshtein"]}
+
+
+def register_scorer(name, factory=None, *, pairwise=None):
+    r"""Make a scorer available to :meth:`Inventory.suggest` by name.
+
+    For parallel searches, the factory is sent to each worker process, and
+    so must be picklable, such as a function or class defined at the top
+    level of a module.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    name
+
+        |str| -- Name of the scorer, replacing any already registered
+
+    factory
+
+        callable -- Called with a processed query, returning a function
+        that scores a processed string against it from 0 to 100
+
+    pairwise
+
+        callable -- Alternatively to `factory`, a function scoring a
+        processed query and a processed string, as :func:`score` does
+
+    Raises
+    ------
+    ValueError
+
+        If not exactly one of `factory` or `pairwise` is given
+
+    """
+    if (factory is None) == (pairwise is None):
+        raise ValueError("Exactly one of 'factory' or 'pairwise' is required")
+
+    SCORERS[name] = factory if pairwise is None else _pairwise(pairwise)
+
+
+try:
+    from rapidfuzz import fuzz as rf_fuzz
+except ImportError:  # pragma: no cover
+    pass
+else:  # pragma: no cover
+
+    def _rapidfuzz_wratio(p1, p2):
+        """Score with the ``rapidfuzz`` ``WRatio`` scorer."""
+        return int(rf_fuzz.WRatio(p1, p2))
+
+    def _rapidfuzz_qratio(p1, p2):
+        """Score with the ``rapidfuzz`` ``QRatio`` scorer."""
+        return int(rf_fuzz.QRatio(p1, p2))
+
+    register_scorer("rapidfuzz_wratio", pairwise=_rapidfuzz_wratio)
+    register_scorer("rapidfuzz_qratio", pairwise=_rapidfuzz_qratio)
+
+
+@attr.s(slots=True, eq=False)
+class SuggestCorpus(ObjectsIndex):
+    r"""Pre-formatted search strings for :meth:`Inventory.suggest`.
+
+    :attr:`rst` holds the :attr:`~sphobjinv.data.SuperDataObj.as_rst`
+    representation of each object, and :attr:`processed` the
+    :func:`process`\ ed form of each, which is what is scored. The index
+    of each object is kept alongside, and is not part of the text scored.
+
+    Each object is formatted and processed only once. After objects are
+    added to or removed from an
+    :class:`~sphobjinv.objects.ObjectList`, the lists are reassembled
+    on next access, formatting only the new objects. Objects whose fields
+    have been changed in place since they were formatted are likewise
+    formatted again on next access.
+
+    For approximate searches, an inverted index from each
+    :func:`grams` n-gram to the objects containing it is built on first
+    use, and rebuilt on first use after any change.
+
+    Searches with scorers that can be bounded by a :class:`ScoreBound`
+    skip the objects that cannot score at least the threshold. The
+    :func:`features` those bounds need are likewise computed on first use
+    after any change. :attr:`scored` and :attr:`pruned` count the objects
+    scored and skipped.
+
+    .. versionadded:: 2.3
+
+    Parameters
+    ----------
+    objects
+
+        sequence of |DataObjStr| -- Objects to search
+
+    **Members**
+
+    """
+
+    # Maps id() of each object to a tuple of the object, its field values
+    # when formatted, its reST representation, and its processed search string
+    _entries = attr.ib(init=False, factory=dict, repr=False)
+
+    # Assembled (rst, processed) lists, or None after any change
+    _lists = attr.ib(init=False, default=None, repr=False)
+
+    # Maps each n-gram to the ascending indices of the objects whose
+    # search strings contain it, or None until next needed
+    _postings = attr.ib(init=False, default=None, repr=False)
+
+    # Score-bounding features of each search string, or None until next needed
+    _features = attr.ib(init=False, default=None, repr=False)
+
+    #: |int| count of objects scored by searches
+    scored = attr.ib(init=False, default=0)
+
+    #: |int| count of objects skipped by searches, as unable to score
+    #: at least the threshold (see :class:`ScoreBound`)
+    pruned = attr.ib(init=False, default=0)
+
+    @staticmethod
+    def _fields(obj):
+        """Return the field values of an object that its search string uses."""
+        return obj.name, obj.domain, obj.role, obj.priority, obj.uri, obj.dispname
+
+    @classmethod
+    def _entry(cls, obj):
+        """Format and process one object."""
+        rst = obj.as_rst
+        return obj, cls._fields(obj), rst, process(rst)
+
+    def _build(self):
+        """Format and process all objects."""
+        self._entries = {id(obj): self._entry(obj) for obj in self.objects}
+        self._lists = self._postings = self._features = None
+
+    def _add(self, objs):
+        """Mark the lists for reassembly."""
+        self._lists = self._postings = self._features = None
+
+    _remove = _add
+
+    def _assemble(self):
+        """Return the current lists, reassembling if needed."""
+        fields = self._fields
+        if self._lists is not None:
+            if all(e[1] == fields(e[0]) for e in self._entries.values()):
+                return self._lists
+
+            # An object was edited in place
+            self._lists = self._postings = self._features = None
+
+        old = self._entries
+        entries = {}
+        rst = []
+        processed = []
+
+        for obj in self.objects:
+            entry = entries.get(id(obj))
+            if entry is None:
+                entry = old.get(id(obj))
+                if entry is None or entry[0] is not obj or entry[1] != fields(obj):
+                    entry = self._entry(obj)
+                entries[id(obj)] = entry
+
+            rst.append(entry[2])
+            processed.append(entry[3])
+
+        self._entries = entries
+        self._lists = rst, processed
+        return self._lists
+
+    @property
+    def rst(self):
+        """|list| of the reST representation of each object."""
+        return self._assemble()[0]
+
+    @property
+    def processed(self):
+        """|list| of the processed search string of each object."""
+        return self._assemble()[1]
+
+    @property
+    def prune_rate(self):
+        """|float| fraction of the objects searched that were skipped unscored."""
+        total = self.scored + self.pruned
+        return self.pruned / total if total else 0.0
+
+    def _all_features(self):
+        """Return the features of each search string, computing if needed."""
+        if self._features is None:
+            self._features = [features(p) for p in self.processed]
+
+        return self._features
+
+    def _prune(self, query, thresh, idxs, kind):
+        """Return the indices of the objects that can score at least `thresh`."""
+        bound = ScoreBound(query, kind)
+        feats = self._all_features()
+        kept = [i for i in idxs if bound(feats[i]) >= thresh]
+
+        self.pruned += len(idxs) - len(kept)
+        return kept
+
+    def candidates(self, name):
+        r"""Return the objects sharing at least one n-gram with a name.
+
+        The candidates do not depend on any score threshold, and are not
+        guaranteed to include every object that would score well against
+        `name`: objects matching it only in pieces shorter than
+        :data:`GRAM_LENGTH` are omitted, even when they would score well
+        above the threshold of a search. Searches with `approximate` as
+        |True| score only these candidates, trading that loss of recall
+        for speed.
+
+        Parameters
+        ----------
+        name
+
+            |str| -- Object name to match
+
+        Returns
+        -------
+        idxs
+
+            |list| of |int| -- Ascending indices in :attr:`objects` of
+            the candidate objects; or |None| if the processed `name` is
+            too short to have any n-grams
+
+        """
+        query = grams(process(name))
+        if not query:
+            return None
+
+        processed = self.processed
+        if self._postings is None:
+            postings = {}
+            for i, p in enumerate(processed):
+                for g in grams(p):
+                    postings.setdefault(g, []).append(i)
+            self._postings = postings
+
+        found = set()
+        for g in query:
+            found.update(self._postings.get(g, ()))
+
+        return sorted(found)
+
+    def search(
+        self,
+        name,
+        thresh,
+        *,
+        approximate=False,
+        limit=None,
+        workers=None,
+        scorer="wratio",
+    ):
+        r"""Score objects against a name.
+
+        Parameters
+        ----------
+        name
+
+            |str| -- Object name to match
+
+        thresh
+
+            |float| -- Minimum score of the results returned
+
+        approximate
+
+            |bool| *(optional)* -- If |True|, score only the
+            :meth:`candidates` for `name`, omitting any matches that share
+            no n-gram with it, whatever their score. The results are then
+            a subset of the exact results, and are usually found much
+            faster. If `name` has no n-grams, all objects are scored.
+
+        limit
+
+            |int| *(optional)* -- Maximum number of results to return,
+            at least 1. If given, only the best `limit` results seen so
+            far are kept while scoring, rather than all results being
+            sorted.
+
+        workers
+
+            |int| *(optional)* -- Number of processes among which to split
+            the scoring, at least 1. If greater than one, the objects to be scored are
+            split into :data:`CHUNKS_PER_WORKER` chunks per worker, and
+            scored in a process pool that is kept running for later
+            searches with the same number of workers (see
+            :func:`shutdown_workers`). The results are identical to
+            those of a search in this process.
+
+        scorer
+
+            |str| *(optional)* -- Name in :data:`SCORERS` of the scorer
+            to use. ``"wratio"`` scores with :func:`score`; ``"qratio"``
+            with :func:`quick_score`; ``"token_set"`` with
+            :func:`token_set_score`; ``"substring"`` and ``"prefix"`` with
+            :func:`substring_score` and :func:`prefix_score`; and
+            ``"levenshtein"`` with :class:`sphobjinv.levenshtein.Scorer`.
+            If |rapidfuzz|_ is installed, ``"rapidfuzz_wratio"`` and
+            ``"rapidfuzz_qratio"`` score with its ``WRatio`` and ``QRatio``.
+
+        Returns
+        -------
+        results
+
+            |list| of |tuple| -- |cour|\ (rst, score, index)\ |/cour| for each
+            object scoring at least `thresh`, best first, with ties in
+            :attr:`objects` order
+
+        Raises
+        ------
+        ValueError
+
+            If `limit` is less than 1, `workers` is not |None| or an |int|
+            of at least 1, or `scorer` is not a registered scorer
+
+        """
+        return self.search_many(
+            [name],
+            thresh,
+            approximate=approximate,
+            limit=limit,
+            workers=workers,
+            scorer=scorer,
+        )[name]
+
+    def search_many(
+        self,
+        names,
+        thresh,
+        *,
+        approximate=False,
+        limit=None,
+        workers=None,
+        scorer="wratio",
+    ):
+        r"""Score objects against each of several names.
+
+        The processed search strings, and for `approximate` the n-gram index,
+        are shared among all of the names. With more than one worker, the
+        chunks for all of the names are submitted to the process pool at
+        once, so that it is kept busy from one name to the next.
+
+        Parameters
+        ----------
+        names
+
+            iterable of |str| -- Object names to match
+
+        thresh, approximate, limit, workers, scorer
+
+            As for :meth:`search`
+
+        Returns
+        -------
+        results
+
+            |dict| -- Results for each distinct name in `names`, in order of
+            first appearance, as would be returned by :meth:`search`
+
+        """
+        if limit is not None and limit < 1:
+            raise ValueError("'limit' must be at least 1, not {!r}".format(limit))
+        if workers is not None and (not isinstance(workers, int) or workers < 1):
+            raise ValueError(
+                "'workers' must be None or an integer of at least 1, "
+                "not {!r}".format(workers)
+            )
+
+        factory = _get_factory(scorer)
+        kind = _BOUNDS.get(factory)
+        tokenized = factory in _TOKENIZED
+        rst, processed = self._assemble()
+        names = list(dict.fromkeys(names))
+        parallel = workers is not None and workers != 1
+
+        pending = {}
+        for name in names:
+            if not processed:
+                pending[name] = ()
+                continue
+
+            query = process(name)
+
+            idxs = self.candidates(name) if approximate else None
+            if idxs is None:
+                idxs = range(len(processed))
+
+            # A bound can only exclude anything above a threshold of zero
+            if kind is not None and thresh > 0:
+                idxs = self._prune(query, thresh, idxs, kind)
+            self.scored += len(idxs)
+
+            if parallel:
+                pending[name] = self._submit(factory, query, thresh, idxs, workers)
+            else:
+                score_fxn = factory(query)
+                if tokenized:
+                    feats = self._all_features()
+                    scored = (
+                        (i, score_fxn(processed[i], (feats[i][6], feats[i][4])))
+                        for i in idxs
+                    )
+                else:
+                    scored = ((i, score_fxn(processed[i])) for i in idxs)
+                pending[name] = [(i, s) for i, s in scored if s >= thresh]
+
+        results = {}
+        for name, found in pending.items():
+            if parallel:
+                found = self._gather(found, workers)
+
+            passed = ((rst[i], s, i) for i, s in found)
+
+            if limit is None:
+                results[name] = sorted(passed, key=lambda r: -r[1])
+            else:
+                results[name] = heapq.nsmallest(
+                    limit, passed, key=lambda r: (-r[1], r[2])
+                )
+
+        return results
+
+    def _submit(self, factory, query, thresh, idxs, workers):
+        """Submit chunks of objects to score to a process pool."""
+        pool = _pools.get(workers)
+        if pool is None:
+            pool = _pools[workers] = ProcessPoolExecutor(workers)
+
+        idxs = list(idxs)
+        processed = self.processed
+        size = max(-(-len(idxs) // (workers * CHUNKS_PER_WORKER)), 1)
+
+        futures = []
+        for start in range(0, len(idxs), size):
+            end = start + size
+            chunk = idxs[start:end]
+            futures.append(
+                pool.submit(
+                    _score_chunk,
+                    factory,
+                    query,
+                    thresh,
+                    chunk,
+                    [processed[i] for i in chunk],
+                )
+            )
+
+        return futures
+
+    @staticmethod
+    def _gather(futures, workers):
+        """Yield the results of submitted chunks, in index order."""
+        try:
+            # Chunks are collected in the order submitted, so that
+            # the merged results do not depend on worker timing
+            for future in futures:
+                yield from future.result()
+        except BrokenProcessPool:
+            _pools.pop(workers, None)
+            raise
@@ -0,0 +1,495 @@
+r"""*Columnar, array-backed storage for inventory contents*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (bskinn@alum.mit.edu)
+
+**File Created**
+    17 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2022
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/latest
+
+**License**
+    The MIT License; see |license_txt|_ for full license terms
+
+**Members**
+
+"""
+
+from array import array
+from itertools import accumulate, chain, compress
+
+import attr
+
+from sphobjinv.data import DataFields, DataObjStr, SuperDataObj
+from sphobjinv.enum import HeaderFields
+from sphobjinv.inventory import Inventory
+
+
+def _pack(strs=()):
+    """Join |str| values into one buffer, plus an array of offsets into it.
+
+    Value `i` is ``buf[offsets[i]:offsets[i + 1]]``.
+
+    """
+    strs = list(strs)
+    buf = "".join(strs)
+    offsets = array("I", chain((0,), accumulate(map(len, strs))))
+
+    return buf, offsets
+
+
+def _unpack(buf, offsets):
+    """Split a packed buffer back into a |list| of |str|."""
+    return [buf[a:b] for a, b in zip(offsets, offsets[1:])]
+
+
+def _packed_value(col, idx):
+    """Retrieve value `idx` from a packed buffer and its offsets."""
+    buf, offsets = col
+    start, end = offsets[idx], offsets[idx + 1]
+
+    return buf[start:end]
+
+
+def _interned_value(col, idx):
+    """Retrieve value `idx` from an interned table and its codes."""
+    values, codes = col
+
+    return values[codes[idx]]
+
+
+def _code_array(n_values, codes=()):
+    """Create the smallest unsigned array able to hold codes for `n_values`."""
+    if n_values <= 0x100:
+        typecode = "B"
+    elif n_values <= 0x10000:
+        typecode = "H"
+    else:
+        typecode = "I"
+
+    return array(typecode, codes)
+
+
+def _intern(strs=()):
+    """Encode |str| values as integer codes into a table of unique values."""
+    table = {}
+    codes = [table.setdefault(s, len(table)) for s in strs]
+
+    return tuple(table), _code_array(len(table), codes)
+
+
+@attr.s(slots=True, eq=False, order=False)
+class InventoryTable:
+    r"""Columnar store for the contents of an |objects.inv| inventory.
+
+    Rather than one |DataObjStr| per object, the
+    :attr:`~sphobjinv.data.SuperDataObj.name`,
+    :attr:`~sphobjinv.data.SuperDataObj.uri`, and
+    :attr:`~sphobjinv.data.SuperDataObj.dispname` values of all
+    objects are each held in a single |str| buffer, with an
+    :class:`array.array` of offsets into it. The
+    :attr:`~sphobjinv.data.SuperDataObj.domain`,
+    :attr:`~sphobjinv.data.SuperDataObj.role`, and
+    :attr:`~sphobjinv.data.SuperDataObj.priority` values are held as
+    small integer codes into tables of the distinct values present.
+    This uses a small fraction of the memory of an equivalent
+    |Inventory|, which matters when many inventories are kept resident.
+
+    Instances are most conveniently created from an |Inventory|
+    with :meth:`from_inventory`, and converted back with
+    :meth:`to_inventory`. Instantiating directly creates an empty
+    table with the given `project` and `version`.
+
+    Indexing an instance with an |int| returns a new |DataObjStr|,
+    and with a |slice| a new :class:`InventoryTable`;
+    iterating over it yields a |DataObjStr| for each object, in order.
+    Edits to these objects are **not** reflected in the table.
+
+    Two instances compare equal if their
+    :attr:`project`, :attr:`version`, and all object data are equal.
+
+    .. versionadded:: 2.3
+
+    **Members**
+
+    """
+
+    #: |str| project display name for the inventory
+    project = attr.ib(default=None)
+
+    #: |str| project display version for the inventory
+    version = attr.ib(default=None)
+
+    # Packed str columns, as (buffer, offsets)
+    _names = attr.ib(init=False, default=attr.Factory(_pack), repr=False)
+    _uris = attr.ib(init=False, default=attr.Factory(_pack), repr=False)
+    _dispnames = attr.ib(init=False, default=attr.Factory(_pack), repr=False)
+
+    # Interned columns, as (values, codes)
+    _domains = attr.ib(init=False, default=attr.Factory(_intern), repr=False)
+    _roles = attr.ib(init=False, default=attr.Factory(_intern), repr=False)
+    _priorities = attr.ib(init=False, default=attr.Factory(_intern), repr=False)
+
+    @classmethod
+    def from_objects(cls, objects, *, project=None, version=None):
+        """Create a table from an iterable of data objects.
+
+        Parameters
+        ----------
+        objects
+
+            iterable of |DataObjStr| or |DataObjBytes| -- Objects to store
+
+        project
+
+            |str| *(optional)* -- Project display name
+
+        version
+
+            |str| *(optional)* -- Project display version
+
+        Returns
+        -------
+        table
+
+            :class:`InventoryTable` -- New table
+
+        """
+        rows = [obj.as_str for obj in objects]
+
+        table = cls(project=project, version=version)
+        table._names = _pack(obj.name for obj in rows)
+        table._uris = _pack(obj.uri for obj in rows)
+        table._dispnames = _pack(obj.dispname for obj in rows)
+        table._domains = _intern(obj.domain for obj in rows)
+        table._roles = _intern(obj.role for obj in rows)
+        table._priorities = _intern(obj.priority for obj in rows)
+
+        return table
+
+    @classmethod
+    def from_inventory(cls, inv):
+        """Create a table from the contents of an |Inventory|.
+
+        Parameters
+        ----------
+        inv
+
+            |Inventory| -- Inventory to store
+
+        Returns
+        -------
+        table
+
+            :class:`InventoryTable` -- New table
+
+        """
+        return cls.from_objects(inv.objects, project=inv.project, version=inv.version)
+
+    def to_inventory(self):
+        """Create an |Inventory| with the contents of the table.
+
+        Returns
+        -------
+        inv
+
+            |Inventory| -- New inventory, with
+            :attr:`~sphobjinv.inventory.Inventory.source_type` of
+            :attr:`~sphobjinv.enum.SourceTypes.Manual`
+
+        """
+        inv = Inventory()
+        inv.project = self.project
+        inv.version = self.version
+        inv.objects.extend(self)
+
+        return inv
+
+    @property
+    def count(self):
+        """Count of objects in the table."""
+        return len(self._domains[1])
+
+    def __len__(self):
+        """Return the count of objects in the table."""
+        return self.count
+
+    def __getitem__(self, idx):
+        """Create the |DataObjStr| at an index, or a new table for a slice."""
+        idx = range(self.count)[idx]
+
+        if isinstance(idx, range):
+            return self._take(idx)
+
+        return DataObjStr(
+            name=_packed_value(self._names, idx),
+            domain=_interned_value(self._domains, idx),
+            role=_interned_value(self._roles, idx),
+            priority=_interned_value(self._priorities, idx),
+            uri=_packed_value(self._uris, idx),
+            dispname=_packed_value(self._dispnames, idx),
+        )
+
+    def __iter__(self):
+        """Iterate over a new |DataObjStr| for each object."""
+        for fields in zip(*(self.column(f) for f in DataFields)):
+            yield DataObjStr(*fields)
+
+    def __eq__(self, other):
+        """Compare header and object data with another table."""
+        if not isinstance(other, type(self)):
+            return NotImplemented
+
+        return (self.project, self.version) == (other.project, other.version) and all(
+            self.column(f) == other.column(f) for f in DataFields
+        )
+
+    def column(self, field):
+        """Return all values of one data field, in object order.
+
+        Parameters
+        ----------
+        field
+
+            :class:`~sphobjinv.data.DataFields` or |str| -- Field to retrieve,
+            given as the |Enum| member or its |str| value
+
+        Returns
+        -------
+        values
+
+            |list| of |str| -- Field value for each object
+
+        """
+        attr_name = (
+            "_"
+            + {
+                DataFields.Name: "names",
+                DataFields.Domain: "domains",
+                DataFields.Role: "roles",
+                DataFields.Priority: "priorities",
+                DataFields.URI: "uris",
+                DataFields.DispName: "dispnames",
+            }[DataFields(field)]
+        )
+        col = getattr(self, attr_name)
+
+        if isinstance(col[0], str):
+            return _unpack(*col)
+
+        values, codes = col
+        return [values[c] for c in codes]
+
+    def filter(self, *, domain=None, role=None):  # noqa: A003
+        """Create a new table containing only the matching objects.
+
+        The matching is done on the integer-code columns, without
+        constructing any per-object values.
+
+        Parameters
+        ----------
+        domain
+
+            |str| *(optional)* -- Retain only objects in this domain
+
+        role
+
+            |str| *(optional)* -- Retain only objects with this role
+
+        Returns
+        -------
+        table
+
+            :class:`InventoryTable` -- New table with the matching objects,
+            in their original order
+
+        """
+        mask = [True] * self.count
+
+        for value, (values, codes) in ((domain, self._domains), (role, self._roles)):
+            if value is None:
+                continue
+
+            try:
+                code = values.index(value)
+            except ValueError:
+                mask = []
+                break
+
+            mask = [m and c == code for m, c in zip(mask, codes)]
+
+        return self._take(list(compress(range(self.count), mask)))
+
+    def _take(self, indices):
+        """Create a new table containing the objects at `indices`."""
+        table = type(self)(project=self.project, version=self.version)
+
+        for attr_name in ("_names", "_uris", "_dispnames"):
+            col = getattr(self, attr_name)
+            setattr(table, attr_name, _pack(_packed_value(col, i) for i in indices))
+
+        for attr_name in ("_domains", "_roles", "_priorities"):
+            col = getattr(self, attr_name)
+            setattr(table, attr_name, _intern(_interned_value(col, i) for i in indices))
+
+        return table
+
+    def _uri_dispname_columns(self, expand, contract):
+        """Return the name, URI, and display name columns, as requested."""
+        if expand and contract:
+            raise ValueError("'expand' and 'contract' cannot both be true.")
+
+        uri_abbrev = DataObjStr.uri_abbrev
+        disp_abbrev = DataObjStr.dispname_abbrev
+
+        names = self.column(DataFields.Name)
+        uris = self.column(DataFields.URI)
+        dispnames = self.column(DataFields.DispName)
+
+        if expand:
+            uris = [
+                u[: -len(uri_abbrev)] + n if u.endswith(uri_abbrev) else u
+                for n, u in zip(names, uris)
+            ]
+            dispnames = [n if d == disp_abbrev else d for n, d in zip(names, dispnames)]
+
+        if contract:
+            uris = [
+                u[: -len(n)] + uri_abbrev if u.endswith(n) else u
+                for n, u in zip(names, uris)
+            ]
+            dispnames = [disp_abbrev if d == n else d for n, d in zip(names, dispnames)]
+
+        return names, uris, dispnames
+
+    def data_file(self, *, expand=False, contract=False):
+        """Generate a plaintext |objects.inv| as UTF-8 |bytes|.
+
+        The output is identical to that of
+        :meth:`Inventory.data_file() <sphobjinv.inventory.Inventory.data_file>`
+        for an |Inventory| with the same contents, but is generated
+        column-wise rather than object by object.
+
+        Calling with both `expand` and `contract` as |True| is invalid.
+
+        Parameters
+        ----------
+        expand
+
+            |bool| *(optional)* -- Generate |bytes| with any
+            :data:`~sphobjinv.data.SuperDataObj.uri` or
+            :data:`~sphobjinv.data.SuperDataObj.dispname`
+            abbreviations expanded
+
+        contract
+
+            |bool| *(optional)* -- Generate |bytes| with abbreviated
+            :data:`~sphobjinv.data.SuperDataObj.uri` and
+            :data:`~sphobjinv.data.SuperDataObj.dispname` values
+
+        Returns
+        -------
+        b
+
+            |bytes| -- Inventory in plaintext |objects.inv| format
+
+        Raises
+        ------
+        ValueError
+
+            If both `expand` and `contract` are |True|
+
+        """
+        names, uris, dispnames = self._uri_dispname_columns(expand, contract)
+        fmt = SuperDataObj.data_line_fmt.format
+
+        lines = map(
+            lambda n, d, r, p, u, dn: fmt(
+                name=n, domain=d, role=r, priority=p, uri=u, dispname=dn
+            ),
+            names,
+            self.column(DataFields.Domain),
+            self.column(DataFields.Role),
+            self.column(DataFields.Priority),
+            uris,
+            dispnames,
+        )
+
+        return "\n".join(
+            (
+                Inventory.header_preamble,
+                Inventory.header_project.format(project=self.project),
+                Inventory.header_version.format(version=self.version),
+                Inventory.header_zlib,
+                *lines,
+                "",
+            )
+        ).encode("utf-8")
+
+    def json_dict(self, expand=False, contract=False):
+        """Generate a flat |dict| representation of the table.
+
+        The output is identical to that of
+        :meth:`Inventory.json_dict() <sphobjinv.inventory.Inventory.json_dict>`
+        for an |Inventory| with the same contents.
+
+        Calling with both `expand` and `contract` as |True| is invalid.
+
+        Parameters
+        ----------
+        expand
+
+            |bool| *(optional)* -- Return |dict| with any
+            :data:`~sphobjinv.data.SuperDataObj.uri` or
+            :data:`~sphobjinv.data.SuperDataObj.dispname`
+            abbreviations expanded
+
+        contract
+
+            |bool| *(optional)* -- Return |dict| with abbreviated
+            :data:`~sphobjinv.data.SuperDataObj.uri` and
+            :data:`~sphobjinv.data.SuperDataObj.dispname` values
+
+        Returns
+        -------
+        d
+
+            |dict| -- Inventory data; keys and values are all |str|
+
+        Raises
+        ------
+        ValueError
+
+            If both `expand` and `contract` are |True|
+
+        """
+        names, uris, dispnames = self._uri_dispname_columns(expand, contract)
+        keys = [f.value for f in DataFields]
+
+        d = {
+            HeaderFields.Project.value: self.project,
+            HeaderFields.Version.value: self.version,
+            HeaderFields.Count.value: self.count,
+        }
+
+        rows = zip(
+            names,
+            self.column(DataFields.Domain),
+            self.column(DataFields.Role),
+            self.column(DataFields.Priority),
+            uris,
+            dispnames,
+        )
+        d.update((str(i), dict(zip(keys, row))) for i, row in enumerate(rows))
+
+        return d
@@ -100,6 +100,63 @@ class TestInventory:
         with pytest.raises(TypeError):
             soi.Inventory("abcdefg")
 
+    @pytest.mark.parametrize("name", ["thisfilewillneverexist.foo", "."])
+    def test_apifail_cache_load_bad_path(self, name, tmp_path):
+        """Confirm a missing or unreadable cache source path raises TypeError."""
+        cache = soi.InventoryCache(tmp_path / "cache")
+
+        with pytest.raises(TypeError):
+            cache.load(tmp_path / name)
+
+        assert not any((tmp_path / "cache").iterdir())
+
+    def test_apifail_inventory_json_file_as_source(self, res_path, misc_info):
+        """Confirm a JSON file path is rejected by the general import."""
+        with pytest.raises(TypeError):
+            soi.Inventory(res_path / (misc_info.FNames.RES + misc_info.Extensions.JSON))
+
+    def test_apifail_inventory_binary_invalid(self, res_cmp):
+        """Confirm errors raised on corrupt or unsupported binary inventories."""
+        b = soi.encode_binary(soi.Inventory(res_cmp))
+
+        with pytest.raises(ValueError):
+            soi.Inventory(binary=b[:-1])
+
+        with pytest.raises(ValueError):
+            soi.Inventory(binary=b"\0" + b[1:])
+
+        with pytest.raises(soi.VersionError):
+            soi.Inventory(
+                binary=b.replace(
+                    soi.binary.MAGIC + b"\x01", soi.binary.MAGIC + b"\x02", 1
+                )
+            )
+
+        with pytest.raises(TypeError):
+            soi.Inventory(b[:-1])
+
+    def test_apifail_inventory_binary_bad_pair_ref(self, res_cmp):
+        """Confirm ValueError on a domain/role reference past the string table."""
+        b = soi.encode_binary(soi.Inventory(res_cmp))
+
+        # Walk the header to the first domain reference
+        rdr = soi.binary._Reader(b)
+        rdr.take(len(soi.binary.MAGIC))
+        rdr.varint()
+        rdr.text()
+        rdr.text()
+        n_strings = rdr.varint()
+        rdr.take(rdr.varint())
+        w_str = rdr.take(2)[0]
+        rdr.varint()
+
+        bad_ref = n_strings.to_bytes(w_str, "little")
+        start, end = rdr.pos, rdr.pos + w_str
+        b = b[:start] + bad_ref + b[end:]
+
+        with pytest.raises(ValueError):
+            soi.Inventory(binary=b)
+
     def test_apifail_inventory_dictimport_noitems(self):
         """Confirm ValueError with no-items dict passed to json_dict."""
         d = {
@@ -136,6 +193,21 @@ class TestInventory:
         with pytest.raises(ValidationError):
             soi.Inventory(dict_json=d)
 
+    def test_apifail_inventory_dictimport_badobj_message(
+        self, res_cmp, jsonschema_validator
+    ):
+        """Confirm the error for an invalid dict is the full validator's."""
+        d = soi.Inventory(res_cmp).json_dict()
+        d["3"]["name"] = 42
+
+        with pytest.raises(ValidationError) as e_info:
+            soi.Inventory(dict_json=d)
+
+        assert (
+            e_info.value.message
+            == next(jsonschema_validator(soi.json_schema).iter_errors(d)).message
+        )
+
     @pytest.mark.parametrize("path_fxn", PATH_FXNS, ids=PATH_FXN_IDS)
     def test_apifail_inventory_dictimport_toobig(self, path_fxn, res_dec):
         """Confirm error raised when JSON dict passed w/too many objects."""
@@ -189,6 +261,54 @@ class TestInventory:
         with pytest.raises(soi.VersionError):
             soi.decompress(unix2dos(b_cmp))
 
+    def test_apifail_decompress_lines_bad_version(self, res_cmp):
+        """Confirm streaming decompression rejects a non-v2 header."""
+        b_cmp = soi.readbytes(res_cmp).replace(b"version 2", b"version 1", 1)
+
+        with pytest.raises(soi.VersionError):
+            next(soi.decompress_lines(b_cmp))
+
+    def test_apifail_inventory_suggest_unknown_scorer(self, res_cmp):
+        """Confirm an unknown suggest scorer is rejected."""
+        inv = soi.Inventory(res_cmp)
+
+        with pytest.raises(ValueError, match="Unknown scorer 'nope'"):
+            inv.suggest("evolve", scorer="nope")
+
+    @pytest.mark.parametrize("limit", [0, -1])
+    def test_apifail_inventory_suggest_bad_limit(self, limit, res_cmp):
+        """Confirm a suggest limit below 1 is rejected."""
+        inv = soi.Inventory(res_cmp)
+
+        with pytest.raises(ValueError, match="'limit' must be at least 1"):
+            inv.suggest("evolve", limit=limit)
+
+        with pytest.raises(ValueError, match="'limit' must be at least 1"):
+            inv.suggest_many(["evolve"], limit=limit)
+
+    @pytest.mark.parametrize("workers", [0, -2, 2.5, "2"])
+    def test_apifail_inventory_suggest_bad_workers(self, workers, res_cmp):
+        """Confirm a suggest worker count other than None or 1+ is rejected."""
+        inv = soi.Inventory(res_cmp)
+
+        with pytest.raises(ValueError, match="'workers' must be None or an int"):
+            inv.suggest("evolve", workers=workers)
+
+        with pytest.raises(ValueError, match="'workers' must be None or an int"):
+            inv.suggest_many(["evolve"], workers=workers)
+
+    @pytest.mark.parametrize(
+        "kwargs", [{}, {"factory": str, "pairwise": max}], ids=["neither", "both"]
+    )
+    def test_apifail_register_scorer_args(self, kwargs):
+        """Confirm a scorer needs exactly one of a factory or pairwise function."""
+        from sphobjinv.suggest import register_scorer, SCORERS
+
+        with pytest.raises(ValueError, match="Exactly one of"):
+            register_scorer("bad", **kwargs)
+
+        assert "bad" not in SCORERS
+
     @pytest.mark.parametrize("bad_arg", DISALLOWED_INV_INIT_ARGS)
     def test_apifail_invalid_inventory_init_arg(self, bad_arg):
         """Confirm non-__init__ Inventory members raise exceptions when passed."""
@@ -239,3 +359,15 @@ class TestImmutable:
                 inv.objects[0].as_bytes.name = b"newname"
             else:
                 inv.objects[0].name = "newname"
+
+
+class TestInventoryTable:
+    """Tests for the InventoryTable class."""
+
+    @pytest.mark.parametrize("method", ["data_file", "json_dict"])
+    def test_apifail_table_bothargstrue(self, method, res_cmp):
+        """Confirm error raised when both expand and contract are True."""
+        table = soi.InventoryTable.from_inventory(soi.Inventory(res_cmp))
+
+        with pytest.raises(ValueError):
+            getattr(table, method)(expand=True, contract=True)
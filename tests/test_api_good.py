@@ -48,6 +48,11 @@ PATH_FXNS = (no_op, str)
 PATH_FXN_IDS = ("no_op", "str")
 
 
+def length_score(p1, p2):
+    """Score processed strings by their difference in length, for suggest tests."""
+    return max(100 - abs(len(p1) - len(p2)), 0)
+
+
 class TestCore:
     """Tests of core sphobjinv functionality."""
 
@@ -64,6 +69,8 @@ class TestCore:
                     soi.SourceTypes.FnameZlib,
                     soi.SourceTypes.DictJSON,
                     soi.SourceTypes.URL,
+                    soi.SourceTypes.BytesBinary,
+                    soi.SourceTypes.FnameBinary,
                 ],
                 fillvalue=None,
             )
@@ -102,6 +109,54 @@ class TestCore:
 
         decomp_cmp_test(dest_path)
 
+    def test_api_decompress_blocks(self, res_cmp, res_dec):
+        """Confirm joined decompressed blocks reproduce the plaintext inventory."""
+        b_cmp = soi.readbytes(res_cmp)
+
+        b_dec = b"".join(soi.decompress_blocks(b_cmp))
+
+        assert b_dec == soi.readbytes(res_dec).replace(b"\r\n", b"\n")
+
+    def test_api_decompress_lines_stream(self, res_cmp):
+        """Confirm line-wise decompression from an open file matches decompress."""
+        with res_cmp.open("rb") as f:
+            lines = list(soi.decompress_lines(f))
+
+        b_dec = soi.decompress(soi.readbytes(res_cmp)).replace(b"\r\n", b"\n")
+
+        assert lines == b_dec.splitlines()
+        assert len(lines) == 60
+
+    @pytest.mark.parametrize(
+        ["ext", "source_type"],
+        [
+            (".inv", soi.SourceTypes.BytesZlib),
+            (".txt", soi.SourceTypes.BytesPlaintext),
+            (".json", soi.SourceTypes.DictJSON),
+        ],
+        ids=(lambda v: v if isinstance(v, str) else ""),
+    )
+    def test_api_sniffbytes(self, ext, source_type, res_path, misc_info):
+        """Confirm inventory formats are identified from file contents."""
+        b = soi.readbytes(res_path / (misc_info.FNames.RES + ext))
+
+        assert soi.sniffbytes(b) is source_type
+
+    def test_api_sniffbytes_zlib_level_zero(self, res_path):
+        """Confirm an uncompressed-deflate (level 0) inventory is identified."""
+        b = soi.readbytes(res_path / "objects_mkdoc_zlib0.inv")
+
+        assert soi.sniffbytes(b) is soi.SourceTypes.BytesZlib
+
+    def test_api_mapbytes(self, res_cmp, tmp_path):
+        """Confirm mapped file contents, including for an empty file."""
+        with soi.mapbytes(res_cmp) as m:
+            assert m[:] == soi.readbytes(res_cmp)
+
+        (tmp_path / "empty").write_bytes(b"")
+        with soi.mapbytes(tmp_path / "empty") as m:
+            assert m == b""
+
     @pytest.mark.parametrize(
         ["element", "datadict"],
         (
@@ -131,7 +186,7 @@ class TestCore:
     )
     def test_api_data_regex(self, element, datadict, bytes_txt, misc_info):
         """Confirm the regex for loading data lines is working properly."""
-        # Prelim approximate check to be sure we're working with the
+        # Prelim prefilter check to be sure we're working with the
         # correct file/data.
         assert len(soi.re.pb_data.findall(bytes_txt)) == 56
 
@@ -139,6 +194,37 @@ class TestCore:
 
         assert mchs[element].groupdict() == {_.value: datadict[_] for _ in datadict}
 
+    @pytest.mark.parametrize(
+        "line",
+        [
+            b"attr.Attribute py:class 1 api.html#$ -",
+            b"name with spaces py:function 1 api.html#$ Display name\r",
+            b"foo py:method -1  Empty URI",
+            b"foo   std:label 2 a.html   spaced\t",
+            b"a b:c 1 x py:function 1 uri disp",
+            b"foo py:function 1 uri   ",
+            b"foo py:function 1 uri \r",
+            b"foo py:func:tion 1 uri disp",
+            b"foo py:function one uri disp",
+            b"foo py:function 1 uri",
+            b"# Sphinx inventory version 2",
+        ],
+    )
+    def test_api_parse_data_line_matches_regex(self, line):
+        """Confirm the data line tokenizer reproduces the regex results."""
+        mch = soi.pb_data.match(line)
+
+        assert soi.parse_data_line(line) == (mch.groups() if mch else None)
+
+    def test_api_iter_data_lines(self, bytes_txt, unix2dos):
+        """Confirm tokenized data lines and offsets match the regex scan."""
+        for b in (bytes_txt, unix2dos(bytes_txt)):
+            mchs = list(soi.pb_data.finditer(b))
+
+            assert list(soi.iter_data_lines(b)) == [m.groups() for m in mchs]
+            assert list(soi.data_line_offsets(b)) == [m.start() for m in mchs]
+            assert soi.parse_data_line_at(b, mchs[-1].start()) == mchs[-1].groups()
+
     def test_api_compress_win_eols(self, unix2dos, res_dec):
         """Confirm the scrub for Windows EOLs is working.
 
@@ -310,6 +396,39 @@ class TestDataObj:
 
         assert obj1 != obj1.as_bytes
 
+    def test_api_dataobj_twin_deferred(self, res_cmp):
+        """Confirm the bytes/str twin of a DataObj is only built when accessed."""
+        inv = soi.Inventory(res_cmp)
+
+        obj = inv.objects[0]
+        assert obj._as_bytes is None
+
+        b_obj = obj.as_bytes
+        assert obj.as_bytes is b_obj
+        assert b_obj.as_str is obj
+        assert b_obj.as_bytes is b_obj
+
+        b_obj2 = soi.DataObjBytes(**b_obj.json_dict())
+        assert b_obj2._as_str is None
+        assert b_obj2.as_str == obj
+
+    def test_api_dataobj_self_twin_arg_accepted(self, res_cmp):
+        """Confirm the former self-referencing twin arguments are still accepted."""
+        inv = soi.Inventory(res_cmp)
+
+        obj = inv.objects[0]
+        b_obj = obj.as_bytes
+
+        obj2 = soi.DataObjStr(**obj.json_dict(), as_str=obj, as_bytes=b_obj)
+        assert obj2 == obj
+        assert obj2.as_str is obj2
+        assert obj2.as_bytes is b_obj
+
+        b_obj2 = soi.DataObjBytes(**b_obj.json_dict(), as_bytes=b_obj, as_str=obj)
+        assert b_obj2 == b_obj
+        assert b_obj2.as_bytes is b_obj2
+        assert b_obj2.as_str is obj
+
 
 class TestInventory:
     """Tests of the Inventory class."""
@@ -376,6 +495,103 @@ class TestInventory:
                 inv = soi.Inventory(**{inv_arg: source.decode("utf-8")})
                 attrs_inventory_test(inv, source_type)
 
+    @pytest.mark.parametrize(
+        ["ext", "source_type"],
+        [
+            (".inv", soi.SourceTypes.FnameZlib),
+            (".txt", soi.SourceTypes.FnamePlaintext),
+        ],
+        ids=(lambda v: v if isinstance(v, str) else ""),
+    )
+    def test_api_inventory_general_fname_single_read(
+        self, ext, source_type, res_path, misc_info, monkeypatch
+    ):
+        """Confirm general import of a file reads it only once."""
+        reads = []
+
+        def mapbytes(path):
+            reads.append(path)
+            return soi.fileops.mapbytes(path)
+
+        monkeypatch.setattr(soi.inventory, "mapbytes", mapbytes)
+
+        inv = soi.Inventory(res_path / (misc_info.FNames.RES + ext))
+
+        assert inv.source_type is source_type
+        assert len(reads) == 1
+
+    def test_api_inventory_fname_lazy_outlives_mapping(self, res_cmp, res_dec):
+        """Confirm lazy objects from a file remain usable after it is unmapped."""
+        for kwargs in ({"fname_zlib": res_cmp}, {"fname_plain": res_dec}):
+            inv = soi.Inventory(**kwargs, lazy=True)
+
+            assert inv.objects[-1] == soi.Inventory(res_cmp).objects[-1]
+
+    def test_api_inventory_binary_roundtrip(self, res_cmp, res_path, tmp_path):
+        """Confirm binary inventories reproduce the original, by all import paths."""
+        inv = soi.Inventory(res_cmp)
+        b = soi.encode_binary(inv)
+        path = tmp_path / "objects.soib"
+        path.write_bytes(b)
+
+        assert soi.sniffbytes(b) is soi.SourceTypes.BytesBinary
+        assert len(b) < len(soi.readbytes(res_path / "objects_attrs.json"))
+
+        for inv2, source_type in (
+            (soi.Inventory(binary=b), soi.SourceTypes.BytesBinary),
+            (soi.Inventory(b), soi.SourceTypes.BytesBinary),
+            (soi.Inventory(fname_binary=path), soi.SourceTypes.FnameBinary),
+            (soi.Inventory(path), soi.SourceTypes.FnameBinary),
+        ):
+            assert inv2 == inv
+            assert inv2.source_type is source_type
+            assert inv2.data_file() == inv.data_file()
+
+        expanded = soi.Inventory(binary=soi.encode_binary(inv, expand=True))
+        assert expanded.data_file() == inv.data_file(expand=True)
+
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            lambda d: None,
+            lambda d: d.update({"metadata": {"url": ["any", "value"]}}),
+            lambda d: d.update({"12a": d["0"]}),
+            lambda d: d.update({"count": True}),
+            lambda d: d.update({"": d["0"]}),
+            lambda d: d["0"].update({"name": 1}),
+            lambda d: d["0"].pop("uri"),
+            lambda d: d.pop("project"),
+        ],
+        ids=[
+            "valid",
+            "metadata",
+            "digit_prefix_key",
+            "bool_count",
+            "empty_key",
+            "nonstr_field",
+            "missing_field",
+            "missing_project",
+        ],
+    )
+    def test_api_inventory_json_quick_validation(
+        self, mutate, res_cmp, jsonschema_validator
+    ):
+        """Confirm the quick JSON dict check never passes an invalid dict."""
+        d = soi.Inventory(res_cmp).json_dict()
+        mutate(d)
+
+        assert soi.Inventory._is_json_dict(d) == jsonschema_validator(
+            soi.json_schema
+        ).is_valid(d)
+
+    def test_api_inventory_json_no_validate(self, res_cmp):
+        """Confirm trusted JSON import matches the validated import."""
+        inv = soi.Inventory(res_cmp)
+        inv2 = soi.Inventory(dict_json=inv.json_dict(), validate=False)
+
+        assert inv2 == inv
+        assert inv2.source_type is soi.SourceTypes.DictJSON
+
     def test_api_inventory_equality(self, res_cmp):
         """Confirm the attrs Inventory equality methods work as expected."""
         inv1 = soi.Inventory(res_cmp)
@@ -399,6 +615,290 @@ class TestInventory:
         assert inv1 != inv3
         assert inv1 != inv4
 
+    def test_api_inventory_lazy_objects(self, res_cmp):
+        """Confirm lazy object construction matches eager import."""
+        inv = soi.Inventory(res_cmp)
+        inv_lazy = soi.Inventory(res_cmp, lazy=True)
+
+        assert isinstance(inv_lazy.objects, soi.LazyObjects)
+        assert inv_lazy.count == inv.count
+        assert not inv_lazy.objects._cache
+
+        assert inv_lazy.objects[-1] == inv.objects[-1]
+        assert inv_lazy.objects[3:7] == inv.objects[3:7]
+        assert inv_lazy.objects[5] is inv_lazy.objects[5]
+        assert len(inv_lazy.objects._cache) == 5
+
+        assert inv_lazy == inv
+        assert inv_lazy.data_file() == inv.data_file()
+
+        inv_lazy.objects[0].name = "foobar"
+        assert inv_lazy.objects[0].name == "foobar"
+        assert inv_lazy != inv
+
+    def test_api_inventory_lazy_objects_mutation(self, res_cmp):
+        """Confirm list-like mutation of lazily constructed objects."""
+        inv = soi.Inventory(res_cmp)
+        inv_lazy = soi.Inventory(res_cmp, lazy=True)
+
+        first = inv_lazy.objects[0]
+        obj = inv_lazy.objects.pop()
+        inv_lazy.objects.insert(0, obj)
+
+        assert inv_lazy.objects.materialized
+        assert inv_lazy.objects[1] is first
+        assert inv_lazy.objects == [inv.objects[-1]] + inv.objects[:-1]
+
+        inv_lazy.objects.sort(key=lambda o: o.data_line())
+        inv.objects.sort(key=lambda o: o.data_line())
+        assert inv_lazy == inv
+
+    def test_api_inventory_index_lookups(self, res_cmp):
+        """Confirm exact lookups through the inventory index."""
+        inv = soi.Inventory(res_cmp)
+        objs = list(inv.objects)
+        obj = objs[5]
+
+        assert inv.index.get(obj.name, obj.domain, obj.role) is obj
+        assert inv.index.get(obj.name, obj.domain, "nonexistent") is None
+        assert inv.index.get("nonexistent", "py", "class", obj) is obj
+        assert inv.index.get_all(obj.name, obj.domain, obj.role) == [obj]
+        assert inv.index.by_name(obj.name) == [o for o in objs if o.name == obj.name]
+        assert inv.index.by_domain_role("py:class") == [
+            o for o in objs if o.domain == "py" and o.role == "class"
+        ]
+        assert inv.index.by_domain_role("py:nonexistent") == []
+        assert isinstance(inv.objects, soi.ObjectList)
+        assert inv.objects == objs
+
+    def test_api_inventory_index_updates(self, res_cmp):
+        """Confirm the inventory index follows changes to the objects."""
+        inv = soi.Inventory(res_cmp, lazy=True)
+        obj = inv.objects[0]
+        new = obj.evolve(name="new.name")
+        index = inv.index
+
+        inv.objects[0] = new
+        assert inv.index is index
+        assert not index.stale
+        assert index.get(new.name, new.domain, new.role) is new
+        assert index.get(obj.name, obj.domain, obj.role) is None
+
+        inv.objects.append(new)
+        assert index.get_all(new.name, new.domain, new.role) == [new, new]
+        inv.objects.remove(new)
+        assert index.get_all(new.name, new.domain, new.role) == [new]
+
+        inv.objects = [obj]
+        assert inv.index is not index
+        assert inv.index.get(obj.name, obj.domain, obj.role) is obj
+        assert inv.index.by_name(new.name) == []
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_api_inventory_index_held_objects(self, lazy, res_cmp):
+        """Confirm the index follows changes through an earlier objects reference."""
+        inv = soi.Inventory(res_cmp, lazy=lazy)
+        objs = inv.objects
+        new = objs[0].evolve(name="new.name")
+
+        index = inv.index
+        assert inv.objects is objs
+
+        objs.append(new)
+        assert inv.count == 57
+        assert inv.index is index
+        assert index.get(new.name, new.domain, new.role) is new
+
+    def test_api_inventory_objects_always_objectlist(self, res_cmp):
+        """Confirm the objects of an inventory are always an ObjectList."""
+        assert isinstance(soi.Inventory().objects, soi.ObjectList)
+
+        inv = soi.Inventory(res_cmp)
+        assert isinstance(inv.objects, soi.ObjectList)
+
+        objs = inv.objects[:3]
+        inv.objects = objs
+        assert isinstance(inv.objects, soi.ObjectList)
+        assert inv.objects == objs
+
+        obj_list = soi.ObjectList(objs)
+        inv.objects = obj_list
+        assert inv.objects is obj_list
+
+    @pytest.mark.parametrize(
+        ["prefix", "domain", "role"],
+        [
+            ("", None, None),
+            ("attr.", None, None),
+            ("attr.v", None, None),
+            ("attr.", "py", "function"),
+            ("attr.validators.", "py", None),
+            ("nonexistent", None, None),
+        ],
+    )
+    def test_api_inventory_prefix_index(self, prefix, domain, role, res_cmp):
+        """Confirm prefix completion matches a scan of the objects."""
+        inv = soi.Inventory(res_cmp)
+        found = sorted(
+            (
+                o
+                for o in inv.objects
+                if o.name.startswith(prefix)
+                and domain in (None, o.domain)
+                and role in (None, o.role)
+            ),
+            key=lambda o: o.name,
+        )
+        children = {
+            prefix + o.name.replace(prefix, "", 1).partition(".")[0] for o in found
+        }
+
+        px = inv.prefix_index
+        assert px.complete(prefix, domain=domain, role=role) == found
+        assert px.complete(prefix, domain=domain, role=role, limit=3) == found[:3]
+        assert px.children(prefix, domain=domain, role=role) == sorted(children)
+        assert len(px.children(prefix, domain=domain, role=role, limit=2)) == min(
+            2, len(children)
+        )
+
+    def test_api_inventory_prefix_index_updates(self, res_cmp):
+        """Confirm prefix completion follows changes to the objects."""
+        inv = soi.Inventory(res_cmp)
+        obj = inv.objects[0]
+        new = obj.evolve(name="attr.zzz.member")
+        px = inv.prefix_index
+
+        inv.objects.append(new)
+        assert inv.prefix_index is px
+        assert px.complete("attr.zzz") == [new]
+        assert px.children("attr.z") == ["attr.zzz"]
+
+        inv.objects.remove(obj)
+        assert obj not in px.complete(obj.name)
+
+    @pytest.mark.parametrize(
+        "base_url",
+        [None, "https://example.org/docs", "https://example.org/docs/"],
+        ids=["relative", "base_noslash", "base_slash"],
+    )
+    def test_api_inventory_uri_index(self, base_url, res_cmp):
+        """Confirm objects are found from the URLs they point to."""
+        inv = soi.Inventory(res_cmp)
+        obj = next(o for o in inv.objects if o.uri.endswith("$"))
+        url = obj.uri_expanded
+        if base_url:
+            url = base_url.rstrip("/") + "/" + url
+        page, _, anchor = obj.uri_expanded.partition("#")
+
+        ux = inv.uri_index
+        assert ux.lookup(url, base_url) == [
+            o for o in inv.objects if o.uri_expanded == obj.uri_expanded
+        ]
+        assert ux.on_page(url, base_url) == [
+            o for o in inv.objects if o.uri_expanded.partition("#")[0] == page
+        ]
+        assert ux.by_anchor("#" + anchor) == ux.by_anchor(anchor) == [obj]
+        assert ux.lookup("https://elsewhere.org/" + obj.uri_expanded, base_url) == []
+
+        inv.objects.remove(obj)
+        assert obj not in ux.lookup(url, base_url)
+
+    def test_api_objectlist_observers(self, res_cmp):
+        """Confirm ObjectList reports each change to its observers."""
+        objs = soi.ObjectList(soi.Inventory(res_cmp).objects[:3])
+        a, b, c = objs
+        changes = []
+
+        class Observer:
+            def objects_changed(self, removed, added):
+                changes.append((list(removed), list(added)))
+
+        observer = Observer()
+        objs.add_observer(observer)
+
+        for mutate, change in (
+            (lambda lst: lst.append(a), ([], [a])),
+            (lambda lst: lst.extend(iter([b])), ([], [b])),
+            (lambda lst: lst.insert(0, c), ([], [c])),
+            (lambda lst: lst.remove(c), ([c], [])),
+            (lambda lst: lst.pop(), ([b], [])),
+            (lambda lst: lst.__setitem__(0, b), ([a], [b])),
+            (lambda lst: lst.__setitem__(slice(0, 2), [c]), ([b, b], [c])),
+            (lambda lst: lst.__delitem__(slice(0, 1)), ([c], [])),
+            (lambda lst: lst.__iadd__([a]), ([], [a])),
+            (lambda lst: lst.__imul__(2), ([], [c, a, a])),
+            (lambda lst: lst.sort(key=lambda o: o.name), ([], [])),
+            (lambda lst: lst.reverse(), ([], [])),
+            (lambda lst: lst.clear(), ([c, c, a, a, a, a], [])),
+        ):
+            version = objs.version
+            mutate(objs)
+            assert objs.version == version + 1
+            assert changes.pop() == change
+
+        objs.remove_observer(observer)
+        objs.append(a)
+        assert not changes
+
+    def test_api_lazyobjects_observers(self, res_cmp):
+        """Confirm LazyObjects reports each change to its observers."""
+        objs = soi.Inventory(res_cmp, lazy=True).objects
+        a, b, c = objs[:3]
+        changes = []
+
+        class Observer:
+            def objects_changed(self, removed, added):
+                changes.append((list(removed), list(added)))
+
+        observer = Observer()
+        objs.add_observer(observer)
+
+        del objs[3:]
+        assert changes.pop() == (soi.Inventory(res_cmp).objects[3:], [])
+
+        for mutate, change in (
+            (lambda lst: lst.append(a), ([], [a])),
+            (lambda lst: lst.extend(iter([b])), ([], [b])),
+            (lambda lst: lst.insert(0, c), ([], [c])),
+            (lambda lst: lst.__setitem__(0, b), ([c], [b])),
+            (lambda lst: lst.__setitem__(slice(0, 2), [c]), ([b, a], [c])),
+            (lambda lst: lst.__delitem__(0), ([c], [])),
+            (lambda lst: lst.__iadd__([a]), ([], [a])),
+            (lambda lst: lst.sort(key=lambda o: o.name), ([], [])),
+            (lambda lst: lst.reverse(), ([], [])),
+            (lambda lst: lst.clear(), ([c, b, b, a, a], [])),
+        ):
+            version = objs.version
+            mutate(objs)
+            assert objs.version == version + 1
+            assert changes.pop() == change
+
+        objs.remove_observer(observer)
+        objs.append(a)
+        assert not changes
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_api_inventory_indexes_held_objects(self, lazy, res_cmp):
+        """Confirm all indexes observe the list held before their first use."""
+        inv = soi.Inventory(res_cmp, lazy=lazy)
+        objs = inv.objects
+        obj = objs[0]
+        new = obj.evolve(name="attr.zzz_new", uri="zzz.html#$")
+
+        indexes = (inv.index, inv.prefix_index, inv.uri_index)
+        assert all(ix.objects is objs for ix in indexes)
+
+        objs.append(new)
+        assert (inv.index, inv.prefix_index, inv.uri_index) == indexes
+        assert inv.index.by_name(new.name) == [new]
+        assert inv.prefix_index.complete("attr.zzz") == [new]
+        assert inv.uri_index.lookup(new.uri_expanded) == [new]
+
+        objs.remove(new)
+        assert inv.index.by_name(new.name) == []
+        assert inv.prefix_index.complete("attr.zzz") == []
+        assert inv.uri_index.lookup(new.uri_expanded) == []
+
     @pytest.mark.parametrize("prop", ("none", "expand", "contract"))
     def test_api_inventory_flatdict_jsonvalidate(
         self, prop, res_cmp, jsonschema_validator
@@ -469,6 +969,365 @@ class TestInventory:
         check.is_instance(rec[0][1], Number)
         check.equal(rec[0][2], idx)
 
+    @pytest.mark.parametrize("name", ["evolve", "attr.s", "validators", "zzzz"])
+    def test_api_inventory_suggest_matches_fuzzywuzzy(self, name, res_cmp):
+        """Confirm suggest gives the fuzzywuzzy WRatio score of each object."""
+        from sphobjinv._vendored.fuzzywuzzy import fuzz
+
+        inv = soi.Inventory(res_cmp)
+        scored = [
+            (o.as_rst, fuzz.WRatio(name, o.as_rst), i)
+            for i, o in enumerate(inv.objects)
+        ]
+        expect = sorted((r for r in scored if r[1] >= 30), key=lambda r: -r[1])
+
+        assert inv.suggest(name, thresh=30, with_index=True, with_score=True) == (
+            expect
+        )
+
+    @pytest.mark.parametrize(
+        "name",
+        ["evolve", "ib", "attr validators instance of", "py:function:`attr.s`" * 6],
+    )
+    def test_api_suggest_wratio_scorer(self, name, res_cmp):
+        """Confirm the reusable WRatio scorer gives the fuzzywuzzy scores."""
+        from sphobjinv._vendored.fuzzywuzzy import fuzz
+        from sphobjinv.suggest import process, WRatioScorer
+
+        scorer = WRatioScorer(process(name))
+
+        for rst in soi.Inventory(res_cmp).objects_rst:
+            assert scorer(process(rst)) == fuzz.WRatio(name, rst)
+
+    @pytest.mark.parametrize("scorer", ["wratio", "levenshtein"])
+    def test_api_suggest_scorer_given_tokens(self, scorer, res_cmp):
+        """Confirm scorers give the same scores with cached tokens."""
+        from sphobjinv.suggest import features, process, SCORERS
+
+        score_fxn = SCORERS[scorer](process("attr validators"))
+
+        for p in soi.Inventory(res_cmp).suggest_corpus.processed:
+            f = features(p)
+            assert score_fxn(p, (f[6], f[4])) == score_fxn(p)
+
+    @pytest.mark.parametrize("name", ["evolve", "attr.s", "validators", "ib", "zzzz"])
+    def test_api_inventory_suggest_approximate(self, name, res_cmp):
+        """Confirm approximate suggest returns a subset of the exact results."""
+        inv = soi.Inventory(res_cmp)
+        full = inv.suggest(name, thresh=50, with_index=True, with_score=True)
+        pre = inv.suggest(
+            name, thresh=50, with_index=True, with_score=True, approximate=True
+        )
+
+        assert all(r in full for r in pre)
+        assert pre == [r for r in full if r in pre]
+
+        # Strong matches always share an n-gram with the name
+        assert [r for r in full if r[1] >= 70] == [r for r in pre if r[1] >= 70]
+
+    @pytest.mark.parametrize(
+        ("name", "thresh", "n_exact", "n_approx"),
+        [
+            ("attr.s", 50, 26, 22),
+            ("attr.s", 60, 24, 22),
+            ("attr.s", 70, 22, 22),
+            ("attr.Factory", 50, 24, 24),
+            ("validators", 50, 10, 10),
+        ],
+    )
+    def test_api_inventory_suggest_approximate_recall(
+        self, name, thresh, n_exact, n_approx, res_cmp
+    ):
+        """Confirm the recall of approximate suggest against exact results.
+
+        Below a threshold of about 70, approximate searches can omit
+        matches that share no n-gram with the name.
+
+        """
+        inv = soi.Inventory(res_cmp)
+        exact = inv.suggest(name, thresh=thresh, with_index=True)
+        approx = inv.suggest(name, thresh=thresh, with_index=True, approximate=True)
+
+        assert len(exact) == n_exact
+        assert len(approx) == n_approx
+        assert set(approx) <= set(exact)
+
+    @pytest.mark.parametrize("approximate", [False, True])
+    @pytest.mark.parametrize("limit", [1, 5, 1000])
+    def test_api_inventory_suggest_limit(self, limit, approximate, res_cmp):
+        """Confirm a suggest limit returns the leading full results."""
+        inv = soi.Inventory(res_cmp)
+        kwargs = {
+            "thresh": 10,
+            "with_index": True,
+            "with_score": True,
+            "approximate": approximate,
+        }
+
+        full = inv.suggest("instance", **kwargs)
+        assert inv.suggest("instance", limit=limit, **kwargs) == full[:limit]
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{}, {"limit": 5}, {"approximate": True}, {"thresh": 1}, {"thresh": 101}],
+    )
+    def test_api_inventory_suggest_workers(self, kwargs, res_cmp):
+        """Confirm a parallel suggest matches the serial results."""
+        from sphobjinv.suggest import shutdown_workers
+
+        inv = soi.Inventory(res_cmp)
+        serial = inv.suggest("instance", with_index=True, with_score=True, **kwargs)
+
+        try:
+            for _ in range(2):
+                assert serial == inv.suggest(
+                    "instance", with_index=True, with_score=True, workers=3, **kwargs
+                )
+        finally:
+            shutdown_workers()
+
+    @pytest.mark.parametrize("workers", [None, 2])
+    def test_api_inventory_suggest_many(self, workers, res_cmp):
+        """Confirm batch suggest matches individual suggest calls."""
+        from sphobjinv.suggest import shutdown_workers
+
+        inv = soi.Inventory(res_cmp)
+        names = ["instance", "evolve", "zzzz", "attr.s", "evolve"]
+        kwargs = {"thresh": 40, "with_index": True, "limit": 10}
+
+        try:
+            res = inv.suggest_many(names, workers=workers, **kwargs)
+        finally:
+            shutdown_workers()
+
+        assert list(res) == ["instance", "evolve", "zzzz", "attr.s"]
+        assert res == {name: inv.suggest(name, **kwargs) for name in names}
+
+    @pytest.mark.parametrize("scorer", ["qratio", "token_set", "substring", "prefix"])
+    @pytest.mark.parametrize("name", ["evolve", "instance", "attr"])
+    def test_api_inventory_suggest_scorers(self, name, scorer, res_cmp):
+        """Confirm each cheaper suggest scorer gives the expected scores."""
+        from sphobjinv._vendored.fuzzywuzzy import fuzz
+        from sphobjinv.suggest import process
+
+        def expect_score(rst):
+            p = process(rst)
+            if scorer == "qratio":
+                return fuzz.QRatio(name, rst)
+            if scorer == "token_set":
+                return fuzz.token_set_ratio(name, p)
+            if scorer == "prefix" and not re.search(r"(^|\s)" + name, p):
+                return 0
+            return 75 + 25 * len(name) // len(p) if name in p else 0
+
+        inv = soi.Inventory(res_cmp)
+        scored = [
+            (o.as_rst, expect_score(o.as_rst), i) for i, o in enumerate(inv.objects)
+        ]
+        expect = sorted((r for r in scored if r[1] >= 25), key=lambda r: -r[1])
+
+        res = inv.suggest(
+            name, thresh=25, with_index=True, with_score=True, scorer=scorer
+        )
+        assert res
+        assert res == expect
+
+    @pytest.mark.parametrize("thresh", [1, 40, 75, 90])
+    @pytest.mark.parametrize("scorer", ["wratio", "qratio", "token_set", "levenshtein"])
+    def test_api_inventory_suggest_pruning(self, scorer, thresh, res_cmp):
+        """Confirm suggest skips only objects that cannot reach the threshold."""
+        from sphobjinv.suggest import process, SCORERS
+
+        inv = soi.Inventory(res_cmp)
+        corpus = inv.suggest_corpus
+
+        for name in ["evolve", "instance", "attr.validators.in", "zq"]:
+            score_fxn = SCORERS[scorer](process(name))
+            scored = [
+                (rst, score_fxn(process(rst)), i)
+                for i, rst in enumerate(inv.objects_rst)
+            ]
+            expect = sorted((r for r in scored if r[1] >= thresh), key=lambda r: -r[1])
+
+            res = inv.suggest(
+                name, thresh=thresh, with_index=True, with_score=True, scorer=scorer
+            )
+            assert res == expect
+
+        assert corpus.scored + corpus.pruned == 4 * len(inv.objects)
+        assert corpus.prune_rate == corpus.pruned / (4 * len(inv.objects))
+        if thresh >= 75:
+            assert corpus.prune_rate > 0.5
+
+    def test_api_inventory_suggest_register_scorer(self, res_cmp):
+        """Confirm a registered scorer is used, including in worker processes."""
+        from sphobjinv.suggest import (
+            process,
+            register_scorer,
+            SCORERS,
+            shutdown_workers,
+        )
+
+        inv = soi.Inventory(res_cmp)
+        register_scorer("length", pairwise=length_score)
+
+        try:
+            res = inv.suggest("evolve", thresh=0, with_score=True, scorer="length")
+            par = inv.suggest(
+                "evolve", thresh=0, with_score=True, scorer="length", workers=2
+            )
+        finally:
+            del SCORERS["length"]
+            shutdown_workers()
+
+        assert par == res
+        assert res == sorted(
+            ((rst, length_score("evolve", process(rst))) for rst in inv.objects_rst),
+            key=lambda r: -r[1],
+        )
+
+    @pytest.mark.parametrize(
+        ("s1", "s2"),
+        [
+            ("", ""),
+            ("", "abc"),
+            ("kitten", "sitting"),
+            ("attr.s", "py:function:`attr.s`"),
+            ("aaaa", "a"),
+            ("abcabcabc", "cbacbacba"),
+            ("x" * 70 + "y", "y" + "x" * 70),
+        ],
+    )
+    def test_api_levenshtein_lcs(self, s1, s2):
+        """Confirm the bit-parallel LCS length matches the dynamic program."""
+        from sphobjinv.levenshtein import Pattern
+
+        prev = [0] * (len(s2) + 1)
+        for c1 in s1:
+            row = [0]
+            for j, c2 in enumerate(s2):
+                row.append(prev[j] + 1 if c1 == c2 else max(prev[j + 1], row[j]))
+            prev = row
+
+        assert Pattern(s1).lcs(s2) == prev[-1]
+        assert Pattern(s2).lcs(s1) == prev[-1]
+
+    @pytest.mark.parametrize(
+        ("s1", "s2"),
+        [
+            ("", "abc"),
+            ("attr.s", "py:function:`attr.s`"),
+            ("evolve", "py:function:`attr.evolve`"),
+            ("a", "aaaa"),
+            ("xyz", "abcabcabc"),
+        ],
+    )
+    def test_api_levenshtein_partial_ratio(self, s1, s2):
+        """Confirm the partial ratio is the best ratio over the longer string."""
+        from sphobjinv.levenshtein import Pattern
+
+        windows = (s2[i:][: len(s1)] for i in range(len(s2) - len(s1) + 1))
+        best = max(Pattern(s1).lcs(w) for w in windows)
+        expect = int(100 * (best / len(s1))) if s1 else 100
+
+        assert Pattern(s1).partial_ratio(s2) == expect
+        assert Pattern(s2).partial_ratio(s1) == expect
+
+    @pytest.mark.parametrize("workers", [None, 2])
+    def test_api_inventory_suggest_levenshtein(self, workers, res_cmp):
+        """Confirm suggest with the levenshtein scorer scores every object."""
+        from sphobjinv.levenshtein import Scorer
+        from sphobjinv.suggest import process, shutdown_workers
+
+        inv = soi.Inventory(res_cmp)
+        scorer = Scorer(process("evolve"))
+        scored = [
+            (o.as_rst, scorer(process(o.as_rst)), i) for i, o in enumerate(inv.objects)
+        ]
+        expect = sorted((r for r in scored if r[1] >= 40), key=lambda r: -r[1])
+
+        try:
+            res = inv.suggest(
+                "evolve",
+                thresh=40,
+                with_index=True,
+                with_score=True,
+                workers=workers,
+                scorer="levenshtein",
+            )
+        finally:
+            shutdown_workers()
+
+        assert res == expect
+        assert res[0][0] == ":py:function:`attr.evolve`"
+
+    def test_api_inventory_suggest_updates(self, res_cmp):
+        """Confirm cached rst and suggest search strings follow the objects."""
+        inv = soi.Inventory(res_cmp)
+        rst = inv.objects_rst
+        assert rst == [o.as_rst for o in inv.objects]
+        assert inv.objects_rst is not rst
+
+        new = inv.objects[0].evolve(name="brand_new_thing")
+        inv.objects.insert(0, new)
+        assert inv.objects_rst == [new.as_rst] + rst
+        assert inv.suggest("brand_new_thing", with_index=True)[0] == (new.as_rst, 0)
+
+        idx = inv.suggest("evolve", with_index=True)[0][1]
+        assert inv.objects[idx].name == "attr.evolve"
+        assert inv.suggest("evolve", with_index=True, approximate=True)[0][1] == idx
+
+        last = new.evolve(name="another_new_thing")
+        inv.objects.append(last)
+        res = inv.suggest("another_new_thing", with_index=True, approximate=True)
+        assert res[0] == (last.as_rst, len(inv.objects) - 1)
+        inv.objects.pop()
+
+        del inv.objects[:2]
+        assert inv.objects_rst == rst[1:]
+
+        inv.objects = inv.objects[:3]
+        assert inv.objects_rst == rst[1:4]
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_api_inventory_suggest_held_objects(self, lazy, res_cmp):
+        """Confirm suggest and objects_rst leave the objects list in place."""
+        inv = soi.Inventory(res_cmp, lazy=lazy)
+        objs = inv.objects
+
+        assert inv.suggest("evolve")
+        assert inv.objects_rst
+        assert inv.objects is objs
+
+        new = objs[0].evolve(name="brand_new_thing")
+        objs.append(new)
+        assert inv.count == 57
+        assert inv.objects_rst[-1] == new.as_rst
+        assert inv.suggest("brand_new_thing", with_index=True)[0] == (new.as_rst, 56)
+        assert inv.objects is objs
+
+    @pytest.mark.parametrize("approximate", [False, True])
+    def test_api_inventory_suggest_object_edited(self, approximate, res_cmp):
+        """Confirm cached suggest search strings follow in-place object edits."""
+        inv = soi.Inventory(res_cmp)
+        assert not inv.suggest("renamed_thing", thresh=90, approximate=approximate)
+
+        obj = inv.objects[0]
+        obj.name = "renamed_thing"
+        assert inv.objects_rst[0] == obj.as_rst
+        assert inv.objects_rst == [o.as_rst for o in inv.objects]
+
+        res = inv.suggest(
+            "renamed_thing", thresh=90, with_index=True, approximate=approximate
+        )
+        assert res[0] == (obj.as_rst, 0)
+
+        obj.role = "attribute"
+        res = inv.suggest(
+            "renamed_thing", thresh=90, with_index=True, approximate=approximate
+        )
+        assert res[0] == (":py:attribute:`renamed_thing`", 0)
+
     @pytest.mark.testall
     def test_api_inventory_suggest_operation(self, testall_inv_path):
         """Confirm that a suggest operation works on all smoke-test inventories."""
@@ -484,6 +1343,15 @@ class TestInventory:
 
         inv.suggest("class")
 
+    @pytest.mark.testall
+    def test_api_inventory_tokenizer_matches_regex(self, testall_inv_path):
+        """Confirm the data line tokenizer matches the regex on all inventories."""
+        b_plain = b"".join(soi.decompress_blocks(soi.readbytes(testall_inv_path)))
+
+        assert list(soi.iter_data_lines(b_plain)) == [
+            m.groups() for m in soi.pb_data.finditer(b_plain)
+        ]
+
     @pytest.mark.testall
     def test_api_inventory_datafile_gen_and_reimport(
         self,
@@ -601,3 +1469,113 @@ class TestInventory:
 
         # Should not raise an exception; assert is to emphasize this is the check
         assert soi.Inventory(inv.json_dict())
+
+
+class TestInventoryTable:
+    """Tests of the columnar InventoryTable."""
+
+    @pytest.mark.parametrize(
+        "kwargs", ({}, {"expand": True}, {"contract": True}), ids=["none", "exp", "con"]
+    )
+    def test_api_table_bulk_output_matches(self, kwargs, res_cmp):
+        """Confirm data_file and json_dict output matches the Inventory's."""
+        inv = soi.Inventory(res_cmp)
+        table = soi.InventoryTable.from_inventory(inv)
+
+        assert table.data_file(**kwargs) == inv.data_file(**kwargs)
+        assert table.json_dict(**kwargs) == inv.json_dict(**kwargs)
+
+    def test_api_table_roundtrip(self, res_cmp):
+        """Confirm conversion to and from Inventory and object access."""
+        inv = soi.Inventory(res_cmp)
+        table = soi.InventoryTable.from_inventory(inv)
+
+        assert table.count == len(table) == inv.count
+        assert list(table) == inv.objects
+        assert table[-3] == inv.objects[-3]
+        assert list(table[5:10]) == inv.objects[5:10]
+
+        assert table.to_inventory() == inv
+        assert soi.InventoryTable.from_inventory(table.to_inventory()) == table
+
+    def test_api_table_filter(self, res_cmp):
+        """Confirm filtering by domain and role."""
+        inv = soi.Inventory(res_cmp)
+        table = soi.InventoryTable.from_inventory(inv)
+
+        assert list(table.filter(domain="py")) == [
+            o for o in inv.objects if o.domain == "py"
+        ]
+        assert list(table.filter(domain="py", role="function")) == [
+            o for o in inv.objects if o.domain == "py" and o.role == "function"
+        ]
+        assert list(table.filter(role="label")) == [
+            o for o in inv.objects if o.role == "label"
+        ]
+        assert table.filter(domain="c").count == 0
+
+
+class TestInventoryCache:
+    """Tests of the on-disk InventoryCache."""
+
+    def test_api_cache_hit_matches_parse(self, res_cmp, res_dec, tmp_path):
+        """Confirm cached loads reproduce directly parsed inventories."""
+        cache = soi.InventoryCache(tmp_path / "cache")
+
+        for src in (res_cmp, res_dec, soi.readbytes(res_cmp)):
+            inv = soi.Inventory(src)
+            assert cache.load(src) == inv
+
+            cached = soi.InventoryCache(tmp_path / "cache").load(src)
+            assert cached == inv
+            assert cached.source_type is inv.source_type
+
+        # Zlib file and bytes share the same content key
+        assert cache.misses == 2
+        assert cache.hits == 1
+
+    def test_api_cache_modified_file(self, res_cmp, res_dec, scratch_path, tmp_path):
+        """Confirm a changed file is re-parsed rather than served stale."""
+        cache = soi.InventoryCache(tmp_path / "cache")
+        path = scratch_path / "objects.inv"
+        soi.writebytes(path, soi.readbytes(res_cmp))
+
+        cache.load(path)
+
+        inv = soi.Inventory(res_cmp)
+        inv.project = "Changed"
+        soi.writebytes(path, soi.compress(inv.data_file()))
+
+        assert cache.load(path).project == "Changed"
+        assert cache.misses == 2
+
+    def test_api_cache_lru_eviction(self, res_path, tmp_path):
+        """Confirm least recently used snapshots are evicted to fit max_size."""
+        paths = sorted(res_path.glob("objects_*.inv"))[:3]
+        cache = soi.InventoryCache(tmp_path / "cache")
+        for p in paths:
+            cache.load(p)
+        snaps = {p.name: p.stat().st_size for p in cache.path.glob("*.snap")}
+
+        small = soi.InventoryCache(tmp_path / "small", max_size=sum(snaps.values()))
+        small.load(paths[0])
+        small.load(paths[1])
+        small.load(paths[0])
+        small.load(paths[2])
+
+        # paths[1] was least recently used
+        assert small.load(paths[0]) and small.load(paths[2])
+        assert small.hits == 3
+        small.load(paths[1])
+        assert small.misses == 4
+
+    def test_api_cache_corrupt_snapshot(self, res_cmp, tmp_path):
+        """Confirm an unreadable snapshot is treated as a miss."""
+        cache = soi.InventoryCache(tmp_path)
+        cache.load(res_cmp)
+
+        for p in tmp_path.glob("*.snap"):
+            p.write_bytes(b"garbage")
+
+        assert cache.load(res_cmp) == soi.Inventory(res_cmp)
+        assert cache.misses == 2
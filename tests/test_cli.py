@@ -197,6 +197,7 @@ class TestConvertGood:
         plain_path = scratch_path / (misc_info.FNames.MOD + misc_info.Extensions.DEC)
         json_path = scratch_path / (misc_info.FNames.MOD + misc_info.Extensions.JSON)
         zlib_path = scratch_path / (misc_info.FNames.MOD + misc_info.Extensions.CMP)
+        binary_path = scratch_path / (misc_info.FNames.MOD + ".soib")
 
         if (
             not pytestconfig.getoption("--testall")
@@ -207,16 +208,18 @@ class TestConvertGood:
         run_cmdline_test(["convert", "plain", str(res_src_path), str(plain_path)])
         run_cmdline_test(["convert", "json", str(plain_path), str(json_path)])
         run_cmdline_test(["convert", "zlib", str(json_path), str(zlib_path)])
+        run_cmdline_test(["convert", "binary", str(zlib_path), str(binary_path)])
 
         invs = {
             "orig": Inventory(str(res_src_path)),
             "plain": Inventory(str(plain_path)),
             "zlib": Inventory(str(zlib_path)),
             "json": Inventory(json.loads(json_path.read_text())),
+            "binary": Inventory(fname_binary=binary_path),
         }
 
         for fmt, attrib in product(
-            ("plain", "zlib", "json"),
+            ("plain", "zlib", "json", "binary"),
             (
                 HeaderFields.Project.value,
                 HeaderFields.Version.value,
@@ -365,6 +368,47 @@ class TestSuggestGood:
             run_cmdline_test(["suggest", res_cmp, "instance", flags, "1"])
             assert nlines == out_.getvalue().count("\n")
 
+    @pytest.mark.parametrize("limit", [1, 5, 100])
+    @pytest.mark.timeout(CLI_TEST_TIMEOUT)
+    def test_cli_suggest_limit(self, limit, run_cmdline_test, res_cmp):
+        """Confirm suggest shows only the best results up to the limit."""
+        expect = Inventory(res_cmp).suggest("instance", thresh=1)[:limit]
+
+        with stdio_mgr() as (in_, out_, err_):
+            run_cmdline_test(
+                ["suggest", res_cmp, "instance", "-at", "1", "-l", str(limit)]
+            )
+            assert out_.getvalue().split() == expect
+
+    @pytest.mark.parametrize("scorer", ["qratio", "prefix", "levenshtein"])
+    @pytest.mark.timeout(CLI_TEST_TIMEOUT)
+    def test_cli_suggest_scorer(self, scorer, run_cmdline_test, res_cmp):
+        """Confirm suggest matches with the selected scorer."""
+        expect = Inventory(res_cmp).suggest("instance", thresh=25, scorer=scorer)
+        assert expect
+
+        with stdio_mgr() as (in_, out_, err_):
+            run_cmdline_test(
+                ["suggest", res_cmp, "instance", "-at", "25", "--scorer", scorer]
+            )
+            assert out_.getvalue().split() == expect
+
+    @pytest.mark.timeout(CLI_TEST_TIMEOUT)
+    def test_cli_suggest_queries_file(self, scratch_path, run_cmdline_test, res_cmp):
+        """Confirm suggest prints results for each query in a file."""
+        q_path = scratch_path / "queries.txt"
+        q_path.write_text("instance\n\nevolve\nzzzzqqq\ninstance\n")
+
+        inv = Inventory(res_cmp)
+        expect = []
+        for name in ["instance", "evolve"]:
+            expect.extend([f"{name}:", *inv.suggest(name, thresh=60)])
+        expect.extend(["zzzzqqq:", "No", "results", "found."])
+
+        with stdio_mgr() as (in_, out_, err_):
+            run_cmdline_test(["suggest", res_cmp, "-q", str(q_path), "-t", "60"])
+            assert out_.getvalue().split() == expect
+
     def test_cli_suggest_many_results_stdin(self, res_cmp, run_cmdline_test):
         """Confirm suggest from stdin doesn't choke on a long list."""
         data = json.dumps(Inventory(res_cmp).json_dict())
@@ -463,6 +507,34 @@ class TestFail:
             run_cmdline_test(["convert", "plain", "-u", "-"], expect=2)
             assert "--url not allowed" in err_.getvalue()
 
+    @pytest.mark.parametrize("args", [[], ["instance", "-q", "queries.txt"]])
+    def test_clifail_suggest_search_or_queries(self, args, res_cmp, run_cmdline_test):
+        """Confirm parser exit without exactly one of a search or queries file."""
+        with stdio_mgr() as (in_, out_, err_):
+            run_cmdline_test(["suggest", res_cmp, *args], expect=2)
+            assert "exactly one of" in err_.getvalue()
+
+    @pytest.mark.parametrize("limit", ["0", "-1", "abc"])
+    def test_clifail_suggest_bad_limit(self, limit, res_cmp, run_cmdline_test):
+        """Confirm parser exit with a limit that is not a positive integer."""
+        with stdio_mgr() as (in_, out_, err_):
+            run_cmdline_test(["suggest", res_cmp, "instance", "-l", limit], expect=2)
+            assert "must be a positive integer" in err_.getvalue()
+
+    def test_clifail_suggest_unknown_scorer(self, res_cmp, run_cmdline_test):
+        """Confirm parser exit with an unknown scorer."""
+        with stdio_mgr() as (in_, out_, err_):
+            run_cmdline_test(
+                ["suggest", res_cmp, "instance", "--scorer", "nope"], expect=2
+            )
+            assert "invalid choice: 'nope'" in err_.getvalue()
+
+    def test_clifail_suggest_queries_missing(self, res_cmp, run_cmdline_test):
+        """Confirm exit code 1 when the queries file cannot be read."""
+        with stdio_mgr() as (in_, out_, err_):
+            run_cmdline_test(["suggest", res_cmp, "-q", "nonexistent.txt"], expect=1)
+            assert "reading queries file" in err_.getvalue()
+
 
 class TestStdio:
     """Tests for the stdin/stdout functionality."""